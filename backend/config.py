@@ -207,7 +207,7 @@ def build_interviewer_system_prompt(
     if required_languages:
         try:
             languages_list = json_module.loads(required_languages) if required_languages else []
-        except:
+        except (ValueError, TypeError):
             pass
 
     # Determine the ACTIVE language for this turn
@@ -272,7 +272,7 @@ def build_interviewer_system_prompt(
                 for i, q in enumerate(custom_questions_list, 1):
                     prompt_parts.append(f"{i}. {q}")
                 prompt_parts.append(f"\nAsk these {len(custom_questions_list)} mandatory questions first, then use remaining time for your own follow-up questions.")
-        except:
+        except (ValueError, TypeError):
             pass
 
     # Evaluation weights (compact)
@@ -287,7 +287,7 @@ def build_interviewer_system_prompt(
                     prompt_parts.append(f"\n\nFocus areas (recruiter priority): {', '.join(high)}")
                 if weights_dict.get("language_proficiency", 0) >= 7:
                     prompt_parts.append("Language proficiency is HIGH PRIORITY — test all required languages thoroughly.")
-        except:
+        except (ValueError, TypeError, AttributeError):
             pass
 
     # Time management (compact)
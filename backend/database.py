@@ -1,44 +1,83 @@
 """Database configuration and session management."""
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 import os
 
+import orjson
+
 # SQLite database file path — use /app/data/ in Docker for volume persistence
 DATA_DIR = os.getenv("DATA_DIR", os.path.dirname(os.path.abspath(__file__)))
 os.makedirs(DATA_DIR, exist_ok=True)
 DATABASE_URL = os.getenv("DATABASE_URL", f"sqlite:///{os.path.join(DATA_DIR, 'database.db')}")
 
+# Connection pool settings - sized for concurrent admin requests + interview websockets
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "40"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "3600"))
+
+engine_kwargs = {
+    "pool_pre_ping": True,
+    "pool_recycle": DB_POOL_RECYCLE,
+    # JSON columns (e.g. interview conversations) are (de)serialized with orjson
+    "json_serializer": lambda value: orjson.dumps(value).decode(),
+    "json_deserializer": orjson.loads,
+}
+if ":memory:" not in DATABASE_URL:
+    # In-memory SQLite uses a singleton/static pool that doesn't take these
+    engine_kwargs["pool_size"] = DB_POOL_SIZE
+    engine_kwargs["max_overflow"] = DB_MAX_OVERFLOW
+
 # Create engine
 engine = create_engine(
     DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {}
+    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {},
+    **engine_kwargs
 )
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+
+def _async_database_url(url: str) -> str:
+    """Map the configured database URL onto its asyncio driver (asyncpg / aiosqlite)."""
+    if url.startswith(("postgresql://", "postgres://")):
+        return "postgresql+asyncpg://" + url.split("://", 1)[1]
+    if url.startswith("postgresql+psycopg2://"):
+        return url.replace("postgresql+psycopg2://", "postgresql+asyncpg://", 1)
+    if url.startswith("sqlite://"):
+        return url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+    return url
+
+
+# Async engine for the long-lived candidate interview handlers, so their DB I/O is
+# awaited instead of blocking the event loop
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL", _async_database_url(DATABASE_URL))
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **engine_kwargs)
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False, autoflush=False)
+
 # Base class for models
 Base = declarative_base()
 
 
 def get_db():
-    """Dependency for getting database session."""
-    db = SessionLocal()
+    """Dependency for getting database session (one per request, always closed)."""
+    # Short-lived request sessions keep attribute values after commit so responses
+    # built from just-written objects don't re-SELECT them
+    db = SessionLocal(expire_on_commit=False)
     try:
         yield db
     finally:
         db.close()
 
 
+async def get_async_db():
+    """Dependency for getting an async database session (one per request, always closed)."""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 def init_db():
     """Initialize database - create all tables."""
     Base.metadata.create_all(bind=engine)
-
-
-
-
-
-
-
-
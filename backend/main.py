@@ -1,12 +1,20 @@
 """FastAPI application for AI Interviewer."""
 import asyncio
 import base64
+import hashlib
 import json
+import orjson
 import sys
 import os
 import logging
+import queue
 import time
 import re
+import subprocess
+import tempfile
+import threading
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 
 # Setup logging
 logging.basicConfig(
@@ -39,15 +47,63 @@ CONCLUSION_PHRASES = [
     "get back to you soon"
 ]
 
+# Keywords showing the interviewer moved the conversation to a language (lowercase)
+LANGUAGE_KEYWORDS = {
+    "French": ("français", "francais", "french", "en français", "continuons en français"),
+    "English": ("english", "anglais", "in english", "let's continue in english"),
+    "Arabic": ("arabic", "arabe", "en arabe", "بالعربية"),
+    "Spanish": ("spanish", "espagnol", "español", "en español"),
+    "German": ("german", "allemand", "deutsch", "auf deutsch"),
+}
+# All keywords in one alternation - a single pass finds every language a text mentions (group name = language)
+LANGUAGE_KEYWORD_RE = re.compile("|".join(
+    f"(?P<{language}>{'|'.join(map(re.escape, keywords))})" for language, keywords in LANGUAGE_KEYWORDS.items()
+))
+
+# Candidate phrases asking to switch language, and the languages they can name (in priority order)
+LANGUAGE_SWITCH_RE = re.compile("|".join(map(re.escape, (
+    "switch to", "switch language", "speak in", "parler en", "parlez", "continue in",
+    "now in", "in english", "in french", "en français", "en anglais", "en arabe",
+    "can we speak", "peut-on parler", "let's speak", "parlons", "change to",
+    "change language", "changer de langue", "autre langue"
+))))
+TARGET_LANGUAGE_RE = re.compile(
+    r"(?P<French>french|français|francais)|(?P<English>english|anglais)|(?P<Arabic>arabic|arabe)|(?P<Spanish>spanish|espagnol)"
+)
+
+
+# Interview topics, marked covered when a question mentions one of their keywords (lowercase)
+TOPIC_KEYWORDS = {
+    "technical_skills": ("technical", "skill", "technology", "programming", "coding", "development"),
+    "experience": ("experience", "worked", "project", "previous", "past", "background"),
+    "education": ("education", "degree", "university", "school", "studied"),
+    "problem_solving": ("problem", "challenge", "solve", "solution", "approach"),
+    "communication": ("communicate", "explain", "present", "team", "collaborate"),
+    "motivation": ("motivation", "interested", "why", "passion", "excited"),
+}
+# Phrases the interviewer uses when it moves the interview to another language
+LLM_LANGUAGE_SWITCH_PHRASES = ("now let's continue in", "maintenant, continuons en", "let's switch to", "changeons de langue")
+
+
+def mentioned_languages(text_lower: str, pattern=LANGUAGE_KEYWORD_RE) -> set:
+    """Languages whose keywords appear in the (lowercased) text."""
+    return {match.lastgroup for match in pattern.finditer(text_lower)}
+
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, UploadFile, File, Form, Depends, Query
 from fastapi.staticfiles import StaticFiles
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.websockets import WebSocketState
+from starlette.background import BackgroundTask
 from pydantic import BaseModel
-from typing import Optional
-from datetime import datetime
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+from urllib.parse import quote
+from datetime import datetime, timezone
 import uvicorn
 import uuid
 
@@ -55,7 +111,10 @@ from backend.config import (
     DEFAULT_VOICE_ID,
     TTS_PROVIDERS, STT_PROVIDERS, LLM_PROVIDERS,
     DEFAULT_TTS_PROVIDER, DEFAULT_STT_PROVIDER, DEFAULT_LLM_PROVIDER,
-    INTERVIEW_TIME_LIMIT_MINUTES
+    TTS_MODEL, STT_MODEL, LLM_MODEL,
+    INTERVIEW_TIME_LIMIT_MINUTES,
+    OPENAI_API_KEY, OPENAI_REALTIME_MODEL, OPENAI_REALTIME_VOICE,
+    build_interviewer_system_prompt
 )
 from backend.models.conversation import ConversationManager
 from backend.models.job_offer import (
@@ -64,18 +123,27 @@ from backend.models.job_offer import (
 )
 from backend.services.cv_parser import parse_pdf, validate_pdf
 from backend.services.language_evaluator import evaluate_cv_fit
-from backend.services.storage import upload_file as s3_upload, download_file as s3_download, is_s3_enabled
-from backend.database import init_db, get_db
+from backend.services.storage import upload_file as s3_upload, download_file as s3_download
+from backend.services.cache import cache_get, cache_set, cache_delete
+from backend.services.session_log import (
+    start_log as session_log_start,
+    append_events as session_log_append,
+    read_audio_segments as session_log_segments,
+    read_conversation as session_log_conversation
+)
+from backend.database import init_db, get_db, get_async_db, SessionLocal, AsyncSessionLocal
 from backend.models.db_models import (
     JobOffer as DBJobOffer,
     Candidate as DBCandidate,
     Application as DBApplication,
     CVEvaluation as DBCVEvaluation,
     Interview as DBInterview,
-    Admin as DBAdmin
+    Admin as DBAdmin,
+    generate_id
 )
-from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_, func
+from sqlalchemy.orm import Session, selectinload, raiseload, defer
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import or_, and_, func, case, update, select
 from backend.auth import (
     verify_password,
     get_password_hash,
@@ -86,18 +154,24 @@ from backend.auth import (
 from datetime import timedelta
 
 # Import all service modules
-from backend.services.elevenlabs_tts import text_to_speech as elevenlabs_tts
+from backend.services.elevenlabs_tts import text_to_speech as elevenlabs_tts, text_to_speech_stream as elevenlabs_tts_stream
 from backend.services.elevenlabs_stt import speech_to_text as elevenlabs_stt
 from backend.services.elevenlabs_stt_streaming import ElevenLabsSTTStreaming
 from backend.services.language_llm_openai import (
     generate_response as llm_generate_response,
+    generate_response_stream as llm_generate_response_stream,
     generate_opening_greeting as llm_generate_opening_greeting,
     generate_assessment as llm_generate_assessment,
+    generate_assessments_batch as llm_generate_assessments_batch,
     generate_audio_check_message as llm_generate_audio_check,
-    generate_name_request_message as llm_generate_name_request
+    generate_name_request_message as llm_generate_name_request,
+    generate_transcript_annotations as llm_generate_transcript_annotations,
+    clean_response as llm_clean_response
 )
+from backend.services.openai_llm import generate_assessment as openai_generate_assessment
 
-app = FastAPI(title="AI Interviewer API")
+# orjson encodes datetimes natively - endpoints return raw datetime values
+app = FastAPI(title="AI Interviewer API", default_response_class=ORJSONResponse)
 
 # Initialize database on startup
 @app.on_event("startup")
@@ -108,6 +182,10 @@ async def startup_event():
         logger.info("✅ Database initialized successfully")
     except Exception as e:
         logger.warning(f"⚠️ Database initialization warning: {e} (continuing with in-memory storage)")
+    global assessment_sweep_task
+    if ASSESSMENT_SWEEP_INTERVAL > 0:
+        # Keep a reference - the event loop only holds tasks weakly
+        assessment_sweep_task = asyncio.create_task(_assessment_sweep_loop())
 
 # Enable CORS for frontend
 app.add_middleware(
@@ -118,8 +196,8 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Store active conversations (in production, use Redis or database)
-active_conversations: dict = {}
+# Store active WebSocket sessions (conversation_id -> SessionState; in production, use Redis or database)
+sessions: dict = {}
 
 # Language name → ISO 639-1 code mapping for STT
 LANGUAGE_TO_ISO = {
@@ -149,43 +227,47 @@ VIDEOS_DIR = os.path.join(UPLOADS_DIR, "videos")
 CVS_DIR = os.path.join(UPLOADS_DIR, "cvs")
 os.makedirs(VIDEOS_DIR, exist_ok=True)
 os.makedirs(CVS_DIR, exist_ok=True)
+# Async interview session logs live outside the publicly mounted uploads directory
+SESSIONS_DIR = os.path.join(_data_dir, "sessions")
+os.makedirs(SESSIONS_DIR, exist_ok=True)
 
 # Mount uploads directory for static file serving
 app.mount("/uploads", StaticFiles(directory=UPLOADS_DIR), name="uploads")
-# Store session configurations
-session_configs: dict = {}
-# Store active streaming STT sessions
-streaming_stt_sessions: dict = {}
-# Store interview start times for time limit tracking
-interview_start_times: dict = {}
 # Store CV evaluations (in production, use database)
 cv_evaluations: dict = {}
 # Store candidate applications (in production, use database)
 candidate_applications: dict = {}
-# Store last processed message hashes to prevent duplicates (conversation_id -> {hash: timestamp})
-message_dedup_cache: dict = {}
+# Async interview question audio being synthesized sentence-by-sentence ((interview_id, question_number) -> QuestionAudioJob)
+async_question_audio_jobs: dict = {}
 # Deduplication window in seconds
 MESSAGE_DEDUP_WINDOW = 5.0
 
+# Interview assessments (a multi-second LLM call each) run on a bounded worker pool, so
+# interviews ending together are assessed concurrently without an unbounded burst of LLM requests
+ASSESSMENT_MAX_CONCURRENCY = int(os.getenv("ASSESSMENT_MAX_CONCURRENCY", "4"))
+assessment_executor = ThreadPoolExecutor(max_workers=ASSESSMENT_MAX_CONCURRENCY, thread_name_prefix="assessment")
+
+
+def _utc_now() -> datetime:
+    """Current UTC time, naive to match the DateTime columns (datetime.utcnow() is deprecated)."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
 
-def get_audio_hash(audio_bytes: bytes) -> str:
+def get_audio_hash(audio_bytes: bytes) -> int:
     """Generate a simple hash for audio data to detect duplicates."""
-    import hashlib
-    # Use first 1000 bytes for faster hashing while still being unique enough
-    sample = audio_bytes[:1000] if len(audio_bytes) > 1000 else audio_bytes
-    return hashlib.md5(sample + str(len(audio_bytes)).encode()).hexdigest()
+    # First 1000 bytes plus the length are unique enough; the builtin hash skips md5's
+    # digest/hex encoding and the concatenated copy (keys only live in this process)
+    return hash((len(audio_bytes), audio_bytes[:1000]))
 
 
 def is_duplicate_message(conversation_id: str, audio_bytes: bytes) -> bool:
     """Check if this audio message is a duplicate within the dedup window."""
+    state = sessions.get(conversation_id)
+    if state is None:
+        return False
     audio_hash = get_audio_hash(audio_bytes)
     current_time = time.time()
-    
-    # Initialize cache for conversation if not exists
-    if conversation_id not in message_dedup_cache:
-        message_dedup_cache[conversation_id] = {}
-    
-    cache = message_dedup_cache[conversation_id]
+    cache = state.dedup
     
     # Clean up old entries
     old_hashes = [h for h, t in cache.items() if current_time - t > MESSAGE_DEDUP_WINDOW]
@@ -202,10 +284,53 @@ def is_duplicate_message(conversation_id: str, audio_bytes: bytes) -> bool:
     return False
 
 
-def cleanup_dedup_cache(conversation_id: str):
-    """Clean up dedup cache when conversation ends."""
-    if conversation_id in message_dedup_cache:
-        del message_dedup_cache[conversation_id]
+def release_conversation_state(conversation_id: str):
+    """Drop all per-conversation WebSocket state (conversation, config, start time, dedup hashes)."""
+    sessions.pop(conversation_id, None)
+
+
+@lru_cache(maxsize=64)
+def _parse_structured_assessment(assessment_text: str) -> Optional[dict]:
+    """Parse a structured (JSON) assessment once for both extractors - None for plain-text assessments.
+
+    The result is shared between callers and must not be mutated.
+    """
+    try:
+        parsed = orjson.loads(assessment_text)
+    except (orjson.JSONDecodeError, TypeError):
+        return None
+    return parsed if isinstance(parsed, dict) else None
+
+
+# Neutral closing message shown to the candidate (assessment details stay HR-only)
+INTERVIEW_COMPLETED_MESSAGE = """**Interview Completed**
+
+Thank you for your time! Our HR team will review your application and get back to you soon.
+
+We appreciate your interest in this position."""
+# Pre-encoded once; sent as a text frame because binary frames carry audio
+TIME_LIMIT_ASSESSMENT_PAYLOAD = orjson.dumps({
+    "type": "assessment",
+    "assessment": INTERVIEW_COMPLETED_MESSAGE,
+    "time_limit_reached": True
+}).decode()
+# Recurring WebSocket error envelopes, pre-encoded like the payload above
+ERR_TTS_SERVICE = orjson.dumps({"type": "error", "message": "Text-to-speech service error. Please try again or switch to a different TTS provider."}).decode()
+ERR_CONVERSATION_NOT_FOUND = orjson.dumps({"type": "error", "message": "Conversation not found"}).decode()
+ERR_AUDIO_TOO_SHORT = orjson.dumps({"type": "error", "message": "Audio chunk too short or unrecognized. Please speak again."}).decode()
+ERR_NO_SPEECH = orjson.dumps({"type": "error", "message": "No speech detected"}).decode()
+
+
+# Legacy plain-text score patterns (matched against the lowercased assessment)
+SCORE_PATTERNS = {
+    "technical_skills": re.compile(r"(?:technical\s+skills?|technical)\s*[:\-]?\s*(\d+(?:\.\d+)?)/10"),
+    "job_fit": re.compile(r"(?:job\s+fit|fit)\s*[:\-]?\s*(\d+(?:\.\d+)?)/10"),
+    "communication": re.compile(r"(?:communication\s+skills?|communication)\s*[:\-]?\s*(\d+(?:\.\d+)?)/10"),
+    "problem_solving": re.compile(r"(?:problem[-\s]?solving|problem\s+solving)\s*[:\-]?\s*(\d+(?:\.\d+)?)/10"),
+    "cv_consistency": re.compile(r"(?:cv\s+consistency|cv\s+vs|cv)\s*[:\-]?\s*(\d+(?:\.\d+)?)/10"),
+    "overall_score": re.compile(r"(?:overall\s+score|overall|mean)\s*[:\-]?\s*(\d+(?:\.\d+)?)/10"),
+}
+LANGUAGE_SCORE_RE = re.compile(r"(\w+)\s*(?:language|proficiency|fluency)\s*[:\-]?\s*(\d+(?:\.\d+)?)/10")
 
 
 def extract_detailed_scores(assessment_text: str) -> dict:
@@ -216,8 +341,8 @@ def extract_detailed_scores(assessment_text: str) -> dict:
     """
     # Try parsing as structured JSON first (new format)
     try:
-        parsed = json.loads(assessment_text)
-        if isinstance(parsed, dict) and "scores" in parsed:
+        parsed = _parse_structured_assessment(assessment_text)
+        if parsed is not None and "scores" in parsed:
             scores_data = parsed["scores"]
             result = {
                 "technical_skills": scores_data.get("technical_skills", {}).get("score"),
@@ -232,7 +357,8 @@ def extract_detailed_scores(assessment_text: str) -> dict:
                 if isinstance(lp, dict) and "language" in lp and "score" in lp:
                     result["linguistic_capacity"][lp["language"]] = lp["score"]
             return result
-    except (json.JSONDecodeError, TypeError, AttributeError):
+    except (AttributeError, TypeError):
+        # Malformed structure (e.g. a null field) - fall back to the plain-text patterns
         pass
 
     # Fallback: regex extraction from plain-text assessment (legacy)
@@ -241,24 +367,15 @@ def extract_detailed_scores(assessment_text: str) -> dict:
         "problem_solving": None, "cv_consistency": None,
         "linguistic_capacity": {}, "overall_score": None,
     }
-    patterns = {
-        "technical_skills": r"(?:technical\s+skills?|technical)\s*[:\-]?\s*(\d+(?:\.\d+)?)/10",
-        "job_fit": r"(?:job\s+fit|fit)\s*[:\-]?\s*(\d+(?:\.\d+)?)/10",
-        "communication": r"(?:communication\s+skills?|communication)\s*[:\-]?\s*(\d+(?:\.\d+)?)/10",
-        "problem_solving": r"(?:problem[-\s]?solving|problem\s+solving)\s*[:\-]?\s*(\d+(?:\.\d+)?)/10",
-        "cv_consistency": r"(?:cv\s+consistency|cv\s+vs|cv)\s*[:\-]?\s*(\d+(?:\.\d+)?)/10",
-        "overall_score": r"(?:overall\s+score|overall|mean)\s*[:\-]?\s*(\d+(?:\.\d+)?)/10",
-    }
     assessment_lower = assessment_text.lower()
-    for key, pattern in patterns.items():
-        match = re.search(pattern, assessment_lower, re.IGNORECASE)
+    for key, pattern in SCORE_PATTERNS.items():
+        match = pattern.search(assessment_lower)
         if match:
             try:
                 scores[key] = float(match.group(1))
             except Exception:
                 pass
-    language_pattern = r"(\w+)\s*(?:language|proficiency|fluency)\s*[:\-]?\s*(\d+(?:\.\d+)?)/10"
-    for match in re.finditer(language_pattern, assessment_lower, re.IGNORECASE):
+    for match in LANGUAGE_SCORE_RE.finditer(assessment_lower):
         language = match.group(1).capitalize()
         try:
             scores["linguistic_capacity"][language] = float(match.group(2))
@@ -271,21 +388,27 @@ def extract_detailed_scores(assessment_text: str) -> dict:
     return scores
 
 
+# Language assessments end with a fixed verdict line - the recommendation is read from it directly
+LANGUAGE_VERDICT_RE = re.compile(r"\*\*Language Requirements Met:\*\*\s*\[?(YES|NO|PARTIAL)\b", re.IGNORECASE)
+LANGUAGE_VERDICT_RECOMMENDATIONS = {"yes": "recommended", "no": "not_recommended", "partial": None}
+
+
 def extract_recommendation(assessment_text: str) -> Optional[str]:
     """Extract recommendation from assessment text.
 
-    Handles both new structured JSON and legacy plain-text formats.
+    Handles the language report verdict line, structured JSON and legacy plain-text formats.
     Returns: 'recommended', 'not_recommended', or None.
     """
-    # Try JSON format first
-    try:
-        parsed = json.loads(assessment_text)
-        if isinstance(parsed, dict) and "recommendation" in parsed:
-            rec = parsed["recommendation"]
-            if rec in ("recommended", "not_recommended", "maybe"):
-                return rec if rec != "maybe" else None
-    except (json.JSONDecodeError, TypeError):
-        pass
+    verdict = LANGUAGE_VERDICT_RE.search(assessment_text)
+    if verdict:
+        return LANGUAGE_VERDICT_RECOMMENDATIONS[verdict.group(1).lower()]
+
+    # Try JSON format
+    parsed = _parse_structured_assessment(assessment_text)
+    if parsed is not None and "recommendation" in parsed:
+        rec = parsed["recommendation"]
+        if rec in ("recommended", "not_recommended", "maybe"):
+            return rec if rec != "maybe" else None
 
     # Fallback: keyword matching (legacy)
     assessment_lower = assessment_text.lower()
@@ -313,6 +436,11 @@ def get_tts_function(provider: str = "elevenlabs"):
     return elevenlabs_tts
 
 
+def get_tts_stream_function(provider: str = "elevenlabs"):
+    """Get the streaming TTS function (yields MP3 chunks)."""
+    return elevenlabs_tts_stream
+
+
 def get_stt_function(provider: str = "elevenlabs"):
     """Get the STT function."""
     return elevenlabs_stt
@@ -345,15 +473,78 @@ def _retry_on_quota(func, *args, max_retries=3, **kwargs):
     raise RuntimeError("Unreachable")
 
 
+# Every provider resolves to the OpenAI functions, which share one module-level client
+LLM_FUNCTIONS = {
+    "generate_response": llm_generate_response,
+    "generate_response_stream": llm_generate_response_stream,
+    "generate_opening_greeting": llm_generate_opening_greeting,
+    "generate_assessment": llm_generate_assessment,
+    "generate_audio_check": llm_generate_audio_check,
+    "generate_name_request": llm_generate_name_request
+}
+
+
 def get_llm_functions(provider: str = "openai"):
     """Get the LLM functions (OpenAI)."""
-    return {
-        "generate_response": llm_generate_response,
-        "generate_opening_greeting": llm_generate_opening_greeting,
-        "generate_assessment": llm_generate_assessment,
-        "generate_audio_check": llm_generate_audio_check,
-        "generate_name_request": llm_generate_name_request
-    }
+    return LLM_FUNCTIONS
+
+
+@dataclass(slots=True)
+class SessionRuntime:
+    """A session's providers, models and function handles, resolved once from its config."""
+    stt_provider: str
+    stt_model: str
+    stt_func: Callable
+    tts_provider: str
+    tts_model: Optional[str]
+    tts_func: Callable
+    voice_id: str
+    llm_provider: str
+    llm_model: str
+    llm_funcs: dict
+    interview_time_limit: float
+
+    @classmethod
+    def from_config(cls, config: dict) -> "SessionRuntime":
+        stt_provider = config.get("stt_provider", DEFAULT_STT_PROVIDER)
+        tts_provider = config.get("tts_provider", DEFAULT_TTS_PROVIDER)
+        llm_provider = config.get("llm_provider", DEFAULT_LLM_PROVIDER)
+        return cls(
+            stt_provider=stt_provider,
+            stt_model=config.get("stt_model", STT_MODEL),
+            stt_func=get_stt_function(stt_provider),
+            tts_provider=tts_provider,
+            tts_model=config.get("tts_model"),
+            tts_func=get_tts_function(tts_provider),
+            voice_id=get_voice_id(tts_provider),
+            llm_provider=llm_provider,
+            llm_model=config.get("llm_model", LLM_MODEL),
+            llm_funcs=get_llm_functions(llm_provider),
+            interview_time_limit=config.get("interview_duration_minutes", INTERVIEW_TIME_LIMIT_MINUTES)
+        )
+
+
+@dataclass(slots=True)
+class SessionState:
+    """Everything kept for one live WebSocket conversation, released with a single pop."""
+    conversation: ConversationManager
+    config: dict
+    runtime: SessionRuntime
+    started_at: float  # time.time() at session start, for the time limit
+    dedup: dict = field(default_factory=dict)  # {audio hash: timestamp} of recent audio messages
+    stt_session: Optional[dict] = None  # Streaming STT session of the utterance in progress
+
+
+def session_config(conversation_id: str) -> dict:
+    """The session's config, or an empty dict if the session is gone."""
+    state = sessions.get(conversation_id)
+    return state.config if state else {}
+
+
+def get_session_runtime(conversation_id: str, config: dict) -> SessionRuntime:
+    """The session's SessionRuntime, or one resolved on the spot if the session has none stored."""
+    state = sessions.get(conversation_id)
+    return state.runtime if state else SessionRuntime.from_config(config)
 
 
 async def handle_precheck_response(
@@ -370,6 +561,7 @@ async def handle_precheck_response(
     Returns:
         True if we should continue processing (phase transitioned), False if handled here
     """
+    rt = get_session_runtime(conversation_id, config)
     phase = conversation.get_current_phase()
     
     if phase == ConversationManager.PHASE_AUDIO_CHECK:
@@ -379,16 +571,16 @@ async def handle_precheck_response(
         
         # Generate name request message
         interview_start_language = conversation.interview_start_language if conversation.interview_start_language else None
-        name_request_text = llm_funcs["generate_name_request"](model_id=config["llm_model"], language=interview_start_language)
+        name_request_text = llm_funcs["generate_name_request"](model_id=rt.llm_model, language=interview_start_language)
         conversation.add_message("interviewer", name_request_text)
         
         # Convert to speech
-        tts_func = get_tts_function(config.get("tts_provider", DEFAULT_TTS_PROVIDER))
-        voice_id = get_voice_id(config.get("tts_provider", DEFAULT_TTS_PROVIDER))
-        tts_model = config.get("tts_model")
+        tts_func = rt.tts_func
+        voice_id = rt.voice_id
+        tts_model = rt.tts_model
         
         try:
-            if config.get("tts_provider") == "cartesia":
+            if rt.tts_provider == "cartesia":
                 audio_bytes = tts_func(name_request_text, voice_id, tts_model)
                 audio_format = "wav"
             else:  # elevenlabs
@@ -406,22 +598,20 @@ async def handle_precheck_response(
         except Exception as e:
             error_msg = f"TTS service error: {str(e)}"
             logger.error(f"❌ TTS Error: {error_msg}")
-            await websocket.send_json({
-                "type": "error",
-                "message": "Text-to-speech service error. Please try again or switch to a different TTS provider."
-            })
+            await websocket.send_text(ERR_TTS_SERVICE)
             return False
         
-        audio_base64 = base64.b64encode(audio_bytes).decode('utf-8')
-        
+        # Metadata first, then the audio itself as a binary frame (audio_len announces it)
         await websocket.send_json({
             "type": "response",
             "user_text": user_text,
             "interviewer_text": name_request_text,
-            "audio": audio_base64,
+            "audio_len": len(audio_bytes),
             "audio_format": audio_format,
             "phase": conversation.get_current_phase()
         })
+        if audio_bytes:
+            await websocket.send_bytes(audio_bytes)
         return False  # Handled, don't continue normal processing
     
     elif phase == ConversationManager.PHASE_NAME_CHECK:
@@ -471,8 +661,9 @@ async def handle_precheck_response(
         
         # Store confirmed candidate name in session config for database storage
         confirmed_name = conversation.get_confirmed_name()
-        if conversation_id and conversation_id in session_configs and confirmed_name:
-            session_configs[conversation_id]["candidate_name"] = confirmed_name
+        state = sessions.get(conversation_id) if conversation_id else None
+        if state and confirmed_name:
+            state.config["candidate_name"] = confirmed_name
         
         # Move to actual interview phase
         conversation.set_phase(ConversationManager.PHASE_INTERVIEW)
@@ -480,19 +671,19 @@ async def handle_precheck_response(
         # Generate actual interview greeting (starting with full time limit)
         interview_context = conversation.get_interview_context(time_remaining_minutes=INTERVIEW_TIME_LIMIT_MINUTES, total_interview_minutes=INTERVIEW_TIME_LIMIT_MINUTES)
         greeting_text = llm_funcs["generate_opening_greeting"](
-            model_id=config["llm_model"],
+            model_id=rt.llm_model,
             interview_context=interview_context,
             candidate_name=conversation.get_candidate_name()
         )
         conversation.add_message("interviewer", greeting_text)
         
         # Convert to speech
-        tts_func = get_tts_function(config.get("tts_provider", DEFAULT_TTS_PROVIDER))
-        voice_id = get_voice_id(config.get("tts_provider", DEFAULT_TTS_PROVIDER))
-        tts_model = config.get("tts_model")
+        tts_func = rt.tts_func
+        voice_id = rt.voice_id
+        tts_model = rt.tts_model
         
         try:
-            if config.get("tts_provider") == "cartesia":
+            if rt.tts_provider == "cartesia":
                 audio_bytes = tts_func(greeting_text, voice_id, tts_model)
                 audio_format = "wav"
             else:  # elevenlabs
@@ -510,23 +701,21 @@ async def handle_precheck_response(
         except Exception as e:
             error_msg = f"TTS service error: {str(e)}"
             logger.error(f"❌ TTS Error: {error_msg}")
-            await websocket.send_json({
-                "type": "error",
-                "message": "Text-to-speech service error. Please try again or switch to a different TTS provider."
-            })
+            await websocket.send_text(ERR_TTS_SERVICE)
             return False
         
-        audio_base64 = base64.b64encode(audio_bytes).decode('utf-8')
-        
+        # Metadata first, then the audio itself as a binary frame (audio_len announces it)
         await websocket.send_json({
             "type": "response",
             "user_text": user_text,
             "interviewer_text": greeting_text,
-            "audio": audio_base64,
+            "audio_len": len(audio_bytes),
             "audio_format": audio_format,
             "phase": conversation.get_current_phase(),
             "candidate_name": candidate_name
         })
+        if audio_bytes:
+            await websocket.send_bytes(audio_bytes)
         return False  # Handled, don't continue normal processing
     
     # Not in pre-check phase, continue normal processing
@@ -639,7 +828,8 @@ async def upload_cv(
     file: UploadFile = File(...),
     job_offer_id: str = Form(...),
     llm_provider: Optional[str] = Form(None),
-    llm_model: Optional[str] = Form(None)
+    llm_model: Optional[str] = Form(None),
+    db: Session = Depends(get_db)
 ):
     """
     Upload and evaluate a CV against a job offer.
@@ -759,7 +949,6 @@ async def get_parsed_cv_text(evaluation_id: str):
 
 def _run_cv_evaluation_background(application_id: str, cv_text: str, job_description: str, required_languages: str, job_offer_id: str):
     """Run CV evaluation in a background thread and update the database."""
-    from backend.database import SessionLocal
     try:
         logger.info(f"Background CV evaluation started for {application_id}")
         evaluation_result = evaluate_cv_fit(
@@ -869,7 +1058,7 @@ async def submit_application(
             if cover_letter_filename.lower().endswith('.pdf'):
                 try:
                     cover_letter_text = parse_pdf(cover_letter_content)
-                except:
+                except ValueError:
                     cover_letter_text = ""
 
         # Get or create candidate
@@ -895,17 +1084,20 @@ async def submit_application(
             cv_text=cv_text,
             cv_filename=cv_file.filename,
             cv_file_path=cv_relative_path,
+            candidate_name=candidate.full_name,
+            candidate_email=candidate.email,
+            job_title=job_offer.title,
             ai_status="processing",
             ai_reasoning="CV evaluation in progress...",
             hr_status="pending"
         )
         db.add(application)
         db.commit()
+        await _invalidate_admin_caches()
 
         logger.info(f"Application submitted: {application_id} for {job_offer.title} by {full_name}")
 
         # Run CV evaluation in the background
-        import threading
         eval_thread = threading.Thread(
             target=_run_cv_evaluation_background,
             args=(application_id, cv_text, job_offer.get_full_description(), db_job_offer.required_languages, job_offer_id),
@@ -974,9 +1166,6 @@ class JobOfferUpdate(BaseModel):
 @app.post("/api/admin/job-offers")
 async def create_job_offer_endpoint(offer: JobOfferCreate, db: Session = Depends(get_db), current_admin: DBAdmin = Depends(get_current_admin)):
     """Create a new job offer (admin)."""
-    if db is None:
-        db = next(get_db())
-    
     db_job_offer = DBJobOffer(
         title=offer.title,
         description=offer.description,
@@ -992,6 +1181,7 @@ async def create_job_offer_endpoint(offer: JobOfferCreate, db: Session = Depends
     )
     db.add(db_job_offer)
     db.commit()
+    await _invalidate_admin_caches()
     db.refresh(db_job_offer)
     
     logger.info(f"📝 Created job offer: {db_job_offer.offer_id} - {db_job_offer.title} (duration: {db_job_offer.interview_duration_minutes} min)")
@@ -1009,17 +1199,14 @@ async def create_job_offer_endpoint(offer: JobOfferCreate, db: Session = Depends
         "custom_questions": db_job_offer.custom_questions,
         "evaluation_weights": db_job_offer.evaluation_weights,
         "interview_mode": db_job_offer.interview_mode,
-        "created_at": db_job_offer.created_at.isoformat() if db_job_offer.created_at else None,
-        "updated_at": db_job_offer.updated_at.isoformat() if db_job_offer.updated_at else None
+        "created_at": db_job_offer.created_at,
+        "updated_at": db_job_offer.updated_at
     }
 
 
 @app.get("/api/admin/job-offers")
 async def list_job_offers(db: Session = Depends(get_db), current_admin: DBAdmin = Depends(get_current_admin)):
     """List all job offers."""
-    if db is None:
-        db = next(get_db())
-    
     offers = db.query(DBJobOffer).order_by(DBJobOffer.created_at.desc()).all()
     
     return [
@@ -1036,8 +1223,8 @@ async def list_job_offers(db: Session = Depends(get_db), current_admin: DBAdmin
             "custom_questions": offer.custom_questions or "",
             "evaluation_weights": offer.evaluation_weights or "",
             "interview_mode": offer.interview_mode or "realtime",
-            "created_at": offer.created_at.isoformat() if offer.created_at else None,
-            "updated_at": offer.updated_at.isoformat() if offer.updated_at else None
+            "created_at": offer.created_at,
+            "updated_at": offer.updated_at
         }
         for offer in offers
     ]
@@ -1046,9 +1233,6 @@ async def list_job_offers(db: Session = Depends(get_db), current_admin: DBAdmin
 @app.get("/api/admin/job-offers/{offer_id}")
 async def get_job_offer_endpoint(offer_id: str, db: Session = Depends(get_db), current_admin: DBAdmin = Depends(get_current_admin)):
     """Get a specific job offer."""
-    if db is None:
-        db = next(get_db())
-    
     offer = db.query(DBJobOffer).filter(DBJobOffer.offer_id == offer_id).first()
     if not offer:
         raise HTTPException(status_code=404, detail="Job offer not found")
@@ -1066,17 +1250,14 @@ async def get_job_offer_endpoint(offer_id: str, db: Session = Depends(get_db), c
         "custom_questions": offer.custom_questions or "",
         "evaluation_weights": offer.evaluation_weights or "",
         "interview_mode": offer.interview_mode or "realtime",
-        "created_at": offer.created_at.isoformat() if offer.created_at else None,
-        "updated_at": offer.updated_at.isoformat() if offer.updated_at else None
+        "created_at": offer.created_at,
+        "updated_at": offer.updated_at
     }
 
 
 @app.put("/api/admin/job-offers/{offer_id}")
 async def update_job_offer_endpoint(offer_id: str, offer_update: JobOfferUpdate, db: Session = Depends(get_db), current_admin: DBAdmin = Depends(get_current_admin)):
     """Update a job offer."""
-    if db is None:
-        db = next(get_db())
-    
     offer = db.query(DBJobOffer).filter(DBJobOffer.offer_id == offer_id).first()
     if not offer:
         raise HTTPException(status_code=404, detail="Job offer not found")
@@ -1084,6 +1265,10 @@ async def update_job_offer_endpoint(offer_id: str, offer_update: JobOfferUpdate,
     update_data = offer_update.dict(exclude_unset=True)
     if "title" in update_data:
         offer.title = update_data["title"]
+        # Keep the title copied onto applications (admin search) in sync
+        db.query(DBApplication).filter(DBApplication.job_offer_id == offer_id).update(
+            {DBApplication.job_title: offer.title}, synchronize_session=False
+        )
     if "description" in update_data:
         offer.description = update_data["description"]
     if "required_skills" in update_data:
@@ -1106,8 +1291,8 @@ async def update_job_offer_endpoint(offer_id: str, offer_update: JobOfferUpdate,
         offer.interview_mode = update_data["interview_mode"]
     
     offer.updated_at = datetime.now()
-    db.commit()
-    db.refresh(offer)
+    db.commit()  # Request sessions don't expire on commit - no refresh round-trip needed
+    await _invalidate_admin_caches()
     
     logger.info(f"📝 Updated job offer: {offer_id}")
     
@@ -1124,23 +1309,21 @@ async def update_job_offer_endpoint(offer_id: str, offer_update: JobOfferUpdate,
         "custom_questions": offer.custom_questions or "",
         "evaluation_weights": offer.evaluation_weights or "",
         "interview_mode": offer.interview_mode or "realtime",
-        "created_at": offer.created_at.isoformat() if offer.created_at else None,
-        "updated_at": offer.updated_at.isoformat() if offer.updated_at else None
+        "created_at": offer.created_at,
+        "updated_at": offer.updated_at
     }
 
 
 @app.delete("/api/admin/job-offers/{offer_id}")
 async def delete_job_offer_endpoint(offer_id: str, db: Session = Depends(get_db), current_admin: DBAdmin = Depends(get_current_admin)):
     """Delete a job offer."""
-    if db is None:
-        db = next(get_db())
-    
     offer = db.query(DBJobOffer).filter(DBJobOffer.offer_id == offer_id).first()
     if not offer:
         raise HTTPException(status_code=404, detail="Job offer not found")
     
     db.delete(offer)
     db.commit()
+    await _invalidate_admin_caches()
     
     logger.info(f"🗑️ Deleted job offer: {offer_id}")
     return {"message": "Job offer deleted successfully"}
@@ -1149,9 +1332,6 @@ async def delete_job_offer_endpoint(offer_id: str, db: Session = Depends(get_db)
 @app.get("/api/job-offers")
 async def get_public_job_offers(db: Session = Depends(get_db)):
     """Get all job offers (public endpoint for candidate selection)."""
-    if db is None:
-        db = next(get_db())
-    
     offers = db.query(DBJobOffer).order_by(DBJobOffer.created_at.desc()).all()
     
     return [
@@ -1162,13 +1342,216 @@ async def get_public_job_offers(db: Session = Depends(get_db)):
             "required_skills": offer.required_skills,
             "experience_level": offer.experience_level,
             "education_requirements": offer.education_requirements,
-            "created_at": offer.created_at.isoformat() if offer.created_at else None,
-            "updated_at": offer.updated_at.isoformat() if offer.updated_at else None
+            "created_at": offer.created_at,
+            "updated_at": offer.updated_at
         }
         for offer in offers
     ]
 
 
+# ============================================================
+# Admin Endpoints - Search and Filter
+# ============================================================
+
+# Admin search results are cached per query for a short time. Writes can't enumerate every
+# cached query, so they bump a version that is part of every search cache key instead
+SEARCH_CACHE_TTL = 30
+SEARCH_CACHE_VERSION_KEY = "search:version"
+SEARCH_CACHE_VERSION_TTL = 86400
+
+# Search endpoints return one page at a time
+SEARCH_PAGE_SIZE = 50
+SEARCH_MAX_PAGE_SIZE = 200
+
+
+async def _invalidate_admin_caches():
+    """Drop cached admin reads (dashboard stats, search results) after a write."""
+    await cache_delete(DASHBOARD_STATS_CACHE_KEY)
+    await cache_set(SEARCH_CACHE_VERSION_KEY, uuid.uuid4().hex.encode(), SEARCH_CACHE_VERSION_TTL)
+
+
+# Escape character for the substring search patterns below
+LIKE_ESCAPE = "\\"
+
+
+def _contains_pattern(term: str) -> str:
+    """ILIKE pattern matching term anywhere - LIKE wildcards typed by the user match literally.
+
+    Built once per request and bound as a parameter; substring ILIKE on PostgreSQL is served
+    by the pg_trgm indexes on the searched columns.
+    """
+    escaped = term.replace(LIKE_ESCAPE, LIKE_ESCAPE * 2).replace("%", LIKE_ESCAPE + "%").replace("_", LIKE_ESCAPE + "_")
+    return f"%{escaped}%"
+
+
+async def _search_cache_key(kind: str, *params) -> str:
+    version = await cache_get(SEARCH_CACHE_VERSION_KEY) or b"0"
+    return f"search:{version.decode()}:{kind}:{orjson.dumps(params).decode()}"
+
+
+# The search routes are registered before /{application_id} and /{candidate_email},
+# which would otherwise match "search" as an id
+@app.get("/api/admin/applications/search")
+async def search_applications(
+    q: Optional[str] = Query(None),
+    job_offer_id: Optional[str] = Query(None),
+    ai_status: Optional[str] = Query(None),
+    hr_status: Optional[str] = Query(None),
+    limit: int = Query(SEARCH_PAGE_SIZE, ge=1, le=SEARCH_MAX_PAGE_SIZE, description="Page size"),
+    offset: int = Query(0, ge=0, description="Number of results to skip"),
+    after_submitted_at: Optional[datetime] = Query(None, description="Keyset cursor - submitted_at of the last application already shown (use instead of offset for deep pages)"),
+    after_application_id: Optional[str] = Query(None, description="Keyset cursor - application_id of the last application already shown (breaks submitted_at ties)"),
+    current_admin: DBAdmin = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Search and filter applications.
+    Combines all filter options. Results are paginated (newest first); count is the total number of
+    matches regardless of the page or cursor, and next_cursor holds the cursor for the following page.
+    """
+    
+    cache_key = await _search_cache_key("applications", q, job_offer_id, ai_status, hr_status, limit, offset, after_submitted_at, after_application_id)
+    cached = await cache_get(cache_key)
+    if cached:
+        return Response(content=cached, media_type="application/json")
+    
+    # Candidate name/email and job title are denormalized onto applications - single-table query, no joins.
+    # Runs on the async session so a slow search doesn't stall the event loop (and the interview WebSockets)
+    query = select(
+        DBApplication.application_id,
+        DBApplication.candidate_name,
+        DBApplication.candidate_email,
+        DBApplication.job_title,
+        DBApplication.ai_status,
+        DBApplication.hr_status,
+        DBApplication.submitted_at
+    )
+    
+    # Apply filters
+    if job_offer_id:
+        query = query.where(DBApplication.job_offer_id == job_offer_id)
+    if ai_status:
+        query = query.where(DBApplication.ai_status == ai_status)
+    if hr_status:
+        query = query.where(DBApplication.hr_status == hr_status)
+    if q:
+        # Search in candidate name, email, or cover letter
+        pattern = _contains_pattern(q)
+        search_filter = or_(
+            DBApplication.candidate_name.ilike(pattern, escape=LIKE_ESCAPE),
+            DBApplication.candidate_email.ilike(pattern, escape=LIKE_ESCAPE),
+            DBApplication.cover_letter.ilike(pattern, escape=LIKE_ESCAPE)
+        )
+        query = query.where(search_filter)
+    
+    # Counted before the cursor is applied - the total stays the same on every page
+    total = await db.scalar(select(func.count()).select_from(query.subquery()))
+    if after_submitted_at:
+        # Continue after the last row of the previous page in the same order (submitted_at desc,
+        # application_id asc) - applications sharing its timestamp are not skipped
+        if after_application_id:
+            query = query.where(or_(
+                DBApplication.submitted_at < after_submitted_at,
+                and_(DBApplication.submitted_at == after_submitted_at, DBApplication.application_id > after_application_id)
+            ))
+        else:
+            query = query.where(DBApplication.submitted_at < after_submitted_at)
+    page = (await db.execute(
+        query.order_by(DBApplication.submitted_at.desc(), DBApplication.application_id).limit(limit).offset(offset)
+    )).all()
+    
+    result = [
+        {
+            "application_id": row.application_id,
+            "candidate_name": row.candidate_name,
+            "candidate_email": row.candidate_email,
+            "job_title": row.job_title or "Unknown",
+            "ai_status": row.ai_status,
+            "hr_status": row.hr_status,
+            "submitted_at": row.submitted_at
+        }
+        for row in page
+    ]
+    
+    next_cursor = None
+    if len(page) == limit:
+        next_cursor = {"after_submitted_at": page[-1].submitted_at, "after_application_id": page[-1].application_id}
+    
+    payload = orjson.dumps({"results": result, "count": total, "limit": limit, "offset": offset, "next_cursor": next_cursor})
+    await cache_set(cache_key, payload, SEARCH_CACHE_TTL)
+    return Response(content=payload, media_type="application/json")
+
+
+@app.get("/api/admin/candidates/search")
+async def search_candidates(
+    q: Optional[str] = Query(None),
+    skills: Optional[str] = Query(None),
+    limit: int = Query(SEARCH_PAGE_SIZE, ge=1, le=SEARCH_MAX_PAGE_SIZE, description="Page size"),
+    offset: int = Query(0, ge=0, description="Number of results to skip"),
+    current_admin: DBAdmin = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Search candidates by name, email, or skills (in CV text).
+    Results are paginated (newest first); count is the total number of matches.
+    """
+    
+    cache_key = await _search_cache_key("candidates", q, skills, limit, offset)
+    cached = await cache_get(cache_key)
+    if cached:
+        return Response(content=cached, media_type="application/json")
+    
+    # Application stats come from the denormalized candidate columns (no per-candidate aggregate)
+    query = select(
+        DBCandidate.candidate_id,
+        DBCandidate.full_name,
+        DBCandidate.email,
+        DBCandidate.phone,
+        func.coalesce(DBCandidate.total_applications, 0).label("total_applications"),
+        DBCandidate.latest_application_at.label("latest_application")
+    )
+    
+    if q:
+        pattern = _contains_pattern(q)
+        query = query.where(
+            or_(
+                DBCandidate.full_name.ilike(pattern, escape=LIKE_ESCAPE),
+                DBCandidate.email.ilike(pattern, escape=LIKE_ESCAPE)
+            )
+        )
+    
+    if skills:
+        # Skills match any of the candidate's CVs - filtered in SQL instead of loading every CV
+        query = query.where(
+            select(DBApplication.application_id).where(
+                DBApplication.candidate_id == DBCandidate.candidate_id,
+                # ILIKE on the raw column (not lower(cv_text)) so the trigram index applies
+                DBApplication.cv_text.ilike(_contains_pattern(skills), escape=LIKE_ESCAPE)
+            ).exists()
+        )
+    
+    total = await db.scalar(select(func.count()).select_from(query.subquery()))
+    page = await db.execute(
+        query.order_by(DBCandidate.created_at.desc(), DBCandidate.candidate_id).limit(limit).offset(offset)
+    )
+    
+    result = [
+        {
+            "candidate_id": row.candidate_id,
+            "full_name": row.full_name,
+            "email": row.email,
+            "phone": row.phone,
+            "total_applications": row.total_applications,
+            "latest_application": row.latest_application
+        }
+        for row in page
+    ]
+    
+    payload = orjson.dumps({"results": result, "count": total, "limit": limit, "offset": offset})
+    await cache_set(cache_key, payload, SEARCH_CACHE_TTL)
+    return Response(content=payload, media_type="application/json")
+
+
 # ============================================================
 # Admin Endpoints - Applications Management
 # ============================================================
@@ -1197,10 +1580,37 @@ async def list_applications(
     - date_to: Filter applications submitted on or before this date (ISO format, e.g., 2024-01-31)
     - show_archived: If true, show archived applications; if false (default), show only active
     """
-    if db is None:
-        db = next(get_db())
-    
-    query = db.query(DBApplication)
+    # One joined query selecting only the returned columns - no ORM objects, and the large
+    # cv_text / assessment / evaluation JSON columns are never read
+    query = db.query(
+        DBApplication.application_id,
+        DBApplication.cover_letter,
+        DBApplication.cv_filename,
+        DBApplication.ai_status,
+        DBApplication.ai_reasoning,
+        DBApplication.ai_score,
+        DBApplication.hr_status,
+        DBApplication.hr_override_reason,
+        DBApplication.interview_invited_at,
+        DBApplication.interview_completed_at,
+        DBApplication.interview_recommendation,
+        DBApplication.submitted_at,
+        DBApplication.is_archived,
+        DBApplication.archived_at,
+        DBCandidate.candidate_id,
+        DBCandidate.full_name,
+        DBCandidate.email,
+        DBCandidate.phone,
+        DBCandidate.linkedin,
+        DBCandidate.portfolio,
+        DBJobOffer.offer_id,
+        DBJobOffer.title,
+        DBJobOffer.required_languages
+    ).join(
+        DBCandidate, DBApplication.candidate_id == DBCandidate.candidate_id
+    ).outerjoin(
+        DBJobOffer, DBApplication.job_offer_id == DBJobOffer.offer_id
+    )
     
     # Filter by archive status (by default, show only non-archived)
     if not show_archived:
@@ -1214,11 +1624,12 @@ async def list_applications(
     if hr_status:
         query = query.filter(DBApplication.hr_status == hr_status)
     if search:
+        pattern = _contains_pattern(search)
         search_filter = or_(
-            DBCandidate.full_name.ilike(f"%{search}%"),
-            DBCandidate.email.ilike(f"%{search}%")
+            DBCandidate.full_name.ilike(pattern, escape=LIKE_ESCAPE),
+            DBCandidate.email.ilike(pattern, escape=LIKE_ESCAPE)
         )
-        query = query.join(DBCandidate).filter(search_filter)
+        query = query.filter(search_filter)
     
     # Apply date filters
     if date_from:
@@ -1246,48 +1657,43 @@ async def list_applications(
     
     applications = query.order_by(DBApplication.submitted_at.desc()).all()
     
-    result = []
-    for app in applications:
-        candidate = db.query(DBCandidate).filter(DBCandidate.candidate_id == app.candidate_id).first()
-        job_offer = db.query(DBJobOffer).filter(DBJobOffer.offer_id == app.job_offer_id).first()
-        
-        result.append({
-            "application_id": app.application_id,
+    return [
+        {
+            "application_id": row.application_id,
             "candidate": {
-                "candidate_id": candidate.candidate_id,
-                "full_name": candidate.full_name,
-                "email": candidate.email,
-                "phone": candidate.phone,
-                "linkedin": candidate.linkedin,
-                "portfolio": candidate.portfolio
+                "candidate_id": row.candidate_id,
+                "full_name": row.full_name,
+                "email": row.email,
+                "phone": row.phone,
+                "linkedin": row.linkedin,
+                "portfolio": row.portfolio
             },
             "job_offer": {
-                "offer_id": job_offer.offer_id if job_offer else None,
-                "title": job_offer.title if job_offer else "Unknown",
-                "required_languages": job_offer.required_languages if job_offer else None
+                "offer_id": row.offer_id,
+                "title": row.title if row.offer_id else "Unknown",
+                "required_languages": row.required_languages
             },
-            "cover_letter": app.cover_letter,
-            "cv_filename": app.cv_filename,
-            "ai_status": app.ai_status,
-            "ai_reasoning": app.ai_reasoning,
-            "ai_score": app.ai_score,
-            "hr_status": app.hr_status,
-            "hr_override_reason": app.hr_override_reason,
-            "interview_invited_at": app.interview_invited_at.isoformat() if app.interview_invited_at else None,
-            "interview_completed_at": app.interview_completed_at.isoformat() if app.interview_completed_at else None,
-            "interview_recommendation": app.interview_recommendation,
-            "submitted_at": app.submitted_at.isoformat() if app.submitted_at else None,
-            "is_archived": app.is_archived or False,
-            "archived_at": app.archived_at.isoformat() if app.archived_at else None
-        })
-    
-    return result
+            "cover_letter": row.cover_letter,
+            "cv_filename": row.cv_filename,
+            "ai_status": row.ai_status,
+            "ai_reasoning": row.ai_reasoning,
+            "ai_score": row.ai_score,
+            "hr_status": row.hr_status,
+            "hr_override_reason": row.hr_override_reason,
+            "interview_invited_at": row.interview_invited_at,
+            "interview_completed_at": row.interview_completed_at,
+            "interview_recommendation": row.interview_recommendation,
+            "submitted_at": row.submitted_at,
+            "is_archived": row.is_archived or False,
+            "archived_at": row.archived_at
+        }
+        for row in applications
+    ]
 
 
 @app.get("/api/admin/applications/{application_id}/cv-file")
 async def download_cv_file(application_id: str, db: Session = Depends(get_db), current_admin: DBAdmin = Depends(get_current_admin)):
     """Download the original CV PDF file for admin preview."""
-    from fastapi.responses import Response
     application = db.query(DBApplication).filter(DBApplication.application_id == application_id).first()
     if not application:
         raise HTTPException(status_code=404, detail="Application not found")
@@ -1308,9 +1714,6 @@ async def download_cv_file(application_id: str, db: Session = Depends(get_db), c
 @app.get("/api/admin/applications/{application_id}")
 async def get_application_details(application_id: str, db: Session = Depends(get_db), current_admin: DBAdmin = Depends(get_current_admin)):
     """Get full application details including CV text."""
-    if db is None:
-        db = next(get_db())
-    
     application = db.query(DBApplication).filter(DBApplication.application_id == application_id).first()
     if not application:
         raise HTTPException(status_code=404, detail="Application not found")
@@ -1318,8 +1721,11 @@ async def get_application_details(application_id: str, db: Session = Depends(get
     candidate = db.query(DBCandidate).filter(DBCandidate.candidate_id == application.candidate_id).first()
     job_offer = db.query(DBJobOffer).filter(DBJobOffer.offer_id == application.job_offer_id).first()
     
-    # Get interview records
-    interviews = db.query(DBInterview).filter(DBInterview.application_id == application_id).all()
+    # Get interview records - transcripts are loaded per interview via /admin/interviews/{id}
+    interviews = db.query(DBInterview).options(
+        defer(DBInterview.conversation_history),
+        defer(DBInterview.audio_segments)
+    ).filter(DBInterview.application_id == application_id).all()
     
     return {
         "application_id": application.application_id,
@@ -1351,21 +1757,20 @@ async def get_application_details(application_id: str, db: Session = Depends(get
         "job_fit_check": json.loads(application.job_fit_check_json) if application.job_fit_check_json else None,
         "hr_status": application.hr_status,
         "hr_override_reason": application.hr_override_reason,
-        "interview_invited_at": application.interview_invited_at.isoformat() if application.interview_invited_at else None,
-        "interview_completed_at": application.interview_completed_at.isoformat() if application.interview_completed_at else None,
+        "interview_invited_at": application.interview_invited_at,
+        "interview_completed_at": application.interview_completed_at,
         "interview_assessment": application.interview_assessment,
         "interview_recommendation": application.interview_recommendation,
-        "submitted_at": application.submitted_at.isoformat() if application.submitted_at else None,
+        "submitted_at": application.submitted_at,
         "interviews": [
             {
                 "interview_id": interview.interview_id,
                 "status": interview.status,
                 "recommendation": interview.recommendation,
                 "assessment": interview.assessment,
-                "conversation_history": interview.conversation_history,
-                "has_recording": interview.recording_audio is not None,
-                "created_at": interview.created_at.isoformat() if interview.created_at else None,
-                "completed_at": interview.completed_at.isoformat() if interview.completed_at else None
+                "has_recording": interview.recording_audio_path is not None or interview.recording_audio is not None,
+                "created_at": interview.created_at,
+                "completed_at": interview.completed_at
             }
             for interview in interviews
         ]
@@ -1375,42 +1780,51 @@ async def get_application_details(application_id: str, db: Session = Depends(get
 @app.get("/api/admin/job-offers/{offer_id}/applications")
 async def get_job_offer_applications(offer_id: str, db: Session = Depends(get_db), current_admin: DBAdmin = Depends(get_current_admin)):
     """Get all applications for a specific job offer with AI pre-selection status."""
-    if db is None:
-        db = next(get_db())
-    
     # Verify job offer exists
     job_offer = db.query(DBJobOffer).filter(DBJobOffer.offer_id == offer_id).first()
     if not job_offer:
         raise HTTPException(status_code=404, detail="Job offer not found")
     
-    applications = db.query(DBApplication).filter(DBApplication.job_offer_id == offer_id).all()
+    # Applications and their candidates in one joined query, selecting only the returned columns
+    applications = db.query(
+        DBApplication.application_id,
+        DBApplication.ai_status,
+        DBApplication.ai_reasoning,
+        DBApplication.ai_score,
+        DBApplication.hr_status,
+        DBApplication.submitted_at,
+        DBCandidate.candidate_id,
+        DBCandidate.full_name,
+        DBCandidate.email,
+        DBCandidate.phone
+    ).join(
+        DBCandidate, DBApplication.candidate_id == DBCandidate.candidate_id
+    ).filter(DBApplication.job_offer_id == offer_id).all()
     
     # Separate by AI status
     approved = []
     rejected = []
     pending = []
     
-    for app in applications:
-        candidate = db.query(DBCandidate).filter(DBCandidate.candidate_id == app.candidate_id).first()
-        
+    for row in applications:
         app_data = {
-            "application_id": app.application_id,
+            "application_id": row.application_id,
             "candidate": {
-                "candidate_id": candidate.candidate_id,
-                "full_name": candidate.full_name,
-                "email": candidate.email,
-                "phone": candidate.phone
+                "candidate_id": row.candidate_id,
+                "full_name": row.full_name,
+                "email": row.email,
+                "phone": row.phone
             },
-            "ai_status": app.ai_status,
-            "ai_reasoning": app.ai_reasoning,
-            "ai_score": app.ai_score,
-            "hr_status": app.hr_status,
-            "submitted_at": app.submitted_at.isoformat() if app.submitted_at else None
+            "ai_status": row.ai_status,
+            "ai_reasoning": row.ai_reasoning,
+            "ai_score": row.ai_score,
+            "hr_status": row.hr_status,
+            "submitted_at": row.submitted_at
         }
         
-        if app.ai_status == "approved":
+        if row.ai_status == "approved":
             approved.append(app_data)
-        elif app.ai_status == "rejected":
+        elif row.ai_status == "rejected":
             rejected.append(app_data)
         else:
             pending.append(app_data)
@@ -1445,16 +1859,42 @@ async def list_candidates(
     - search: Search by name or email
     - status: Filter by application status (optional)
     """
-    if db is None:
-        db = next(get_db())
+    # Only select the columns the listing returns (skip full ORM rows)
+    candidate_columns = (
+        DBCandidate.candidate_id,
+        DBCandidate.full_name,
+        DBCandidate.email,
+        DBCandidate.phone,
+        DBCandidate.linkedin,
+        DBCandidate.portfolio,
+        DBCandidate.created_at
+    )
     
-    query = db.query(DBCandidate)
+    if status:
+        # Status-filtered counts need the applications join; the filter is part of
+        # the join so non-matching rows never leave the DB
+        query = db.query(
+            *candidate_columns,
+            func.count(DBApplication.application_id).label("total_applications"),
+            func.max(DBApplication.submitted_at).label("latest_application")
+        ).outerjoin(DBApplication, and_(
+            DBApplication.candidate_id == DBCandidate.candidate_id,
+            or_(DBApplication.hr_status == status, DBApplication.ai_status == status)
+        )).group_by(DBCandidate.candidate_id)
+    else:
+        # Unfiltered listing reads the denormalized stats - single-table scan, no aggregate
+        query = db.query(
+            *candidate_columns,
+            func.coalesce(DBCandidate.total_applications, 0).label("total_applications"),
+            DBCandidate.latest_application_at.label("latest_application")
+        )
     
     if search:
+        pattern = _contains_pattern(search)
         query = query.filter(
             or_(
-                DBCandidate.full_name.ilike(f"%{search}%"),
-                DBCandidate.email.ilike(f"%{search}%")
+                DBCandidate.full_name.ilike(pattern, escape=LIKE_ESCAPE),
+                DBCandidate.email.ilike(pattern, escape=LIKE_ESCAPE)
             )
         )
     
@@ -1462,13 +1902,6 @@ async def list_candidates(
     
     result = []
     for candidate in candidates:
-        # Get all applications for this candidate
-        applications = db.query(DBApplication).filter(DBApplication.candidate_id == candidate.candidate_id).all()
-        
-        # Filter by status if provided
-        if status:
-            applications = [app for app in applications if app.hr_status == status or app.ai_status == status]
-        
         result.append({
             "candidate_id": candidate.candidate_id,
             "full_name": candidate.full_name,
@@ -1476,9 +1909,9 @@ async def list_candidates(
             "phone": candidate.phone,
             "linkedin": candidate.linkedin,
             "portfolio": candidate.portfolio,
-            "total_applications": len(applications),
-            "latest_application": applications[0].submitted_at.isoformat() if applications else None,
-            "created_at": candidate.created_at.isoformat() if candidate.created_at else None
+            "total_applications": candidate.total_applications,
+            "latest_application": candidate.latest_application,
+            "created_at": candidate.created_at
         })
     
     return result
@@ -1487,18 +1920,19 @@ async def list_candidates(
 @app.get("/api/admin/candidates/{candidate_email}")
 async def get_candidate_by_email(candidate_email: str, db: Session = Depends(get_db), current_admin: DBAdmin = Depends(get_current_admin)):
     """Get all applications from a specific candidate (by email)."""
-    if db is None:
-        db = next(get_db())
-    
-    candidate = db.query(DBCandidate).filter(DBCandidate.email == candidate_email).first()
+    candidate = db.query(DBCandidate).options(raiseload("*")).filter(DBCandidate.email == candidate_email).first()
     if not candidate:
         raise HTTPException(status_code=404, detail="Candidate not found")
     
-    applications = db.query(DBApplication).filter(DBApplication.candidate_id == candidate.candidate_id).all()
+    # Eager-load job offers in one query; any other lazy load raises (N+1 guard)
+    applications = db.query(DBApplication).options(
+        selectinload(DBApplication.job_offer),
+        raiseload("*")
+    ).filter(DBApplication.candidate_id == candidate.candidate_id).all()
     
     result_applications = []
     for app in applications:
-        job_offer = db.query(DBJobOffer).filter(DBJobOffer.offer_id == app.job_offer_id).first()
+        job_offer = app.job_offer
         
         result_applications.append({
             "application_id": app.application_id,
@@ -1513,10 +1947,10 @@ async def get_candidate_by_email(candidate_email: str, db: Session = Depends(get
             "ai_reasoning": app.ai_reasoning,
             "ai_score": app.ai_score,
             "hr_status": app.hr_status,
-            "interview_invited_at": app.interview_invited_at.isoformat() if app.interview_invited_at else None,
-            "interview_completed_at": app.interview_completed_at.isoformat() if app.interview_completed_at else None,
+            "interview_invited_at": app.interview_invited_at,
+            "interview_completed_at": app.interview_completed_at,
             "interview_recommendation": app.interview_recommendation,
-            "submitted_at": app.submitted_at.isoformat() if app.submitted_at else None
+            "submitted_at": app.submitted_at
         })
     
     return {
@@ -1527,7 +1961,7 @@ async def get_candidate_by_email(candidate_email: str, db: Session = Depends(get
             "phone": candidate.phone,
             "linkedin": candidate.linkedin,
             "portfolio": candidate.portfolio,
-            "created_at": candidate.created_at.isoformat() if candidate.created_at else None
+            "created_at": candidate.created_at
         },
         "applications": result_applications
     }
@@ -1548,23 +1982,21 @@ async def override_ai_decision(application_id: str, override: OverrideRequest, d
     Allow HR to override AI decision.
     If AI rejected but HR wants to select, or vice versa.
     """
-    if db is None:
-        db = next(get_db())
-    
-    application = db.query(DBApplication).filter(DBApplication.application_id == application_id).first()
-    if not application:
-        raise HTTPException(status_code=404, detail="Application not found")
-    
     if override.hr_status not in ["selected", "rejected"]:
         raise HTTPException(status_code=400, detail="hr_status must be 'selected' or 'rejected'")
     
-    # Update HR status
-    application.hr_status = override.hr_status
-    application.hr_override_reason = override.reason or ""
-    application.updated_at = datetime.now()
+    # Update HR status in a single UPDATE ... RETURNING round-trip
+    application = db.execute(
+        update(DBApplication)
+        .where(DBApplication.application_id == application_id)
+        .values(hr_status=override.hr_status, hr_override_reason=override.reason or "", updated_at=datetime.now())
+        .returning(DBApplication.ai_status, DBApplication.hr_status, DBApplication.hr_override_reason)
+    ).one_or_none()
+    if application is None:
+        raise HTTPException(status_code=404, detail="Application not found")
     
     db.commit()
-    db.refresh(application)
+    await _invalidate_admin_caches()
     
     logger.info(f"🔄 HR override: Application {application_id} - AI: {application.ai_status}, HR: {override.hr_status}")
     
@@ -1580,19 +2012,21 @@ async def override_ai_decision(application_id: str, override: OverrideRequest, d
 @app.post("/api/admin/applications/{application_id}/select")
 async def select_candidate(application_id: str, reason: Optional[str] = Query(None), db: Session = Depends(get_db), current_admin: DBAdmin = Depends(get_current_admin)):
     """Mark candidate as selected by HR (can override AI rejection)."""
-    if db is None:
-        db = next(get_db())
-    
-    application = db.query(DBApplication).filter(DBApplication.application_id == application_id).first()
-    if not application:
-        raise HTTPException(status_code=404, detail="Application not found")
-    
-    application.hr_status = "selected"
+    values = {"hr_status": "selected", "updated_at": datetime.now()}
     if reason:
-        application.hr_override_reason = reason
-    application.updated_at = datetime.now()
+        values["hr_override_reason"] = reason
+    
+    updated = db.execute(
+        update(DBApplication)
+        .where(DBApplication.application_id == application_id)
+        .values(**values)
+        .returning(DBApplication.application_id)
+    ).one_or_none()
+    if updated is None:
+        raise HTTPException(status_code=404, detail="Application not found")
     
     db.commit()
+    await _invalidate_admin_caches()
     
     return {"message": "Candidate selected successfully", "hr_status": "selected"}
 
@@ -1600,19 +2034,21 @@ async def select_candidate(application_id: str, reason: Optional[str] = Query(No
 @app.post("/api/admin/applications/{application_id}/reject")
 async def reject_candidate(application_id: str, reason: Optional[str] = Query(None), db: Session = Depends(get_db), current_admin: DBAdmin = Depends(get_current_admin)):
     """Mark candidate as rejected by HR."""
-    if db is None:
-        db = next(get_db())
-    
-    application = db.query(DBApplication).filter(DBApplication.application_id == application_id).first()
-    if not application:
-        raise HTTPException(status_code=404, detail="Application not found")
-    
-    application.hr_status = "rejected"
+    values = {"hr_status": "rejected", "updated_at": datetime.now()}
     if reason:
-        application.hr_override_reason = reason
-    application.updated_at = datetime.now()
+        values["hr_override_reason"] = reason
+    
+    updated = db.execute(
+        update(DBApplication)
+        .where(DBApplication.application_id == application_id)
+        .values(**values)
+        .returning(DBApplication.application_id)
+    ).one_or_none()
+    if updated is None:
+        raise HTTPException(status_code=404, detail="Application not found")
     
     db.commit()
+    await _invalidate_admin_caches()
     
     return {"message": "Candidate rejected", "hr_status": "rejected"}
 
@@ -1624,17 +2060,16 @@ async def reject_candidate(application_id: str, reason: Optional[str] = Query(No
 @app.post("/api/admin/applications/{application_id}/archive")
 async def archive_application(application_id: str, db: Session = Depends(get_db), current_admin: DBAdmin = Depends(get_current_admin)):
     """Archive an application (soft delete - hidden from main view but not deleted)."""
-    if db is None:
-        db = next(get_db())
-    
-    application = db.query(DBApplication).filter(DBApplication.application_id == application_id).first()
-    if not application:
+    now = datetime.now()
+    updated = db.execute(
+        update(DBApplication)
+        .where(DBApplication.application_id == application_id)
+        .values(is_archived=True, archived_at=now, updated_at=now)
+        .returning(DBApplication.application_id)
+    ).one_or_none()
+    if updated is None:
         raise HTTPException(status_code=404, detail="Application not found")
     
-    application.is_archived = True
-    application.archived_at = datetime.now()
-    application.updated_at = datetime.now()
-    
     db.commit()
     
     logger.info(f"📦 Application archived: {application_id}")
@@ -1644,17 +2079,15 @@ async def archive_application(application_id: str, db: Session = Depends(get_db)
 @app.post("/api/admin/applications/{application_id}/unarchive")
 async def unarchive_application(application_id: str, db: Session = Depends(get_db), current_admin: DBAdmin = Depends(get_current_admin)):
     """Restore an archived application back to active view."""
-    if db is None:
-        db = next(get_db())
-    
-    application = db.query(DBApplication).filter(DBApplication.application_id == application_id).first()
-    if not application:
+    updated = db.execute(
+        update(DBApplication)
+        .where(DBApplication.application_id == application_id)
+        .values(is_archived=False, archived_at=None, updated_at=datetime.now())
+        .returning(DBApplication.application_id)
+    ).one_or_none()
+    if updated is None:
         raise HTTPException(status_code=404, detail="Application not found")
     
-    application.is_archived = False
-    application.archived_at = None
-    application.updated_at = datetime.now()
-    
     db.commit()
     
     logger.info(f"📤 Application unarchived: {application_id}")
@@ -1664,16 +2097,15 @@ async def unarchive_application(application_id: str, db: Session = Depends(get_d
 @app.post("/api/admin/interviews/{interview_id}/archive")
 async def archive_interview(interview_id: str, db: Session = Depends(get_db), current_admin: DBAdmin = Depends(get_current_admin)):
     """Archive an interview (soft delete - hidden from main view but not deleted)."""
-    if db is None:
-        db = next(get_db())
-    
-    interview = db.query(DBInterview).filter(DBInterview.interview_id == interview_id).first()
-    if not interview:
+    updated = db.execute(
+        update(DBInterview)
+        .where(DBInterview.interview_id == interview_id)
+        .values(is_archived=True, archived_at=datetime.now())
+        .returning(DBInterview.interview_id)
+    ).one_or_none()
+    if updated is None:
         raise HTTPException(status_code=404, detail="Interview not found")
     
-    interview.is_archived = True
-    interview.archived_at = datetime.now()
-    
     db.commit()
     
     logger.info(f"📦 Interview archived: {interview_id}")
@@ -1683,16 +2115,15 @@ async def archive_interview(interview_id: str, db: Session = Depends(get_db), cu
 @app.post("/api/admin/interviews/{interview_id}/unarchive")
 async def unarchive_interview(interview_id: str, db: Session = Depends(get_db), current_admin: DBAdmin = Depends(get_current_admin)):
     """Restore an archived interview back to active view."""
-    if db is None:
-        db = next(get_db())
-    
-    interview = db.query(DBInterview).filter(DBInterview.interview_id == interview_id).first()
-    if not interview:
+    updated = db.execute(
+        update(DBInterview)
+        .where(DBInterview.interview_id == interview_id)
+        .values(is_archived=False, archived_at=None)
+        .returning(DBInterview.interview_id)
+    ).one_or_none()
+    if updated is None:
         raise HTTPException(status_code=404, detail="Interview not found")
     
-    interview.is_archived = False
-    interview.archived_at = None
-    
     db.commit()
     
     logger.info(f"📤 Interview unarchived: {interview_id}")
@@ -1706,9 +2137,6 @@ async def unarchive_interview(interview_id: str, db: Session = Depends(get_db),
 @app.delete("/api/admin/applications/{application_id}")
 async def delete_application(application_id: str, db: Session = Depends(get_db), current_admin: DBAdmin = Depends(get_current_admin)):
     """Permanently delete an application and its related interviews."""
-    if db is None:
-        db = next(get_db())
-    
     application = db.query(DBApplication).filter(DBApplication.application_id == application_id).first()
     if not application:
         raise HTTPException(status_code=404, detail="Application not found")
@@ -1720,6 +2148,7 @@ async def delete_application(application_id: str, db: Session = Depends(get_db),
     # Delete the application
     db.delete(application)
     db.commit()
+    await _invalidate_admin_caches()
     
     logger.info(f"🗑️ Application permanently deleted: {application_id}")
     return {"message": "Application deleted successfully"}
@@ -1728,15 +2157,13 @@ async def delete_application(application_id: str, db: Session = Depends(get_db),
 @app.delete("/api/admin/interviews/{interview_id}")
 async def delete_interview(interview_id: str, db: Session = Depends(get_db), current_admin: DBAdmin = Depends(get_current_admin)):
     """Permanently delete an interview."""
-    if db is None:
-        db = next(get_db())
-    
     interview = db.query(DBInterview).filter(DBInterview.interview_id == interview_id).first()
     if not interview:
         raise HTTPException(status_code=404, detail="Interview not found")
     
     db.delete(interview)
     db.commit()
+    await _invalidate_admin_caches()
     
     logger.info(f"🗑️ Interview permanently deleted: {interview_id}")
     return {"message": "Interview deleted successfully"}
@@ -1772,6 +2199,7 @@ async def bulk_delete_interviews(body: BulkInterviewRequest, db: Session = Depen
 
     deleted = db.query(DBInterview).filter(DBInterview.interview_id.in_(body.interview_ids)).delete(synchronize_session='fetch')
     db.commit()
+    await _invalidate_admin_caches()
 
     logger.info(f"Bulk deleted {deleted} interviews")
     return {"message": f"{deleted} interview(s) deleted successfully", "deleted_count": deleted}
@@ -1786,7 +2214,7 @@ async def bulk_archive_interviews(body: BulkArchiveRequest, db: Session = Depend
     interviews = db.query(DBInterview).filter(DBInterview.interview_id.in_(body.interview_ids)).all()
     for interview in interviews:
         interview.is_archived = body.archive
-        interview.archived_at = datetime.utcnow() if body.archive else None
+        interview.archived_at = _utc_now() if body.archive else None
     db.commit()
 
     action = "archived" if body.archive else "restored"
@@ -1805,6 +2233,7 @@ async def bulk_delete_applications(body: BulkApplicationRequest, db: Session = D
     db.query(DBCVEvaluation).filter(DBCVEvaluation.application_id.in_(body.application_ids)).delete(synchronize_session='fetch')
     deleted = db.query(DBApplication).filter(DBApplication.application_id.in_(body.application_ids)).delete(synchronize_session='fetch')
     db.commit()
+    await _invalidate_admin_caches()
 
     logger.info(f"Bulk deleted {deleted} applications")
     return {"message": f"{deleted} application(s) deleted successfully", "deleted_count": deleted}
@@ -1819,7 +2248,7 @@ async def bulk_archive_applications(body: BulkApplicationArchiveRequest, db: Ses
     applications = db.query(DBApplication).filter(DBApplication.application_id.in_(body.application_ids)).all()
     for application in applications:
         application.is_archived = body.archive
-        application.archived_at = datetime.utcnow() if body.archive else None
+        application.archived_at = _utc_now() if body.archive else None
     db.commit()
 
     action = "archived" if body.archive else "restored"
@@ -1835,6 +2264,7 @@ async def bulk_delete_job_offers(body: BulkJobOfferRequest, db: Session = Depend
 
     deleted = db.query(DBJobOffer).filter(DBJobOffer.offer_id.in_(body.offer_ids)).delete(synchronize_session='fetch')
     db.commit()
+    await _invalidate_admin_caches()
 
     logger.info(f"Bulk deleted {deleted} job offers")
     return {"message": f"{deleted} job offer(s) deleted successfully", "deleted_count": deleted}
@@ -1859,6 +2289,7 @@ async def bulk_delete_candidates(body: BulkCandidateRequest, db: Session = Depen
 
     deleted = db.query(DBCandidate).filter(DBCandidate.candidate_id.in_(body.candidate_ids)).delete(synchronize_session='fetch')
     db.commit()
+    await _invalidate_admin_caches()
 
     logger.info(f"Bulk deleted {deleted} candidates")
     return {"message": f"{deleted} candidate(s) deleted successfully", "deleted_count": deleted}
@@ -1867,9 +2298,6 @@ async def bulk_delete_candidates(body: BulkCandidateRequest, db: Session = Depen
 @app.delete("/api/admin/candidates/{candidate_id}")
 async def delete_candidate(candidate_id: str, db: Session = Depends(get_db), current_admin: DBAdmin = Depends(get_current_admin)):
     """Permanently delete a candidate and all their applications and interviews."""
-    if db is None:
-        db = next(get_db())
-    
     candidate = db.query(DBCandidate).filter(DBCandidate.candidate_id == candidate_id).first()
     if not candidate:
         raise HTTPException(status_code=404, detail="Candidate not found")
@@ -1885,6 +2313,7 @@ async def delete_candidate(candidate_id: str, db: Session = Depends(get_db), cur
     # Delete the candidate
     db.delete(candidate)
     db.commit()
+    await _invalidate_admin_caches()
     
     logger.info(f"🗑️ Candidate permanently deleted: {candidate_id}")
     return {"message": "Candidate and all related data deleted successfully"}
@@ -1911,22 +2340,16 @@ async def send_interview_invitation(
     For now, just updates status and stores invitation data.
     Email integration will be added later.
     """
-    if db is None:
-        db = next(get_db())
-    
-    application = db.query(DBApplication).filter(DBApplication.application_id == application_id).first()
-    if not application:
+    # Single transaction: load application + candidate + job offer in one round-trip,
+    # update the application and insert the interview, then commit once
+    row = db.query(DBApplication, DBCandidate, DBJobOffer).outerjoin(
+        DBCandidate, DBCandidate.candidate_id == DBApplication.candidate_id
+    ).outerjoin(
+        DBJobOffer, DBJobOffer.offer_id == DBApplication.job_offer_id
+    ).filter(DBApplication.application_id == application_id).first()
+    if not row:
         raise HTTPException(status_code=404, detail="Application not found")
-    
-    # Update application status
-    application.hr_status = "interview_sent"
-    application.interview_invited_at = datetime.now()
-    application.updated_at = datetime.now()
-    db.commit()  # Commit application update first
-    
-    # Get candidate and job offer
-    logger.info(f"🔍 Looking for candidate with ID: {application.candidate_id}")
-    candidate = db.query(DBCandidate).filter(DBCandidate.candidate_id == application.candidate_id).first()
+    application, candidate, job_offer = row
     
     if candidate is None:
         logger.error(f"❌ Candidate not found for application {application_id}, candidate_id: {application.candidate_id}")
@@ -1939,39 +2362,49 @@ async def send_interview_invitation(
     if not candidate.full_name:
         logger.warning(f"⚠️ Candidate {candidate.candidate_id} has no full_name, using default")
     
-    job_offer = db.query(DBJobOffer).filter(DBJobOffer.offer_id == application.job_offer_id).first()
     if not job_offer:
         logger.error(f"❌ Job offer not found for application {application_id}, job_offer_id: {application.job_offer_id}")
         raise HTTPException(status_code=404, detail="Job offer not found")
     
-    # Create interview record (allow multiple interviews per application)
-    # Check if there are existing completed interviews, but still allow creating new ones
-    existing_interviews = db.query(DBInterview).filter(DBInterview.application_id == application_id).all()
-    completed_count = sum(1 for i in existing_interviews if i.status == "completed")
+    # Allow multiple interviews per application - counts are only used for logging
+    existing_count, completed_count = db.query(
+        func.count(DBInterview.interview_id),
+        func.count(DBInterview.interview_id).filter(DBInterview.status == "completed")
+    ).filter(DBInterview.application_id == application_id).one()
+    
+    # Update application status
+    invited_at = datetime.now()
+    application.hr_status = "interview_sent"
+    application.interview_invited_at = invited_at
+    application.updated_at = invited_at
+    
+    interview_id = generate_id()
+    db.add(DBInterview(
+        interview_id=interview_id,
+        application_id=application_id,
+        job_offer_id=application.job_offer_id,
+        status="pending",
+        candidate_name=candidate_name
+    ))
+    job_title = job_offer.title
+    candidate_email = candidate.email
     
     try:
-        interview = DBInterview(
-            application_id=application_id,
-            job_offer_id=application.job_offer_id,
-            status="pending",
-            candidate_name=candidate_name
-        )
-        db.add(interview)
         db.commit()
-        db.refresh(interview)
-        logger.info(f"✅ Interview record created: {interview.interview_id} (Attempt #{len(existing_interviews) + 1}, {completed_count} previous completed)")
+        await _invalidate_admin_caches()
     except Exception as e:
         logger.error(f"❌ Error creating interview record: {e}", exc_info=True)
         db.rollback()
         raise HTTPException(status_code=500, detail=f"Error creating interview record: {str(e)}")
     
-    logger.info(f"📧 Interview invitation sent: {application_id} for {job_offer.title} to {candidate.email}")
+    logger.info(f"✅ Interview record created: {interview_id} (Attempt #{existing_count + 1}, {completed_count} previous completed)")
+    logger.info(f"📧 Interview invitation sent: {application_id} for {job_title} to {candidate_email}")
     
     return {
-        "interview_id": interview.interview_id,
+        "interview_id": interview_id,
         "application_id": application_id,
         "status": "interview_sent",
-        "interview_invited_at": application.interview_invited_at.isoformat(),
+        "interview_invited_at": invited_at,
         "interview_date": invitation.interview_date,
         "notes": invitation.notes,
         "message": "Interview invitation sent (email integration pending)"
@@ -1998,14 +2431,25 @@ async def list_interviews(
     - date_to: Filter interviews created on or before this date (ISO format, e.g., 2024-01-31)
     - show_archived: If true, show archived interviews; if false (default), show only active
     """
-    if db is None:
-        db = next(get_db())
-    
-    query = db.query(DBInterview)
+    # Only select the listing columns - never recording_audio/recording_video,
+    # audio_segments, conversation_history or assessment (served by detail endpoints)
+    query = db.query(
+        DBInterview.interview_id,
+        DBInterview.application_id,
+        DBInterview.job_offer_id,
+        DBInterview.candidate_name,
+        DBInterview.status,
+        DBInterview.recommendation,
+        DBInterview.created_at,
+        DBInterview.completed_at,
+        DBInterview.is_archived,
+        DBInterview.archived_at
+    )
     
     # Filter by archive status (by default, show only non-archived)
+    # IS NOT TRUE matches the partial index ix_interviews_active_recent
     if not show_archived:
-        query = query.filter(or_(DBInterview.is_archived == False, DBInterview.is_archived == None))
+        query = query.filter(DBInterview.is_archived.isnot(True))
     
     if status:
         query = query.filter(DBInterview.status == status)
@@ -2035,11 +2479,24 @@ async def list_interviews(
     
     interviews = query.order_by(DBInterview.created_at.desc()).all()
     
+    # Batch-load candidates (via their applications) and job offers - IN queries instead of three lookups per row
+    application_ids = {interview.application_id for interview in interviews if interview.application_id}
+    offer_ids = {interview.job_offer_id for interview in interviews}
+    candidates_by_application = {
+        row.application_id: row for row in db.query(
+            DBApplication.application_id, DBCandidate.full_name, DBCandidate.email
+        ).join(
+            DBCandidate, DBApplication.candidate_id == DBCandidate.candidate_id
+        ).filter(DBApplication.application_id.in_(application_ids))
+    } if application_ids else {}
+    offers_by_id = {
+        row.offer_id: row for row in db.query(DBJobOffer.offer_id, DBJobOffer.title).filter(DBJobOffer.offer_id.in_(offer_ids))
+    } if offer_ids else {}
+    
     result = []
     for interview in interviews:
-        application = db.query(DBApplication).filter(DBApplication.application_id == interview.application_id).first() if interview.application_id else None
-        candidate = db.query(DBCandidate).filter(DBCandidate.candidate_id == application.candidate_id).first() if application else None
-        job_offer = db.query(DBJobOffer).filter(DBJobOffer.offer_id == interview.job_offer_id).first()
+        candidate = candidates_by_application.get(interview.application_id)
+        job_offer = offers_by_id.get(interview.job_offer_id)
         
         result.append({
             "interview_id": interview.interview_id,
@@ -2054,10 +2511,10 @@ async def list_interviews(
             },
             "status": interview.status,
             "recommendation": interview.recommendation,
-            "created_at": interview.created_at.isoformat() if interview.created_at else None,
-            "completed_at": interview.completed_at.isoformat() if interview.completed_at else None,
+            "created_at": interview.created_at,
+            "completed_at": interview.completed_at,
             "is_archived": interview.is_archived or False,
-            "archived_at": interview.archived_at.isoformat() if interview.archived_at else None
+            "archived_at": interview.archived_at
         })
     
     return result
@@ -2066,12 +2523,17 @@ async def list_interviews(
 @app.get("/api/admin/interviews/{interview_id}")
 async def get_interview_details(interview_id: str, db: Session = Depends(get_db), current_admin: DBAdmin = Depends(get_current_admin)):
     """Get interview details including assessment if completed."""
-    if db is None:
-        db = next(get_db())
-    
-    interview = db.query(DBInterview).filter(DBInterview.interview_id == interview_id).first()
-    if not interview:
+    # Heavy recording columns are deferred - audio is served by /recording and /segments
+    row = db.query(
+        DBInterview,
+        or_(DBInterview.recording_audio_path.isnot(None), func.length(DBInterview.recording_audio) > 0).label("has_recording")
+    ).options(
+        defer(DBInterview.recording_audio),
+        defer(DBInterview.audio_segments)
+    ).filter(DBInterview.interview_id == interview_id).first()
+    if not row:
         raise HTTPException(status_code=404, detail="Interview not found")
+    interview, has_recording = row
     
     application = db.query(DBApplication).filter(DBApplication.application_id == interview.application_id).first() if interview.application_id else None
     candidate = db.query(DBCandidate).filter(DBCandidate.candidate_id == application.candidate_id).first() if application else None
@@ -2091,17 +2553,35 @@ async def get_interview_details(interview_id: str, db: Session = Depends(get_db)
         "status": interview.status,
         "recommendation": interview.recommendation,
         "assessment": interview.assessment,
+        "assessment_status": interview.assessment_status,
         "evaluation_scores": json.loads(interview.evaluation_scores) if interview.evaluation_scores else None,
-        "conversation_history": interview.conversation_history,
-        "has_recording": interview.recording_audio is not None,
+        "conversation_history": _interview_conversation(interview)[0] if interview.status == "in_progress" else interview.conversation_history,
+        "has_recording": bool(has_recording),
+        "recording_status": interview.recording_status,
         "has_video": interview.recording_video is not None,
         "recording_video": interview.recording_video,
-        "audio_segments": json.loads(interview.audio_segments) if hasattr(interview, 'audio_segments') and interview.audio_segments else [],
-        "created_at": interview.created_at.isoformat() if interview.created_at else None,
-        "completed_at": interview.completed_at.isoformat() if interview.completed_at else None
+        "created_at": interview.created_at,
+        "completed_at": interview.completed_at
     }
 
 
+@app.get("/api/admin/interviews/{interview_id}/segments")
+async def get_interview_segments(interview_id: str, db: Session = Depends(get_db), current_admin: DBAdmin = Depends(get_current_admin)):
+    """Stream the per-turn audio segments (legacy stored JSON is passed through without re-parsing)."""
+    row = db.query(DBInterview.audio_segments, DBInterview.session_log_path).filter(DBInterview.interview_id == interview_id).first()
+    if not row:
+        raise HTTPException(status_code=404, detail="Interview not found")
+    if row.session_log_path:
+        return session_log_segments(_session_log_file(row.session_log_path))
+    segments_json = row.audio_segments or "[]"
+
+    def iter_segments(chunk_size: int = 64 * 1024):
+        for start in range(0, len(segments_json), chunk_size):
+            yield segments_json[start:start + chunk_size]
+
+    return StreamingResponse(iter_segments(), media_type="application/json")
+
+
 @app.post("/api/admin/interviews/{interview_id}/regenerate-assessment")
 async def regenerate_interview_assessment(interview_id: str, db: Session = Depends(get_db), current_admin: DBAdmin = Depends(get_current_admin)):
     """Regenerate the assessment for a completed interview (e.g., after API quota is reloaded)."""
@@ -2111,7 +2591,7 @@ async def regenerate_interview_assessment(interview_id: str, db: Session = Depen
     if not interview.conversation_history:
         raise HTTPException(status_code=400, detail="No conversation history available to generate assessment")
 
-    history = json.loads(interview.conversation_history)
+    history = interview.conversation_history
     if len(history) < 2:
         raise HTTPException(status_code=400, detail="Conversation too short to generate assessment")
 
@@ -2129,19 +2609,18 @@ async def regenerate_interview_assessment(interview_id: str, db: Session = Depen
     # Run in background thread to not block the request
     def _regen_bg():
         try:
-            from backend.database import SessionLocal
             db_bg = SessionLocal()
             try:
-                from backend.services.openai_llm import generate_assessment as gen_assess
-                assessment = gen_assess(history, interview_context=ctx)
+                assessment = openai_generate_assessment(history, interview_context=ctx)
                 recommendation = extract_recommendation(assessment)
                 detailed_scores = extract_detailed_scores(assessment)
 
                 iv = db_bg.query(DBInterview).filter(DBInterview.interview_id == interview_id).first()
                 if iv:
                     iv.assessment = assessment
+                    iv.assessment_status = "ready"
                     iv.recommendation = recommendation
-                    iv.evaluation_scores = json.dumps(detailed_scores)
+                    iv.evaluation_scores = orjson.dumps(detailed_scores).decode()
 
                     if iv.application_id:
                         app_rec = db_bg.query(DBApplication).filter(
@@ -2158,53 +2637,83 @@ async def regenerate_interview_assessment(interview_id: str, db: Session = Depen
                     # Also regenerate transcript annotations
                     try:
                         feedback_lang = None
-                        if iv.application_id:
-                            app_check = db_bg.query(DBApplication).filter(
-                                DBApplication.application_id == iv.application_id
-                            ).first()
-                            if app_check and app_check.required_languages:
-                                langs = json.loads(app_check.required_languages)
-                                feedback_lang = langs[0] if langs else None
-                        from backend.services.language_llm_openai import generate_transcript_annotations as gem_ann
-                        annotations = gem_ann(conversation_history=history, feedback_language=feedback_lang)
-                        hist_copy = json.loads(iv.conversation_history)
+                        langs = db_bg.query(DBJobOffer.required_languages_list).filter(
+                            DBJobOffer.offer_id == iv.job_offer_id
+                        ).scalar()
+                        if langs:
+                            feedback_lang = langs[0]
+                        annotations = llm_generate_transcript_annotations(conversation_history=history, feedback_language=feedback_lang)
+                        # Copy the messages - mutating the loaded list in place would hide the change from the ORM
+                        hist_copy = [dict(msg) for msg in iv.conversation_history]
                         for i, msg in enumerate(hist_copy):
                             if msg["role"] == "user":
                                 idx_str = str(i)
                                 if idx_str in annotations:
                                     msg["ai_comment"] = annotations[idx_str]
-                        iv.conversation_history = json.dumps(hist_copy)
+                        iv.conversation_history = hist_copy
                         db_bg.commit()
                     except Exception as ann_err:
                         logger.error(f"Transcript annotation regen failed: {ann_err}")
             except Exception as e:
                 logger.error(f"❌ Assessment regeneration failed: {e}")
                 db_bg.rollback()
+                try:
+                    db_bg.execute(
+                        update(DBInterview).where(DBInterview.interview_id == interview_id).values(
+                            assessment_status="failed"
+                        ).execution_options(synchronize_session=False)
+                    )
+                    db_bg.commit()
+                except Exception:
+                    pass
             finally:
                 db_bg.close()
         except Exception as e:
             logger.error(f"❌ Assessment regeneration thread error: {e}")
 
-    import threading
-    threading.Thread(target=_regen_bg, daemon=True).start()
+    interview.assessment_status = "pending"
+    db.commit()
+
+    assessment_executor.submit(_regen_bg)
     return {"message": "Assessment regeneration started. It will be available shortly."}
 
 
+@app.get("/api/admin/interviews/{interview_id}/assessment")
+async def get_interview_assessment(interview_id: str, db: Session = Depends(get_db), current_admin: DBAdmin = Depends(get_current_admin)):
+    """Get an interview's assessment - 202 while it is still being generated in the background."""
+    row = db.query(
+        DBInterview.assessment_status,
+        DBInterview.assessment,
+        DBInterview.recommendation,
+        DBInterview.evaluation_scores
+    ).filter(DBInterview.interview_id == interview_id).first()
+    if not row:
+        raise HTTPException(status_code=404, detail="Interview not found")
+
+    if row.assessment_status == "pending":
+        return ORJSONResponse(status_code=202, content={"interview_id": interview_id, "assessment_status": "pending"})
+
+    return {
+        "interview_id": interview_id,
+        "assessment_status": row.assessment_status,
+        "assessment": row.assessment,
+        "recommendation": row.recommendation,
+        "evaluation_scores": json.loads(row.evaluation_scores) if row.evaluation_scores else None
+    }
+
+
 @app.get("/api/admin/interviews/{interview_id}/recording")
 async def get_interview_recording(interview_id: str, db: Session = Depends(get_db), current_admin: DBAdmin = Depends(get_current_admin)):
     """Get the interview recording audio file."""
-    if db is None:
-        db = next(get_db())
-    
     interview = db.query(DBInterview).filter(DBInterview.interview_id == interview_id).first()
     if not interview:
         raise HTTPException(status_code=404, detail="Interview not found")
     
-    if not interview.recording_audio:
+    if not interview.recording_audio_path and not interview.recording_audio:
         raise HTTPException(status_code=404, detail="No recording available for this interview")
 
     # Determine audio format from the stored key/data
-    audio_key = interview.recording_audio
+    audio_key = interview.recording_audio_path or interview.recording_audio
     if audio_key.startswith("s3://"):
         audio_key = audio_key[5:]
 
@@ -2213,7 +2722,7 @@ async def get_interview_recording(interview_id: str, db: Session = Depends(get_d
         audio_bytes = s3_download(audio_key, local_dir=UPLOADS_DIR)
         if not audio_bytes:
             raise HTTPException(status_code=404, detail="Recording file not found")
-        audio_format = "wav" if audio_key.endswith(".wav") else "mp3"
+        audio_format = audio_key.rsplit('.', 1)[-1] if audio_key.endswith((".wav", ".webm")) else "mp3"
         return {
             "interview_id": interview_id,
             "recording_audio": base64.b64encode(audio_bytes).decode('utf-8'),
@@ -2229,31 +2738,30 @@ async def get_interview_recording(interview_id: str, db: Session = Depends(get_d
 
 @app.get("/api/admin/interviews/{interview_id}/turn-audio/{audio_key:path}")
 async def get_interview_turn_audio(interview_id: str, audio_key: str, db: Session = Depends(get_db), current_admin: DBAdmin = Depends(get_current_admin)):
-    """Serve a per-turn candidate audio WAV file."""
-    from fastapi.responses import Response
+    """Serve a stored interview audio file (per-turn candidate WAV, async question/answer segments)."""
     interview = db.query(DBInterview).filter(DBInterview.interview_id == interview_id).first()
     if not interview:
         raise HTTPException(status_code=404, detail="Interview not found")
     audio_bytes = s3_download(audio_key, local_dir=UPLOADS_DIR)
     if not audio_bytes:
         raise HTTPException(status_code=404, detail="Turn audio not found")
-    return Response(content=audio_bytes, media_type="audio/wav")
+    media_types = {"mp3": "audio/mpeg", "webm": "audio/webm", "wav": "audio/wav"}
+    return Response(content=audio_bytes, media_type=media_types.get(audio_key.rsplit('.', 1)[-1], "audio/wav"))
 
 
 @app.get("/api/admin/interviews/{interview_id}/video")
 async def get_interview_video(interview_id: str, db: Session = Depends(get_db), current_admin: DBAdmin = Depends(get_current_admin)):
     """Get the interview video recording or snapshot metadata."""
-    from fastapi.responses import Response, JSONResponse
     interview = db.query(DBInterview).filter(DBInterview.interview_id == interview_id).first()
     if not interview or not interview.recording_video:
         raise HTTPException(status_code=404, detail="No video recording available")
 
-    # Check if it's snapshot metadata (JSON)
+    # Check if it's snapshot metadata (JSON) - the stored text is already JSON, serve it without re-encoding
     try:
-        meta = json.loads(interview.recording_video)
-        if meta.get("type") == "snapshots":
-            return JSONResponse(content=meta)
-    except (json.JSONDecodeError, TypeError):
+        meta = orjson.loads(interview.recording_video)
+        if isinstance(meta, dict) and meta.get("type") == "snapshots":
+            return Response(content=interview.recording_video, media_type="application/json")
+    except orjson.JSONDecodeError:
         pass
 
     # Legacy: serve video file
@@ -2267,7 +2775,6 @@ async def get_interview_video(interview_id: str, db: Session = Depends(get_db),
 @app.get("/api/admin/interviews/{interview_id}/snapshots/{index}")
 async def get_interview_snapshot(interview_id: str, index: int, db: Session = Depends(get_db), current_admin: DBAdmin = Depends(get_current_admin)):
     """Get a specific snapshot image."""
-    from fastapi.responses import Response
     interview = db.query(DBInterview).filter(DBInterview.interview_id == interview_id).first()
     if not interview or not interview.recording_video:
         raise HTTPException(status_code=404, detail="No snapshots available")
@@ -2291,22 +2798,27 @@ async def get_interview_snapshot(interview_id: str, index: int, db: Session = De
 # Candidate Endpoints - Application and Interview Access
 # ============================================================
 
-@app.get("/api/candidates/applications")
+# Generic candidate-facing status derived in SQL (don't expose AI evaluation details):
+# HR status if set, "under_review" once the AI has evaluated a pending application
+CANDIDATE_STATUS_EXPR = case(
+    (and_(DBApplication.hr_status == "pending", DBApplication.ai_status.in_(["approved", "rejected"])), "under_review"),
+    else_=func.coalesce(func.nullif(DBApplication.hr_status, ""), "pending")
+).label("status")
+
+
+@app.get("/api/candidates/applications")
 async def get_candidate_applications(
     email: str = Query(..., description="Candidate email address"),
     db: Session = Depends(get_db)
 ):
     """Get all applications for a candidate by email."""
-    if db is None:
-        db = next(get_db())
-    
     # Normalize email: trim whitespace and convert to lowercase for comparison
     email_normalized = email.strip().lower()
     
     logger.info(f"🔍 Searching for applications for email: {email_normalized}")
     
     # Use case-insensitive email comparison
-    candidate = db.query(DBCandidate).filter(func.lower(DBCandidate.email) == email_normalized).first()
+    candidate = db.query(DBCandidate).options(raiseload("*")).filter(func.lower(DBCandidate.email) == email_normalized).first()
     if not candidate:
         logger.warning(f"❌ Candidate not found for email: {email_normalized}")
         # Return empty list instead of 404 - candidate might not exist yet
@@ -2314,35 +2826,23 @@ async def get_candidate_applications(
     
     logger.info(f"✅ Found candidate: {candidate.full_name} (ID: {candidate.candidate_id})")
     
-    # Get all applications for this candidate
-    applications = db.query(DBApplication).filter(DBApplication.candidate_id == candidate.candidate_id).order_by(DBApplication.submitted_at.desc()).all()
+    # Get all applications for this candidate (job offers + interviews eager-loaded, N+1 guarded)
+    applications = db.query(DBApplication, CANDIDATE_STATUS_EXPR).options(
+        selectinload(DBApplication.job_offer),
+        selectinload(DBApplication.interviews),
+        raiseload("*")
+    ).filter(DBApplication.candidate_id == candidate.candidate_id).order_by(DBApplication.submitted_at.desc()).all()
     logger.info(f"📋 Found {len(applications)} applications for candidate")
     
     if not applications:
         return []
     
     result = []
-    for app in applications:
-        job_offer = db.query(DBJobOffer).filter(DBJobOffer.offer_id == app.job_offer_id).first()
+    for app, status in applications:
+        job_offer = app.job_offer
         
         # Check if there's an interview for this application
-        interview = db.query(DBInterview).filter(DBInterview.application_id == app.application_id).first()
-        
-        # Map AI status to a more generic status for candidates
-        # Don't expose AI evaluation details to candidates
-        # Use HR status if available, otherwise show "under_review" if AI has evaluated
-        if app.hr_status == "selected":
-            status = "selected"
-        elif app.hr_status == "rejected":
-            status = "rejected"
-        elif app.hr_status == "interview_sent":
-            status = "interview_sent"
-        elif app.hr_status == "pending" and app.ai_status in ["approved", "rejected"]:
-            status = "under_review"
-        elif app.hr_status:
-            status = app.hr_status
-        else:
-            status = "pending"
+        interview = app.interviews[0] if app.interviews else None
         
         result.append({
             "application_id": app.application_id,
@@ -2353,9 +2853,9 @@ async def get_candidate_applications(
             },
             "status": status,  # Generic status, not AI-specific
             "hr_status": app.hr_status,
-            "submitted_at": app.submitted_at.isoformat() if app.submitted_at else None,
-            "interview_invited_at": app.interview_invited_at.isoformat() if app.interview_invited_at else None,
-            "interview_completed_at": app.interview_completed_at.isoformat() if app.interview_completed_at else None,
+            "submitted_at": app.submitted_at,
+            "interview_invited_at": app.interview_invited_at,
+            "interview_completed_at": app.interview_completed_at,
             "interview_recommendation": app.interview_recommendation,
             "has_interview": interview is not None,
             "interview_id": interview.interview_id if interview else None,
@@ -2371,58 +2871,48 @@ async def get_candidate_interviews(
     db: Session = Depends(get_db)
 ):
     """Get all interviews for a candidate by email."""
-    if db is None:
-        db = next(get_db())
-    
     # Normalize email: trim whitespace and convert to lowercase for comparison
     email_normalized = email.strip().lower()
     
     logger.info(f"🔍 Searching for interviews for email: {email_normalized}")
     
-    # Use case-insensitive email comparison
-    candidate = db.query(DBCandidate).filter(func.lower(DBCandidate.email) == email_normalized).first()
-    if not candidate:
-        logger.warning(f"❌ Candidate not found for email: {email_normalized}")
-        # Return empty list instead of 404 - candidate might not exist yet
-        return []
-    
-    logger.info(f"✅ Found candidate: {candidate.full_name} (ID: {candidate.candidate_id})")
-    
-    # Get all applications for this candidate
-    applications = db.query(DBApplication).filter(DBApplication.candidate_id == candidate.candidate_id).all()
-    logger.info(f"📋 Found {len(applications)} applications for candidate")
-    
-    if not applications:
-        return []
-    
-    application_ids = [app.application_id for app in applications]
-    logger.info(f"📋 Application IDs: {application_ids}")
-    
-    # Get all interviews for these applications
-    interviews = db.query(DBInterview).filter(DBInterview.application_id.in_(application_ids)).all()
-    logger.info(f"🎤 Found {len(interviews)} interviews for applications")
-    
-    if not interviews:
-        return []
+    # Single round-trip: interviews joined to their application, candidate (case-insensitive
+    # email match) and job offer - only the columns the response needs
+    rows = db.query(
+        DBInterview.interview_id,
+        DBInterview.application_id,
+        DBInterview.status,
+        DBInterview.recommendation,
+        DBInterview.created_at,
+        DBInterview.completed_at,
+        DBApplication.interview_invited_at,
+        DBJobOffer.offer_id,
+        DBJobOffer.title,
+        DBJobOffer.interview_mode
+    ).join(
+        DBApplication, DBInterview.application_id == DBApplication.application_id
+    ).join(
+        DBCandidate, DBApplication.candidate_id == DBCandidate.candidate_id
+    ).outerjoin(
+        DBJobOffer, DBInterview.job_offer_id == DBJobOffer.offer_id
+    ).filter(func.lower(DBCandidate.email) == email_normalized).all()
+    logger.info(f"🎤 Found {len(rows)} interviews for {email_normalized}")
     
     result = []
-    for interview in interviews:
-        application = db.query(DBApplication).filter(DBApplication.application_id == interview.application_id).first()
-        job_offer = db.query(DBJobOffer).filter(DBJobOffer.offer_id == interview.job_offer_id).first()
-        
+    for row in rows:
         result.append({
-            "interview_id": interview.interview_id,
-            "application_id": interview.application_id,
+            "interview_id": row.interview_id,
+            "application_id": row.application_id,
             "job_offer": {
-                "offer_id": job_offer.offer_id if job_offer else None,
-                "title": job_offer.title if job_offer else "Unknown",
-                "interview_mode": job_offer.interview_mode if job_offer else "realtime"
+                "offer_id": row.offer_id,
+                "title": row.title if row.offer_id else "Unknown",
+                "interview_mode": row.interview_mode if row.offer_id else "realtime"
             },
-            "status": interview.status,
-            "recommendation": interview.recommendation,
-            "created_at": interview.created_at.isoformat() if interview.created_at else None,
-            "completed_at": interview.completed_at.isoformat() if interview.completed_at else None,
-            "interview_invited_at": application.interview_invited_at.isoformat() if application and application.interview_invited_at else None
+            "status": row.status,
+            "recommendation": row.recommendation,
+            "created_at": row.created_at,
+            "completed_at": row.completed_at,
+            "interview_invited_at": row.interview_invited_at
         })
     
     return result
@@ -2435,9 +2925,6 @@ async def get_candidate_interview_details(
     db: Session = Depends(get_db)
 ):
     """Get interview details for a candidate (with email verification)."""
-    if db is None:
-        db = next(get_db())
-    
     interview = db.query(DBInterview).filter(DBInterview.interview_id == interview_id).first()
     if not interview:
         raise HTTPException(status_code=404, detail="Interview not found")
@@ -2468,11 +2955,11 @@ async def get_candidate_interview_details(
         "status": interview.status,
         "recommendation": interview.recommendation,
         "assessment": interview.assessment,
-        "conversation_history": interview.conversation_history,
+        "conversation_history": _interview_conversation(interview)[0] if interview.status == "in_progress" else interview.conversation_history,
         "cv_text": application.cv_text,  # Include CV text for interview context
-        "created_at": interview.created_at.isoformat() if interview.created_at else None,
-        "completed_at": interview.completed_at.isoformat() if interview.completed_at else None,
-        "interview_invited_at": application.interview_invited_at.isoformat() if application.interview_invited_at else None
+        "created_at": interview.created_at,
+        "completed_at": interview.completed_at,
+        "interview_invited_at": application.interview_invited_at
     }
 
 
@@ -2491,81 +2978,371 @@ class AsyncInterviewStartRequest(BaseModel):
     llm_model: str = ""
 
 
-class AsyncInterviewAnswerRequest(BaseModel):
+class AsyncInterviewRecordingRequest(BaseModel):
     interview_id: str
     email: str
-    audio: str  # Base64 encoded audio
-    question_number: int
+    user_audio: str = ""  # Base64 encoded user audio (continuous recording); AI audio is rebuilt server-side
+
+
+# The job offer part of an interview context is the same for every candidate - it is built once per
+# (offer_id, updated_at), so an edited offer gets a new entry and the old one ages out
+JOB_OFFER_CONTEXT_CACHE_MAX = 256
+_job_offer_context_cache: dict = {}
+
+
+def _job_offer_context(job_offer) -> dict:
+    """Job-offer-level interview context, cached per offer version."""
+    key = (job_offer.offer_id, job_offer.updated_at)
+    context = _job_offer_context_cache.get(key)
+    if context is None:
+        context = {
+            "job_title": job_offer.title,
+            "job_offer_description": job_offer.description,
+            "required_languages": job_offer.required_languages,
+            "interview_start_language": job_offer.interview_start_language or "English",
+            "required_languages_list": job_offer.required_languages_list or [],  # Parsed when the offer was saved
+            "custom_questions": job_offer.custom_questions,
+            "evaluation_weights": job_offer.evaluation_weights
+        }
+        if len(_job_offer_context_cache) >= JOB_OFFER_CONTEXT_CACHE_MAX:
+            _job_offer_context_cache.pop(next(iter(_job_offer_context_cache)), None)
+        _job_offer_context_cache[key] = context
+    return context
 
 
-class AsyncInterviewRecordingRequest(BaseModel):
-    interview_id: str
-    email: str
-    user_audio: str  # Base64 encoded user audio (continuous recording)
-    ai_audio_chunks: list  # List of AI audio chunks with timestamps: [{"audio": base64, "format": "mp3", "timestamp": ms}]
+def _build_async_interview_context(job_offer, application) -> dict:
+    """Build the LLM interview context for an async interview from its job offer and application."""
+    return {**_job_offer_context(job_offer), "candidate_cv_text": application.cv_text}
+
+
+def _load_async_interview_context(interview, job_offer, application) -> dict:
+    """Interview context stored at start (rebuilt for interviews started before it was stored)."""
+    if interview.cached_context:
+        try:
+            return orjson.loads(interview.cached_context)
+        except (json.JSONDecodeError, TypeError):
+            pass
+    return _build_async_interview_context(job_offer, application)
+
+
+# Static async interview state (context, providers, access) is cached for the length of an interview
+ASYNC_INTERVIEW_CACHE_TTL = 7200
+
+
+async def _cache_async_interview_state(interview_id: str, state: dict):
+    await cache_set(f"interview:{interview_id}:ctx", orjson.dumps(state), ASYNC_INTERVIEW_CACHE_TTL)
+
+
+async def _get_async_interview_state(interview_id: str):
+    """Cached static state of an async interview, or None on a miss."""
+    cached = await cache_get(f"interview:{interview_id}:ctx")
+    return orjson.loads(cached) if cached else None
+
+
+def _assessment_digest(model_id: str, conversation_history: list, interview_context: dict) -> str:
+    """Content hash of an assessment request - the same conversation and context give the same digest."""
+    payload = orjson.dumps([model_id, conversation_history, interview_context], option=orjson.OPT_SORT_KEYS, default=str)
+    return hashlib.sha256(payload).hexdigest()
+
+
+def _generate_assessment_cached(db_bg, generate_assessment, conversation_history: list, model_id: str, interview_context: dict):
+    """
+    Generate an interview assessment, reusing a stored one for identical content.
+    
+    Replayed end/submit events and retries hash to the same digest, so they are served
+    from interviews.assessment_hash instead of paying for another LLM call.
+    Returns (assessment, digest) - store the digest with the assessment.
+    """
+    digest = _assessment_digest(model_id, conversation_history, interview_context)
+    cached = db_bg.execute(
+        select(DBInterview.assessment).where(
+            DBInterview.assessment_hash == digest,
+            DBInterview.assessment.isnot(None)
+        ).limit(1)
+    ).scalar_one_or_none()
+    if cached:
+        logger.debug("Reusing stored assessment for identical content (%s)", digest[:12])
+        return cached, digest
+    
+    assessment = generate_assessment(
+        conversation_history=conversation_history,
+        model_id=model_id,
+        interview_context=interview_context,
+    )
+    return assessment, digest
+
+
+# Interviews whose background assessment never finished (e.g. the server restarted mid-call) are
+# picked up by a periodic sweep that assesses them in batches - one LLM call per K interviews of the
+# same job offer and model, so the assessment instructions are paid for once per batch
+ASSESSMENT_SWEEP_INTERVAL = int(os.getenv("ASSESSMENT_SWEEP_INTERVAL", str(24 * 3600)))  # 0 disables the sweep
+ASSESSMENT_STALE_AFTER = timedelta(minutes=30)
+# The running sweep loop (set at startup)
+assessment_sweep_task: Optional[asyncio.Task] = None
+ASSESSMENT_BATCH_SIZE = int(os.getenv("ASSESSMENT_BATCH_SIZE", "3"))
+ASSESSMENT_BATCH_MAX_CHARS = int(os.getenv("ASSESSMENT_BATCH_MAX_CHARS", "60000"))  # Transcript budget per call (~15k tokens)
+
+
+def _store_swept_assessment(db_bg, interview_id: str, application_id: Optional[str], assessment: str, digest: str):
+    """Persist an assessment produced by the sweep on the interview and its application."""
+    recommendation = extract_recommendation(assessment)
+    db_bg.execute(
+        update(DBInterview).where(DBInterview.interview_id == interview_id).values(
+            assessment=assessment,
+            assessment_hash=digest,
+            assessment_status="ready",
+            recommendation=recommendation,
+            evaluation_scores=orjson.dumps(extract_detailed_scores(assessment)).decode()
+        ).execution_options(synchronize_session=False)
+    )
+    if application_id:
+        db_bg.execute(
+            update(DBApplication).where(DBApplication.application_id == application_id).values(
+                interview_assessment=assessment,
+                interview_recommendation=recommendation,
+                updated_at=_utc_now()
+            ).execution_options(synchronize_session=False)
+        )
+    db_bg.commit()
+
+
+def sweep_pending_assessments():
+    """
+    Assess interviews whose assessment has been pending for longer than ASSESSMENT_STALE_AFTER.
+    
+    Only asynchronous interviews are swept - the language assessor used here is theirs. Real-time
+    interviews are only pending while an admin-triggered regeneration (a different assessor) runs.
+    
+    Interviews are grouped by (job_offer_id, model) so every interview in a batch shares
+    the same instructions and job context. Oversized transcripts, single leftovers and
+    interviews missing from a batch answer fall back to the one-call path.
+    """
+    db_bg = SessionLocal()
+    try:
+        rows = db_bg.query(
+            DBInterview.interview_id,
+            DBInterview.application_id,
+            DBInterview.job_offer_id,
+            DBInterview.candidate_name,
+            DBInterview.conversation_history,
+            DBInterview.cached_context,
+            DBInterview.provider_preferences
+        ).join(
+            DBJobOffer, DBInterview.job_offer_id == DBJobOffer.offer_id
+        ).filter(
+            DBJobOffer.interview_mode == "asynchronous",
+            DBInterview.assessment_status == "pending",
+            DBInterview.completed_at < _utc_now() - ASSESSMENT_STALE_AFTER
+        ).all()
+        if not rows:
+            return
+        logger.info(f"🧹 Sweeping {len(rows)} pending assessments")
+
+        groups = {}
+        for row in rows:
+            if not row.conversation_history:
+                continue
+            provider_preferences = {}
+            if row.provider_preferences:
+                try:
+                    provider_preferences = orjson.loads(row.provider_preferences)
+                except orjson.JSONDecodeError:
+                    pass
+            model_id = provider_preferences.get("llm_model") or LLM_PROVIDERS["openai"]["default_model"]
+            groups.setdefault((row.job_offer_id, model_id), []).append(row)
+
+        for (job_offer_id, model_id), group in groups.items():
+            job_offer = db_bg.query(DBJobOffer.title, DBJobOffer.required_languages).filter(
+                DBJobOffer.offer_id == job_offer_id
+            ).first()
+            job_context = {
+                "job_title": job_offer.title if job_offer else None,
+                "required_languages": job_offer.required_languages if job_offer else None
+            }
+
+            # Digests are computed like the single-call path, so identical content is never re-assessed
+            pending = []
+            for row in group:
+                interview_context = job_context
+                if row.cached_context:
+                    try:
+                        interview_context = orjson.loads(row.cached_context)
+                    except orjson.JSONDecodeError:
+                        pass
+                pending.append((row, interview_context, _assessment_digest(model_id, row.conversation_history, interview_context)))
+
+            stored = dict(db_bg.execute(
+                select(DBInterview.assessment_hash, DBInterview.assessment).where(
+                    DBInterview.assessment_hash.in_([digest for _, _, digest in pending]),
+                    DBInterview.assessment.isnot(None)
+                )
+            ).all())
+
+            chunks, singles = [], []
+            chunk, chunk_chars = [], 0
+            for item in pending:
+                row, interview_context, digest = item
+                if digest in stored:
+                    _store_swept_assessment(db_bg, row.interview_id, row.application_id, stored[digest], digest)
+                    continue
+                chars = sum(len(msg.get("content") or "") for msg in row.conversation_history)
+                if chars > ASSESSMENT_BATCH_MAX_CHARS:
+                    singles.append(item)
+                    continue
+                if chunk and (len(chunk) >= ASSESSMENT_BATCH_SIZE or chunk_chars + chars > ASSESSMENT_BATCH_MAX_CHARS):
+                    chunks.append(chunk)
+                    chunk, chunk_chars = [], 0
+                chunk.append(item)
+                chunk_chars += chars
+            if chunk:
+                chunks.append(chunk)
+
+            for chunk in chunks:
+                if len(chunk) == 1:
+                    singles.extend(chunk)
+                    continue
+                try:
+                    assessments = llm_generate_assessments_batch(
+                        [{
+                            "interview_id": row.interview_id,
+                            "conversation_history": row.conversation_history,
+                            "candidate_name": row.candidate_name,
+                            "tested_languages": interview_context.get("tested_languages")
+                        } for row, interview_context, _ in chunk],
+                        model_id=model_id,
+                        interview_context=job_context
+                    )
+                except Exception as e:
+                    logger.error(f"❌ Batch assessment failed for job offer {job_offer_id}: {e}")
+                    assessments = {}
+                for item in chunk:
+                    row, _, digest = item
+                    if row.interview_id in assessments:
+                        _store_swept_assessment(db_bg, row.interview_id, row.application_id, assessments[row.interview_id], digest)
+                    else:
+                        singles.append(item)
+
+            for row, interview_context, digest in singles:
+                try:
+                    assessment = llm_generate_assessment(
+                        conversation_history=row.conversation_history,
+                        model_id=model_id,
+                        interview_context=interview_context
+                    )
+                    _store_swept_assessment(db_bg, row.interview_id, row.application_id, assessment, digest)
+                except Exception as e:
+                    logger.error(f"❌ Assessment sweep failed for interview {row.interview_id}: {e}")
+                    db_bg.rollback()
+        logger.info(f"✅ Assessment sweep finished ({len(rows)} interviews)")
+    finally:
+        db_bg.close()
+
+
+async def _assessment_sweep_loop():
+    while True:
+        try:
+            await asyncio.get_running_loop().run_in_executor(assessment_executor, sweep_pending_assessments)
+        except Exception as e:
+            logger.error(f"❌ Assessment sweep error: {e}")
+        await asyncio.sleep(ASSESSMENT_SWEEP_INTERVAL)
+
+
+async def load_interview_bundle(db: AsyncSession, interview_id: str):
+    """
+    Load an interview with its application, candidate and job offer in one query.
+    
+    Returns (interview, application, candidate, job_offer); related rows are None
+    if missing and everything is None if the interview doesn't exist.
+    """
+    result = await db.execute(
+        select(DBInterview, DBApplication, DBCandidate, DBJobOffer).outerjoin(
+            DBApplication, DBInterview.application_id == DBApplication.application_id
+        ).outerjoin(
+            DBCandidate, DBApplication.candidate_id == DBCandidate.candidate_id
+        ).outerjoin(
+            DBJobOffer, DBInterview.job_offer_id == DBJobOffer.offer_id
+        ).where(DBInterview.interview_id == interview_id)
+    )
+    row = result.one_or_none()
+    return tuple(row) if row else (None, None, None, None)
+
+
+async def verify_interview_access(db: AsyncSession, interview_id: str, email: str, *columns):
+    """
+    Check that email belongs to the interview's candidate without loading the full rows.
+    
+    Selects the candidate email plus the requested interview columns only, for endpoints
+    that don't need the application/job offer (no cv_text or job description transfer).
+    Raises 404 if the interview doesn't exist and 403 if the email doesn't match.
+    """
+    result = await db.execute(
+        select(DBCandidate.email.label("candidate_email"), *columns).select_from(DBInterview).outerjoin(
+            DBApplication, DBInterview.application_id == DBApplication.application_id
+        ).outerjoin(
+            DBCandidate, DBApplication.candidate_id == DBCandidate.candidate_id
+        ).where(DBInterview.interview_id == interview_id)
+    )
+    row = result.one_or_none()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Interview not found")
+    if row.candidate_email != email:
+        raise HTTPException(status_code=403, detail="Access denied. Email does not match interview candidate.")
+    return row
 
 
 @app.post("/api/candidates/interviews/{interview_id}/async/start")
 async def start_async_interview(
     interview_id: str,
     request: AsyncInterviewStartRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Start an asynchronous interview - returns the first question."""
-    if db is None:
-        db = next(get_db())
-    
     # Verify interview exists and email matches
-    interview = db.query(DBInterview).filter(DBInterview.interview_id == interview_id).first()
+    interview, application, candidate, job_offer = await load_interview_bundle(db, interview_id)
     if not interview:
         raise HTTPException(status_code=404, detail="Interview not found")
     
-    application = db.query(DBApplication).filter(DBApplication.application_id == interview.application_id).first()
     if not application:
         raise HTTPException(status_code=404, detail="Application not found")
     
-    candidate = db.query(DBCandidate).filter(DBCandidate.candidate_id == application.candidate_id).first()
     if not candidate:
         raise HTTPException(status_code=404, detail="Candidate not found")
     
     if candidate.email != request.email:
         raise HTTPException(status_code=403, detail="Access denied. Email does not match interview candidate.")
     
-    # Check interview mode
-    job_offer = db.query(DBJobOffer).filter(DBJobOffer.offer_id == interview.job_offer_id).first()
     if not job_offer:
         raise HTTPException(status_code=404, detail="Job offer not found")
     
     if job_offer.interview_mode != "asynchronous":
         raise HTTPException(status_code=400, detail="This interview is not in asynchronous mode")
     
-    # Allow resuming in_progress interviews or starting new ones even if previous ones are completed
-    # Multiple interview attempts are allowed per application
+    # Pending interviews start fresh and in_progress ones resume; completed or cancelled
+    # interviews are rejected by the guarded UPDATE below (409)
     
     # If interview is in_progress, resume it (get current question from conversation)
     if interview.status == "in_progress" and interview.conversation_history:
-        try:
-            conversation_history = json.loads(interview.conversation_history)
-            # Find the last assistant message (question)
-            last_question = None
-            for msg in reversed(conversation_history):
-                if msg.get("role") == "assistant":
-                    last_question = msg.get("content")
-                    break
-            
-            if last_question:
-                # Return the current question
-                return {
-                    "interview_id": interview_id,
-                    "question_number": sum(1 for m in conversation_history if m.get("role") == "assistant"),
-                    "question_text": last_question,
-                    "question_audio": "",  # No audio for resumed interviews
-                    "audio_format": "mp3",
-                    "status": "in_progress",
-                    "resumed": True
-                }
-        except:
-            pass  # If parsing fails, start fresh
+        # One pass picks up both the last assistant message (question) and the question count
+        conversation_history, _ = await asyncio.to_thread(_interview_conversation, interview)
+        last_question = None
+        question_number = 0
+        for msg in conversation_history:
+            if msg.get("role") == "assistant":
+                question_number += 1
+                last_question = msg.get("content")
+        
+        if last_question:
+            # Return the current question
+            return {
+                "interview_id": interview_id,
+                "question_number": question_number,
+                "question_text": last_question,
+                "question_audio": "",  # Audio is streamed from question_audio_url
+                "question_audio_url": _question_audio_url(interview_id, question_number, request.email),
+                "audio_format": "mp3",
+                "status": "in_progress",
+                "resumed": True
+            }
     
     # Get providers
     tts_provider = request.tts_provider or DEFAULT_TTS_PROVIDER
@@ -2579,48 +3356,22 @@ async def start_async_interview(
     stt_model = request.stt_model or STT_PROVIDERS[stt_provider]["default_model"]
     llm_model = request.llm_model or LLM_PROVIDERS[llm_provider]["default_model"]
     
-    # Build interview context
-    from backend.config import build_interviewer_system_prompt
-    import json
-    
-    required_languages_list = []
-    if job_offer.required_languages:
-        try:
-            required_languages_list = json.loads(job_offer.required_languages)
-        except:
-            pass
-    
-    interview_context = {
-        "job_title": job_offer.title,
-        "job_offer_description": job_offer.description,
-        "candidate_cv_text": application.cv_text,
-        "required_languages": job_offer.required_languages,
-        "interview_start_language": job_offer.interview_start_language or "English",
-        "required_languages_list": required_languages_list,
-        "custom_questions": job_offer.custom_questions,
-        "evaluation_weights": job_offer.evaluation_weights
-    }
+    # Build interview context (stored on the interview - it doesn't change between turns)
+    interview_context = _build_async_interview_context(job_offer, application)
     
-    # Generate opening greeting/question (with retry on quota)
+    # Generate opening greeting/question (with retry on quota) - off the event loop, the
+    # blocking LLM call and its retry sleeps would stall every other request meanwhile
     llm_funcs = get_llm_functions(llm_provider)
-    greeting = _retry_on_quota(
+    greeting = await asyncio.to_thread(
+        _retry_on_quota,
         llm_funcs["generate_opening_greeting"],
         model_id=llm_model,
         interview_context=interview_context,
         candidate_name=candidate.full_name
     )
     
-    # Generate audio for greeting (with TTS fallback)
-    audio_base64 = ""
-    tts_fallback = False
-    try:
-        tts_func = get_tts_function(tts_provider)
-        audio_data = tts_func(greeting, model_id=tts_model, voice_id=None)
-        audio_base64 = base64.b64encode(audio_data).decode('utf-8')
-    except Exception as tts_err:
-        logger.warning(f"⚠️ TTS failed for async greeting (will use browser fallback): {tts_err}")
-        tts_fallback = True
-
+    # Greeting audio is not synthesized here - the client streams it from
+    # question_audio_url, which stores the audio once the stream completes
     # Initialize conversation history
     conversation_history = [
         {"role": "assistant", "content": greeting}
@@ -2636,23 +3387,47 @@ async def start_async_interview(
         "llm_model": llm_model
     }
 
-    # Initialize audio segments with first question
-    audio_segments = [{
+    # Claim the interview in one guarded UPDATE: the row must not have a conversation yet,
+    # so a concurrent start that already stored its greeting makes this one a no-op
+    session_log_path = _session_log_key(interview_id)
+    claimed = await db.execute(
+        update(DBInterview)
+        .where(
+            DBInterview.interview_id == interview_id,
+            DBInterview.status.in_(["pending", "in_progress"]),
+            or_(DBInterview.status == "pending", DBInterview.conversation_history.is_(None))
+        )
+        .values(
+            status="in_progress",
+            conversation_history=conversation_history,
+            provider_preferences=orjson.dumps(provider_preferences).decode(),
+            session_log_path=session_log_path,
+            audio_segments=None,
+            cached_context=orjson.dumps(interview_context).decode()
+        )
+        .returning(DBInterview.interview_id)
+        .execution_options(synchronize_session=False)
+    )
+    if claimed.scalar_one_or_none() is None:
+        await db.rollback()
+        raise HTTPException(status_code=409, detail="Interview was already started or is no longer available")
+    await db.commit()
+    await _invalidate_admin_caches()
+
+    # Start the session log with the first question (audio_key is appended by the question-audio stream)
+    await asyncio.to_thread(session_log_start, _session_log_file(session_log_path), [{
         "type": "question",
         "question_number": 1,
-        "audio": audio_base64,
         "format": "mp3",
         "text": greeting,
-        "timestamp": datetime.now().isoformat()
-    }]
-
-    # Update interview status, conversation, and provider preferences
-    interview.status = "in_progress"
-    interview.conversation_history = json.dumps(conversation_history)
-    interview.provider_preferences = json.dumps(provider_preferences)
-    if hasattr(interview, 'audio_segments'):
-        interview.audio_segments = json.dumps(audio_segments)
-    db.commit()
+        "timestamp": datetime.now()
+    }, {"type": "message", "role": "assistant", "content": greeting}])
+    await _cache_async_interview_state(interview_id, {
+        "candidate_email": candidate.email,
+        "application_id": application.application_id,
+        "providers": provider_preferences,
+        "context": interview_context
+    })
 
     logger.info(f"🎤 Started asynchronous interview: {interview_id} with providers: {llm_provider}/{llm_model}")
 
@@ -2660,9 +3435,10 @@ async def start_async_interview(
         "interview_id": interview_id,
         "question_number": 1,
         "question_text": greeting,
-        "question_audio": audio_base64,
+        "question_audio": "",
+        "question_audio_url": _question_audio_url(interview_id, 1, request.email),
         "audio_format": "mp3",
-        "tts_fallback": tts_fallback,
+        "tts_fallback": False,
         "status": "in_progress"
     }
 
@@ -2670,66 +3446,82 @@ async def start_async_interview(
 @app.post("/api/candidates/interviews/{interview_id}/async/submit-answer")
 async def submit_async_answer(
     interview_id: str,
-    request: AsyncInterviewAnswerRequest,
-    db: Session = Depends(get_db)
+    email: str = Form(...),
+    question_number: int = Form(...),
+    audio: UploadFile = File(...),  # Raw recorded answer (webm)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Submit an answer in asynchronous interview - returns next question or assessment."""
-    if db is None:
-        db = next(get_db())
-    
-    # Verify interview exists and email matches
-    interview = db.query(DBInterview).filter(DBInterview.interview_id == interview_id).first()
-    if not interview:
-        raise HTTPException(status_code=404, detail="Interview not found")
-    
-    application = db.query(DBApplication).filter(DBApplication.application_id == interview.application_id).first()
-    if not application:
-        raise HTTPException(status_code=404, detail="Application not found")
-    
-    candidate = db.query(DBCandidate).filter(DBCandidate.candidate_id == application.candidate_id).first()
-    if not candidate:
-        raise HTTPException(status_code=404, detail="Candidate not found")
-    
-    if candidate.email != request.email:
-        raise HTTPException(status_code=403, detail="Access denied. Email does not match interview candidate.")
+    # Static per-interview state is cached at start - on a hit only the mutable interview columns are read
+    cached_state = await _get_async_interview_state(interview_id)
+    if cached_state:
+        if cached_state["candidate_email"] != email:
+            raise HTTPException(status_code=403, detail="Access denied. Email does not match interview candidate.")
+        
+        result = await db.execute(
+            select(
+                DBInterview.status,
+                DBInterview.conversation_history,
+                DBInterview.session_log_path,
+                DBInterview.audio_segments
+            ).where(DBInterview.interview_id == interview_id)
+        )
+        interview = result.one_or_none()
+        if not interview:
+            raise HTTPException(status_code=404, detail="Interview not found")
+        
+        application_id = cached_state["application_id"]
+        provider_preferences = cached_state["providers"]
+        interview_context = cached_state["context"]
+    else:
+        # Verify interview exists and email matches
+        interview, application, candidate, job_offer = await load_interview_bundle(db, interview_id)
+        if not interview:
+            raise HTTPException(status_code=404, detail="Interview not found")
+        
+        if not application:
+            raise HTTPException(status_code=404, detail="Application not found")
+        
+        if not candidate:
+            raise HTTPException(status_code=404, detail="Candidate not found")
+        
+        if candidate.email != email:
+            raise HTTPException(status_code=403, detail="Access denied. Email does not match interview candidate.")
+        
+        if not job_offer:
+            raise HTTPException(status_code=404, detail="Job offer not found")
+        
+        if job_offer.interview_mode != "asynchronous":
+            raise HTTPException(status_code=400, detail="This interview is not in asynchronous mode")
+        
+        application_id = application.application_id
+        
+        # Get providers from stored preferences or use defaults
+        provider_preferences = {}
+        if interview.provider_preferences:
+            try:
+                provider_preferences = orjson.loads(interview.provider_preferences)
+            except orjson.JSONDecodeError:
+                provider_preferences = {}
+        
+        # Interview context was materialized at start
+        interview_context = _load_async_interview_context(interview, job_offer, application)
     
     if interview.status not in ["in_progress", "pending"]:
         raise HTTPException(status_code=400, detail="Interview is not in progress")
     
-    # Get job offer and check mode
-    job_offer = db.query(DBJobOffer).filter(DBJobOffer.offer_id == interview.job_offer_id).first()
-    if not job_offer:
-        raise HTTPException(status_code=404, detail="Job offer not found")
-    
-    if job_offer.interview_mode != "asynchronous":
-        raise HTTPException(status_code=400, detail="This interview is not in asynchronous mode")
-    
-    # Decode audio
-    try:
-        audio_bytes = base64.b64decode(request.audio)
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Invalid audio data: {str(e)}")
+    # Everything below works from the loaded rows - give the pooled connection back while
+    # STT/LLM/TTS run (seconds per turn) and write with a short UPDATE at the end
+    await db.close()
     
-    # Get conversation history
-    conversation_history = []
-    if interview.conversation_history:
-        try:
-            conversation_history = json.loads(interview.conversation_history)
-        except:
-            conversation_history = []
+    # Read the uploaded answer audio (sent as a binary multipart file, not base64 JSON)
+    audio_bytes = await audio.read()
+    if not audio_bytes:
+        raise HTTPException(status_code=400, detail="Invalid audio data: empty file")
     
-    # Get providers from stored preferences or use defaults
-    provider_preferences = {}
-    try:
-        # Handle case where column might not exist yet (for old interviews)
-        if hasattr(interview, 'provider_preferences') and interview.provider_preferences:
-            try:
-                provider_preferences = json.loads(interview.provider_preferences)
-            except:
-                provider_preferences = {}
-    except AttributeError:
-        # Column doesn't exist in database yet
-        provider_preferences = {}
+    # Get conversation history - rebuilt from the session log (a fresh list, since this turn appends to it).
+    # Turns only append message lines there instead of rewriting the whole history column
+    conversation_history, history_logged = await asyncio.to_thread(_interview_conversation, interview)
     
     tts_provider = provider_preferences.get("tts_provider") or DEFAULT_TTS_PROVIDER
     tts_model = provider_preferences.get("tts_model") or TTS_PROVIDERS[tts_provider]["default_model"]
@@ -2743,23 +3535,24 @@ async def submit_async_answer(
     
     # Speech to Text — determine current language from conversation for accurate STT
     # Start with interview_start_language, but update based on detected language switches
-    stt_lang = job_offer.interview_start_language or "English"
-    lang_keywords = {
-        "French": ["français", "francais", "french", "en français", "continuons en français"],
-        "English": ["english", "anglais", "in english", "let's continue in english", "continue in english"],
-        "Arabic": ["arabic", "arabe", "en arabe", "بالعربية"],
-        "Spanish": ["spanish", "espagnol", "español", "en español"],
-        "German": ["german", "allemand", "deutsch", "auf deutsch"]
-    }
-    for msg in conversation_history:
-        if msg["role"] == "assistant":
-            content_lower = msg["content"].lower()
-            for lang, keywords in lang_keywords.items():
-                if any(keyword in content_lower for keyword in keywords) and stt_lang != lang:
-                    stt_lang = lang
+    stt_lang = interview_context.get("interview_start_language") or "English"
+    # Languages mentioned by each question, scanned once and reused for the tested-languages tracking below
+    question_languages = [
+        mentioned_languages(msg["content"].lower()) for msg in conversation_history if msg["role"] == "assistant"
+    ]
+    for langs in question_languages:
+        for lang in LANGUAGE_KEYWORDS:
+            if lang in langs and stt_lang != lang:
+                stt_lang = lang
     stt_lang_code = get_language_code(stt_lang)
     stt_func = get_stt_function(stt_provider)
-    user_text = stt_func(audio_bytes, model_id=stt_model, language_code=stt_lang_code or None)
+    
+    # Transcribe off the event loop while the answer audio goes to object storage
+    # (the session log only keeps its key) - neither blocks other requests on this worker
+    answer_audio_key, user_text = await asyncio.gather(
+        asyncio.to_thread(_store_interview_audio, interview_id, f"a{question_number}.webm", audio_bytes, "audio/webm"),
+        asyncio.to_thread(stt_func, audio_bytes, model_id=stt_model, language_code=stt_lang_code or None)
+    )
     
     if not user_text.strip():
         raise HTTPException(status_code=400, detail="Could not transcribe audio. Please try again.")
@@ -2767,27 +3560,7 @@ async def submit_async_answer(
     # Add user response to conversation
     conversation_history.append({"role": "user", "content": user_text})
     
-    # Build interview context
-    from backend.config import build_interviewer_system_prompt
-    import json as json_module
-    
-    required_languages_list = []
-    if job_offer.required_languages:
-        try:
-            required_languages_list = json_module.loads(job_offer.required_languages)
-        except:
-            pass
-    
-    interview_context = {
-        "job_title": job_offer.title,
-        "job_offer_description": job_offer.description,
-        "candidate_cv_text": application.cv_text,
-        "required_languages": job_offer.required_languages,
-        "interview_start_language": job_offer.interview_start_language or "English",
-        "required_languages_list": required_languages_list,
-        "custom_questions": job_offer.custom_questions,
-        "evaluation_weights": job_offer.evaluation_weights
-    }
+    required_languages_list = interview_context.get("required_languages_list") or []
     
     try:
         # Check if we should generate assessment (after a reasonable number of questions)
@@ -2802,27 +3575,17 @@ async def submit_async_answer(
         current_language = start_language
         consecutive_language_questions = 0
         
-        lang_keywords = {
-            "French": ["français", "francais", "french", "en français", "continuons en français"],
-            "English": ["english", "anglais", "in english", "let's continue in english"],
-            "Arabic": ["arabic", "arabe", "en arabe", "بالعربية"],
-            "Spanish": ["spanish", "espagnol", "español", "en español"],
-            "German": ["german", "allemand", "deutsch", "auf deutsch"]
-        }
-        
-        for msg in conversation_history:
-            if msg["role"] == "assistant":
-                content_lower = msg["content"].lower()
-                switched = False
-                for lang, keywords in lang_keywords.items():
-                    if any(keyword in content_lower for keyword in keywords) and current_language != lang:
-                        tested_languages.add(lang)
-                        current_language = lang
-                        consecutive_language_questions = 1
-                        switched = True
-                        break
-                if not switched:
-                    consecutive_language_questions += 1
+        for langs in question_languages:
+            switched = False
+            for lang in LANGUAGE_KEYWORDS:
+                if lang in langs and current_language != lang:
+                    tested_languages.add(lang)
+                    current_language = lang
+                    consecutive_language_questions = 1
+                    switched = True
+                    break
+            if not switched:
+                consecutive_language_questions += 1
                     
         all_languages_tested = True
         if required_languages_list:
@@ -2843,38 +3606,44 @@ async def submit_async_answer(
             should_end = question_count >= 10  # absolute maximum questions
         
         if should_end:
-            # Save final answer audio segment
-            audio_segments = []
-            if hasattr(interview, 'audio_segments') and interview.audio_segments:
-                try:
-                    audio_segments = json.loads(interview.audio_segments)
-                except:
-                    audio_segments = []
-
             # Save candidate's final answer audio
-            audio_segments.append({
+            new_segments = [{
                 "type": "answer",
-                "question_number": request.question_number,
-                "audio": request.audio,  # User's answer audio (webm)
+                "question_number": question_number,
+                "audio_key": answer_audio_key,  # User's answer audio (webm)
                 "format": "webm",
                 "text": user_text,
-                "timestamp": datetime.now().isoformat()
-            })
+                "timestamp": datetime.now()
+            }]
+            if history_logged:
+                new_segments.append({"type": "message", "role": "user", "content": user_text})
 
             # Mark as completed immediately so candidate gets instant feedback
-            interview.status = "completed"
-            interview.completed_at = datetime.now()
-            interview.conversation_history = json.dumps(conversation_history)
-            if hasattr(interview, 'audio_segments'):
-                interview.audio_segments = json.dumps(audio_segments)
-            application.interview_completed_at = datetime.now()
-            db.commit()
+            completed_at = _utc_now()
+            session_log_path = interview.session_log_path or _session_log_key(interview_id)
+            await db.execute(
+                update(DBInterview).where(DBInterview.interview_id == interview_id).values(
+                    status="completed",
+                    completed_at=completed_at,
+                    assessment_status="pending",
+                    conversation_history=conversation_history,
+                    session_log_path=session_log_path
+                ).execution_options(synchronize_session=False)
+            )
+            await db.execute(
+                update(DBApplication).where(DBApplication.application_id == application_id).values(
+                    interview_completed_at=completed_at
+                ).execution_options(synchronize_session=False)
+            )
+            await db.commit()
+            await _invalidate_admin_caches()
+            await asyncio.to_thread(_log_audio_segments, interview, session_log_path, new_segments)
 
-            logger.info(f"✅ Completed asynchronous interview: {interview_id} — generating assessment in background")
+            logger.debug("Completed asynchronous interview %s (assessment generating in background)", interview_id)
 
             # Generate assessment + annotations in background thread (like the /end endpoint)
-            _bg_interview_id = interview.interview_id
-            _bg_application_id = application.application_id
+            _bg_interview_id = interview_id
+            _bg_application_id = application_id
             _bg_conv_history = list(conversation_history)
             _bg_llm_model = llm_model
             _bg_interview_context = dict(interview_context)
@@ -2882,35 +3651,26 @@ async def submit_async_answer(
 
             def _run_submit_assessment_bg():
                 try:
-                    from backend.database import SessionLocal
                     db_bg = SessionLocal()
                     try:
-                        logger.info(f"📝 [BG] Generating assessment for completed interview: {_bg_interview_id}")
+                        logger.debug("[BG] Generating assessment for completed interview %s (%s)", _bg_interview_id, _bg_llm_model)
                         _bg_llm_funcs = get_llm_functions("gemini")
-                        assessment = _bg_llm_funcs["generate_assessment"](
-                            conversation_history=_bg_conv_history,
-                            model_id=_bg_llm_model,
-                            interview_context=_bg_interview_context,
+                        assessment, assessment_hash = _generate_assessment_cached(
+                            db_bg, _bg_llm_funcs["generate_assessment"],
+                            _bg_conv_history, _bg_llm_model, _bg_interview_context
                         )
                         recommendation = extract_recommendation(assessment)
-
-                        iv = db_bg.query(DBInterview).filter(DBInterview.interview_id == _bg_interview_id).first()
-                        if iv:
-                            iv.assessment = assessment
-                            iv.recommendation = recommendation
-                            iv.evaluation_scores = json.dumps(extract_detailed_scores(assessment))
-                        app = db_bg.query(DBApplication).filter(DBApplication.application_id == _bg_application_id).first()
-                        if app:
-                            app.interview_assessment = assessment
-                            app.interview_recommendation = recommendation
-                            app.updated_at = datetime.utcnow()
-                        db_bg.commit()
-                        logger.info(f"✅ [BG] Assessment saved for interview: {_bg_interview_id}")
-
-                        # Generate transcript annotations
+                        interview_values = {
+                            "assessment": assessment,
+                            "assessment_hash": assessment_hash,
+                            "assessment_status": "ready",
+                            "recommendation": recommendation,
+                            "evaluation_scores": orjson.dumps(extract_detailed_scores(assessment)).decode()
+                        }
+
+                        # Transcript annotations are optional - the assessment is written either way
                         try:
-                            from backend.services.language_llm_openai import generate_transcript_annotations as gemini_ann
-                            annotations = gemini_ann(
+                            annotations = llm_generate_transcript_annotations(
                                 conversation_history=_bg_conv_history,
                                 model_id=_bg_llm_model,
                                 feedback_language=_bg_start_lang
@@ -2920,24 +3680,47 @@ async def submit_async_answer(
                                     idx_str = str(i)
                                     if idx_str in annotations:
                                         msg["ai_comment"] = annotations[idx_str]
-                            if iv:
-                                iv.conversation_history = json.dumps(_bg_conv_history)
-                                db_bg.commit()
-                            logger.info(f"✅ [BG] Transcript annotations saved for interview: {_bg_interview_id}")
+                            interview_values["conversation_history"] = _bg_conv_history
                         except Exception as e:
                             logger.error(f"❌ [BG] Transcript annotations failed: {e}")
+
+                        # Assessment, annotations and application in one transaction
+                        db_bg.execute(
+                            update(DBInterview).where(DBInterview.interview_id == _bg_interview_id).values(
+                                **interview_values
+                            ).execution_options(synchronize_session=False)
+                        )
+                        db_bg.execute(
+                            update(DBApplication).where(DBApplication.application_id == _bg_application_id).values(
+                                interview_assessment=assessment,
+                                interview_recommendation=recommendation,
+                                updated_at=_utc_now()
+                            ).execution_options(synchronize_session=False)
+                        )
+                        db_bg.commit()
+                        logger.debug("[BG] Assessment saved for interview %s", _bg_interview_id)
                     except Exception as e:
                         logger.error(f"❌ [BG] Assessment generation failed for {_bg_interview_id}: {e}")
                         db_bg.rollback()
                         try:
-                            iv_err = db_bg.query(DBInterview).filter(DBInterview.interview_id == _bg_interview_id).first()
-                            if iv_err and not iv_err.assessment:
-                                error_msg = str(e)
-                                if "quota" in error_msg.lower() or "429" in error_msg or "resource" in error_msg.lower():
-                                    iv_err.assessment = "[ASSESSMENT_FAILED:QUOTA] API quota exceeded. Please reload credits and regenerate the assessment."
-                                else:
-                                    iv_err.assessment = f"[ASSESSMENT_FAILED] Assessment generation failed: {error_msg[:200]}. You can regenerate it from the admin panel."
-                                db_bg.commit()
+                            error_msg = str(e)
+                            if "quota" in error_msg.lower() or "429" in error_msg or "resource" in error_msg.lower():
+                                failed_assessment = "[ASSESSMENT_FAILED:QUOTA] API quota exceeded. Please reload credits and regenerate the assessment."
+                            else:
+                                failed_assessment = f"[ASSESSMENT_FAILED] Assessment generation failed: {error_msg[:200]}. You can regenerate it from the admin panel."
+                            db_bg.execute(
+                                update(DBInterview).where(DBInterview.interview_id == _bg_interview_id).values(
+                                    assessment_status="failed"
+                                ).execution_options(synchronize_session=False)
+                            )
+                            # Only write the failure notice if no assessment was stored
+                            db_bg.execute(
+                                update(DBInterview).where(
+                                    DBInterview.interview_id == _bg_interview_id,
+                                    or_(DBInterview.assessment.is_(None), DBInterview.assessment == "")
+                                ).values(assessment=failed_assessment).execution_options(synchronize_session=False)
+                            )
+                            db_bg.commit()
                         except Exception:
                             pass
                     finally:
@@ -2945,8 +3728,7 @@ async def submit_async_answer(
                 except Exception as e:
                     logger.error(f"❌ [BG] Background assessment thread error: {e}")
 
-            import threading
-            threading.Thread(target=_run_submit_assessment_bg, daemon=True).start()
+            assessment_executor.submit(_run_submit_assessment_bg)
 
             return {
                 "interview_id": interview_id,
@@ -2954,67 +3736,68 @@ async def submit_async_answer(
                 "user_text": user_text,
             }
         else:
-            # Generate next question (with retry on quota)
-            next_question = _retry_on_quota(
-                llm_funcs["generate_response"],
-                conversation_history=conversation_history[:-1],  # Exclude the just-added user message
-                user_message=user_text,
-                model_id=llm_model,
-                interview_context=interview_context
+            # Generate next question - TTS starts per sentence while the LLM is still generating.
+            # The LLM stream is consumed in a worker thread so the event loop keeps serving other turns
+            next_question, audio_job = await asyncio.to_thread(
+                _generate_question_pipelined,
+                llm_funcs,
+                dict(
+                    conversation_history=conversation_history[:-1],  # Exclude the just-added user message
+                    user_message=user_text,
+                    model_id=llm_model,
+                    interview_context=interview_context
+                ),
+                interview_id, question_count + 1, tts_provider, tts_model
             )
             
             # Detect implicit explicit conclusion and strip token before TTS
             if "[interview_concluded]" in next_question.lower():
-                import re
-                next_question = re.sub(r'\[INTERVIEW_CONCLUDED\]', '', next_question, flags=re.IGNORECASE).strip()
+                next_question = INTERVIEW_CONCLUDED_RE.sub('', next_question).strip()
             
-            # Generate audio for question (with TTS fallback)
-            audio_base64 = ""
-            tts_fallback = False
-            try:
-                tts_func = get_tts_function(tts_provider)
-                audio_data = tts_func(next_question, model_id=tts_model, voice_id=None)
-                audio_base64 = base64.b64encode(audio_data).decode('utf-8')
-            except Exception as tts_err:
-                logger.warning(f"⚠️ TTS failed for async question (will use browser fallback): {tts_err}")
-                tts_fallback = True
+            # Question audio is streamed by the client from question_audio_url
 
             # Add assistant response to conversation
             conversation_history.append({"role": "assistant", "content": next_question})
             
             # Save audio segments (question and answer separately)
-            audio_segments = []
-            if hasattr(interview, 'audio_segments') and interview.audio_segments:
-                try:
-                    audio_segments = json.loads(interview.audio_segments)
-                except:
-                    audio_segments = []
+            new_segments = []
             
             # Save candidate's answer audio
-            audio_segments.append({
+            new_segments.append({
                 "type": "answer",
-                "question_number": request.question_number,
-                "audio": request.audio,  # User's answer audio (webm)
+                "question_number": question_number,
+                "audio_key": answer_audio_key,  # User's answer audio (webm)
                 "format": "webm",
                 "text": user_text,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": datetime.now()
             })
             
-            # Save AI's question audio
-            audio_segments.append({
+            # Save AI's question (its mp3 audio_key is appended once the audio is stored)
+            new_segments.append({
                 "type": "question",
                 "question_number": question_count + 1,
-                "audio": audio_base64,  # AI's question audio (mp3)
                 "format": "mp3",
                 "text": next_question,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": datetime.now()
             })
             
-            # Update interview
-            interview.conversation_history = json.dumps(conversation_history)
-            if hasattr(interview, 'audio_segments'):
-                interview.audio_segments = json.dumps(audio_segments)
-            db.commit()
+            # Update interview - the turn's messages go to the session log; only interviews
+            # whose history still lives in the column rewrite it
+            session_log_path = interview.session_log_path or _session_log_key(interview_id)
+            if history_logged:
+                new_segments.append({"type": "message", "role": "user", "content": user_text})
+                new_segments.append({"type": "message", "role": "assistant", "content": next_question})
+            else:
+                await db.execute(
+                    update(DBInterview).where(DBInterview.interview_id == interview_id).values(
+                        conversation_history=conversation_history,
+                        session_log_path=session_log_path
+                    ).execution_options(synchronize_session=False)
+                )
+                await db.commit()
+            await asyncio.to_thread(_log_audio_segments, interview, session_log_path, new_segments)
+            if audio_job:
+                audio_job.committed.set()
             
             logger.info(f"📝 Question {question_count + 1} generated for interview: {interview_id}")
             
@@ -3022,9 +3805,10 @@ async def submit_async_answer(
                 "interview_id": interview_id,
                 "question_number": question_count + 1,
                 "question_text": next_question,
-                "question_audio": audio_base64,
+                "question_audio": "",
+                "question_audio_url": _question_audio_url(interview_id, question_count + 1, email),
                 "audio_format": "mp3",
-                "tts_fallback": tts_fallback,
+                "tts_fallback": False,
                 "status": "in_progress",
                 "user_text": user_text,
             }
@@ -3037,209 +3821,586 @@ async def submit_async_answer(
         raise HTTPException(status_code=500, detail=f"Error processing answer: {str(e)}")
 
 
-@app.post("/api/candidates/interviews/{interview_id}/async/save-recording")
-async def save_async_interview_recording(
+# Sentence boundary for LLM -> TTS pipelining
+SENTENCE_END_RE = re.compile(r'(?<=[.!?])\s+')
+INTERVIEW_CONCLUDED_RE = re.compile(r'\[INTERVIEW_CONCLUDED\]', re.IGNORECASE)
+
+
+class QuestionAudioJob:
+    """Question audio produced by a background TTS worker, readable while it is still being synthesized."""
+
+    def __init__(self):
+        self.chunks: list = []
+        self.done = False
+        self.failed = False
+        self.committed = threading.Event()  # Set once the question's audio segment is in the DB
+        self._cond = threading.Condition()
+
+    def add(self, chunk: bytes):
+        with self._cond:
+            self.chunks.append(chunk)
+            self._cond.notify_all()
+
+    def finish(self):
+        with self._cond:
+            self.done = True
+            self._cond.notify_all()
+
+    def iter_chunks(self):
+        """Yield chunks as they arrive until synthesis is finished."""
+        index = 0
+        while True:
+            with self._cond:
+                while index >= len(self.chunks) and not self.done:
+                    self._cond.wait(timeout=30)
+                if index >= len(self.chunks):
+                    return
+                chunk = self.chunks[index]
+            index += 1
+            yield chunk
+
+
+def _run_question_tts_worker(job: QuestionAudioJob, sentences, interview_id: str, question_number: int, tts_provider: str, tts_model: str):
+    """Synthesize queued sentences in order, then persist the audio and drop the job."""
+    tts_stream = get_tts_stream_function(tts_provider)
+    while True:
+        sentence = sentences.get()
+        if sentence is None:
+            break
+        if job.failed:
+            continue  # Drain the queue
+        try:
+            for chunk in tts_stream(sentence, model_id=tts_model, voice_id=None):
+                job.add(chunk)
+        except Exception as e:
+            logger.warning(f"⚠️ Pipelined TTS failed for question {question_number} of {interview_id}: {e}")
+            job.failed = True
+    job.finish()
+    # Wait for the handler to commit the question's segment before storing into it
+    if not job.failed and job.committed.wait(timeout=60):
+        _store_question_audio(interview_id, question_number, job.chunks)
+    async_question_audio_jobs.pop((interview_id, question_number), None)
+
+
+def _stream_sentences(deltas, parts: list):
+    """Yield cleaned, speakable sentences from an LLM delta stream as each one completes (raw deltas go to parts)."""
+    buffer = ""
+    for delta in deltas:
+        parts.append(delta)
+        buffer += delta
+        pieces = SENTENCE_END_RE.split(buffer)
+        buffer = pieces.pop()
+        for sentence in pieces:
+            sentence = INTERVIEW_CONCLUDED_RE.sub('', llm_clean_response(sentence)).strip()
+            if sentence:
+                yield sentence
+    tail = INTERVIEW_CONCLUDED_RE.sub('', llm_clean_response(buffer)).strip()
+    if tail:
+        yield tail
+
+
+def _generate_question_pipelined(llm_funcs: dict, llm_kwargs: dict, interview_id: str, question_number: int, tts_provider: str, tts_model: str):
+    """
+    Stream the LLM response and start TTS on each sentence as soon as it is complete,
+    so synthesis overlaps with the rest of the generation.
+    
+    Returns (question_text, job). Falls back to a regular (non-streaming) call, with
+    job=None, if the stream fails before producing any sentence.
+    """
+    sentences = queue.Queue()
+    job = QuestionAudioJob()
+    async_question_audio_jobs[(interview_id, question_number)] = job
+    threading.Thread(
+        target=_run_question_tts_worker,
+        args=(job, sentences, interview_id, question_number, tts_provider, tts_model),
+        daemon=True
+    ).start()
+    
+    parts = []
+    queued_any = False
+    streamed = False
+    try:
+        for sentence in _stream_sentences(llm_funcs["generate_response_stream"](**llm_kwargs), parts):
+            sentences.put(sentence)
+            queued_any = True
+        streamed = True
+    except Exception as e:
+        if queued_any:
+            raise
+        logger.warning(f"⚠️ Streaming LLM failed before first sentence, falling back to regular call: {e}")
+    finally:
+        # However the stream ended, the worker gets its sentinel (it would block forever otherwise)
+        # and a broken stream's job is dropped
+        if not streamed:
+            job.failed = True
+            async_question_audio_jobs.pop((interview_id, question_number), None)
+        sentences.put(None)
+    if not streamed:
+        return _retry_on_quota(llm_funcs["generate_response"], **llm_kwargs), None
+    return llm_clean_response("".join(parts)), job
+
+
+def _generate_response_pipelined(llm_funcs: dict, llm_kwargs: dict, voice_id: str, tts_model: Optional[str]):
+    """
+    Classic-mode counterpart of _generate_question_pipelined: the response audio is
+    synthesized sentence by sentence while the LLM streams, and returned in one piece.
+    
+    Returns (response_text, audio_bytes). audio_bytes is None if the pipelined TTS failed
+    (the caller synthesizes the full text instead); a failed stream falls back to a
+    regular LLM call.
+    """
+    sentences = queue.Queue()
+    job = QuestionAudioJob()
+    
+    def synthesize():
+        tts_stream = get_tts_stream_function()
+        while True:
+            sentence = sentences.get()
+            if sentence is None:
+                break
+            if job.failed:
+                continue  # Drain the queue
+            try:
+                for chunk in tts_stream(sentence, model_id=tts_model, voice_id=voice_id):
+                    job.add(chunk)
+            except Exception as e:
+                logger.warning(f"⚠️ Pipelined TTS failed, the full response will be synthesized instead: {e}")
+                job.failed = True
+        job.finish()
+    
+    worker = threading.Thread(target=synthesize, daemon=True)
+    worker.start()
+    parts = []
+    streamed = False
+    try:
+        for sentence in _stream_sentences(llm_funcs["generate_response_stream"](**llm_kwargs), parts):
+            sentences.put(sentence)
+        streamed = True
+    except Exception as e:
+        logger.warning(f"⚠️ Streaming LLM failed, falling back to regular call: {e}")
+    finally:
+        # The worker always gets its sentinel, also if the stream breaks mid-way
+        if not streamed:
+            job.failed = True
+        sentences.put(None)
+    if not streamed:
+        return _retry_on_quota(llm_funcs["generate_response"], **llm_kwargs), None
+    worker.join()
+    return llm_clean_response("".join(parts)), None if job.failed else b"".join(job.chunks)
+
+
+def _question_audio_url(interview_id: str, question_number: int, email: str) -> str:
+    """URL the client streams a question's TTS audio from."""
+    return f"/api/candidates/interviews/{interview_id}/async/question-audio/{question_number}?email={quote(email)}"
+
+
+def _session_log_key(interview_id: str) -> str:
+    """Session log location, relative to the data directory (stored in interview.session_log_path)."""
+    return f"sessions/{interview_id}.jsonl"
+
+
+def _session_log_file(session_log_path: str) -> str:
+    return os.path.join(_data_dir, session_log_path)
+
+
+def _interview_audio_segments(interview) -> list:
+    """Audio segments of an interview - from its session log, or the legacy audio_segments JSON column."""
+    if interview.session_log_path:
+        return session_log_segments(_session_log_file(interview.session_log_path))
+    try:
+        return orjson.loads(interview.audio_segments) if interview.audio_segments else []
+    except (json.JSONDecodeError, TypeError):
+        return []
+
+
+def _interview_conversation(interview):
+    """Conversation of an in-progress async interview and whether it is kept in the session log.
+
+    Turns are appended to the session log as message lines; interviews started before that
+    keep their history in the conversation_history column until they complete.
+    """
+    if interview.session_log_path:
+        messages = session_log_conversation(_session_log_file(interview.session_log_path))
+        if messages:
+            return messages, True
+    return list(interview.conversation_history or []), False
+
+
+def _log_audio_segments(interview, session_log_path: str, new_segments: list):
+    """Append a turn's segments to the session log (interviews started before logs existed are moved over)."""
+    if interview.session_log_path:
+        session_log_append(_session_log_file(session_log_path), new_segments)
+    else:
+        session_log_start(_session_log_file(session_log_path), _interview_audio_segments(interview) + new_segments)
+
+
+def _find_question_segment(audio_segments: list, question_number: int):
+    """Return the stored question segment for question_number, if any."""
+    for segment in audio_segments:
+        if segment.get("type") == "question" and segment.get("question_number") == question_number:
+            return segment
+    return None
+
+
+def _store_interview_audio(interview_id: str, filename: str, audio_bytes: bytes, content_type: str) -> str:
+    """Upload an interview audio file to object storage (or local uploads) and return its key."""
+    audio_key = f"audio/{interview_id}/{filename}"
+    s3_upload(audio_bytes, audio_key, content_type=content_type, local_dir=UPLOADS_DIR)
+    return audio_key
+
+
+def _load_segment_audio(segment: dict) -> bytes:
+    """Audio bytes of a stored segment - from its storage key, or inline base64 for older rows."""
+    if segment.get("audio_key"):
+        return s3_download(segment["audio_key"], local_dir=UPLOADS_DIR) or b""
+    if segment.get("audio"):
+        return base64.b64decode(segment["audio"])
+    return b""
+
+
+def _store_question_audio(interview_id: str, question_number: int, chunks: list):
+    """Persist streamed question audio and point its audio segment at it (runs after the stream closes)."""
+    if not chunks:
+        return
+    audio_key = _store_interview_audio(interview_id, f"q{question_number}.mp3", b"".join(chunks), "audio/mpeg")
+    db_bg = SessionLocal()
+    try:
+        interview = db_bg.query(DBInterview).filter(DBInterview.interview_id == interview_id).first()
+        if not interview:
+            return
+        if interview.session_log_path:
+            session_log_append(_session_log_file(interview.session_log_path), [
+                {"type": "question_audio", "question_number": question_number, "audio_key": audio_key}
+            ])
+            logger.info(f"✅ Stored streamed audio for question {question_number} of interview {interview_id}")
+            return
+        if not interview.audio_segments:
+            return
+        audio_segments = orjson.loads(interview.audio_segments)
+        segment = _find_question_segment(audio_segments, question_number)
+        if segment is None:
+            return
+        segment["audio_key"] = audio_key
+        interview.audio_segments = orjson.dumps(audio_segments).decode()
+        db_bg.commit()
+        logger.info(f"✅ Stored streamed audio for question {question_number} of interview {interview_id}")
+    except Exception as e:
+        logger.error(f"❌ Failed to store streamed question audio for {interview_id}: {e}")
+        db_bg.rollback()
+    finally:
+        db_bg.close()
+
+
+@app.get("/api/candidates/interviews/{interview_id}/async/question-audio/{question_number}")
+async def stream_async_question_audio(
     interview_id: str,
-    request: AsyncInterviewRecordingRequest,
-    db: Session = Depends(get_db)
+    question_number: int,
+    email: str = Query(..., description="Candidate email address for verification"),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Save the full interview recording (user audio + AI audio combined)."""
-    if db is None:
-        db = next(get_db())
+    """Stream a question's TTS audio (MP3) as it is synthesized; serve stored audio on replay."""
+
+    interview = await verify_interview_access(
+        db, interview_id, email,
+        DBInterview.session_log_path, DBInterview.audio_segments, DBInterview.provider_preferences
+    )
     
-    # Verify interview exists and email matches
-    interview = db.query(DBInterview).filter(DBInterview.interview_id == interview_id).first()
-    if not interview:
-        raise HTTPException(status_code=404, detail="Interview not found")
+    audio_segments = await asyncio.to_thread(_interview_audio_segments, interview)
+    segment = _find_question_segment(audio_segments, question_number)
+    if segment is None:
+        raise HTTPException(status_code=404, detail="Question not found")
     
-    application = db.query(DBApplication).filter(DBApplication.application_id == interview.application_id).first()
-    if not application:
-        raise HTTPException(status_code=404, detail="Application not found")
+    # Already synthesized (replay) - serve the stored audio
+    if segment.get("audio_key") or segment.get("audio"):
+        audio_bytes = await asyncio.to_thread(_load_segment_audio, segment)
+        if audio_bytes:
+            return Response(content=audio_bytes, media_type="audio/mpeg")
     
-    candidate = db.query(DBCandidate).filter(DBCandidate.candidate_id == application.candidate_id).first()
-    if not candidate:
-        raise HTTPException(status_code=404, detail="Candidate not found")
+    # Still being synthesized sentence-by-sentence - stream what's there and follow along
+    # (the TTS worker stores the audio itself)
+    audio_job = async_question_audio_jobs.get((interview_id, question_number))
+    if audio_job and not (audio_job.failed and not audio_job.chunks):
+        return StreamingResponse(audio_job.iter_chunks(), media_type="audio/mpeg")
     
-    if candidate.email != request.email:
-        raise HTTPException(status_code=403, detail="Access denied. Email does not match interview candidate.")
+    provider_preferences = orjson.loads(interview.provider_preferences) if interview.provider_preferences else {}
+    tts_provider = provider_preferences.get("tts_provider") or DEFAULT_TTS_PROVIDER
+    tts_model = provider_preferences.get("tts_model") or TTS_PROVIDERS[tts_provider]["default_model"]
     
-    # Validate that we have at least some audio to save
-    if not request.user_audio and (not request.ai_audio_chunks or len(request.ai_audio_chunks) == 0):
-        logger.warning(f"⚠️ No audio data provided for interview {interview_id}")
-        return {
-            "interview_id": interview_id,
-            "status": "skipped",
-            "message": "No audio data to save"
-        }
+    audio_iter = get_tts_stream_function(tts_provider)(segment.get("text", ""), model_id=tts_model, voice_id=None)
+    # Pull the first chunk before answering so a TTS failure is a 502 (client falls back to browser speech)
+    try:
+        first_chunk = await asyncio.to_thread(next, audio_iter, b"")
+    except Exception as tts_err:
+        logger.warning(f"⚠️ TTS stream failed for async question {question_number} (client will use browser fallback): {tts_err}")
+        raise HTTPException(status_code=502, detail="Text-to-speech unavailable")
+    
+    chunks = [first_chunk] if first_chunk else []
+    
+    def iter_audio():
+        if first_chunk:
+            yield first_chunk
+        for chunk in audio_iter:
+            chunks.append(chunk)
+            yield chunk
+    
+    return StreamingResponse(
+        iter_audio(),
+        media_type="audio/mpeg",
+        background=BackgroundTask(_store_question_audio, interview_id, question_number, chunks)
+    )
+
+
+def _concat_audio_ffmpeg(parts: list, gap_ms: int = 500) -> bytes:
+    """
+    Concatenate audio clips into one MP3 with a short silence between clips.
+    
+    When every clip is already MP3 (TTS output), the streams are joined with the concat
+    demuxer and copied as-is - no decode/re-encode, so no quality loss. Mixed formats
+    (e.g. the candidate's webm) or a failed copy fall back to a single ffmpeg concat
+    filter pass: each input decoded once and the output encoded once.
+    
+    Args:
+        parts: List of (audio_bytes, format) tuples, in playback order
+        gap_ms: Silence inserted between consecutive clips
+    """
+    
+    with tempfile.TemporaryDirectory(prefix="recording_") as tmp_dir:
+        part_paths = []
+        for i, (audio_bytes, audio_format) in enumerate(parts):
+            part_path = os.path.join(tmp_dir, f"part_{i}.{audio_format}")
+            with open(part_path, "wb") as f:
+                f.write(audio_bytes)
+            part_paths.append(part_path)
+        output_path = os.path.join(tmp_dir, "combined.mp3")
+        
+        if all(audio_format == "mp3" for _, audio_format in parts):
+            # Silence spacer encoded like the TTS clips (44.1kHz mono MP3) so the streams can be copied
+            silence_path = os.path.join(tmp_dir, "silence.mp3")
+            manifest_path = os.path.join(tmp_dir, "parts.txt")
+            with open(manifest_path, "w") as f:
+                for i, part_path in enumerate(part_paths):
+                    if i > 0:
+                        f.write(f"file '{silence_path}'\n")
+                    f.write(f"file '{part_path}'\n")
+            silence = subprocess.run(
+                ["ffmpeg", "-y", "-loglevel", "error", "-f", "lavfi", "-i", "anullsrc=r=44100:cl=mono",
+                 "-t", str(gap_ms / 1000), "-b:a", "128k", silence_path],
+                capture_output=True, timeout=60
+            )
+            if silence.returncode == 0:
+                result = subprocess.run(
+                    ["ffmpeg", "-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+                     "-i", manifest_path, "-c", "copy", output_path],
+                    capture_output=True, timeout=300
+                )
+                if result.returncode == 0:
+                    with open(output_path, "rb") as f:
+                        return f.read()
+                logger.warning(f"⚠️ MP3 stream copy failed, re-encoding instead: {result.stderr.decode(errors='replace')[-200:]}")
+        
+        cmd = ["ffmpeg", "-y", "-loglevel", "error"]
+        for part_path in part_paths:
+            cmd += ["-i", part_path]
+        
+        # Normalize every clip to one layout (concat needs matching streams), with silence between clips
+        filters = []
+        labels = []
+        for i in range(len(parts)):
+            if i > 0:
+                filters.append(f"anullsrc=r=44100:cl=mono,atrim=duration={gap_ms / 1000}[gap{i}]")
+                labels.append(f"[gap{i}]")
+            filters.append(f"[{i}:a]aresample=44100,aformat=sample_fmts=fltp:channel_layouts=mono[a{i}]")
+            labels.append(f"[a{i}]")
+        filters.append(f"{''.join(labels)}concat=n={len(labels)}:v=0:a=1[out]")
+        
+        cmd += ["-filter_complex", ";".join(filters), "-map", "[out]", "-b:a", "128k", output_path]
+        result = subprocess.run(cmd, capture_output=True, timeout=300)
+        if result.returncode != 0:
+            raise RuntimeError(f"ffmpeg failed: {result.stderr.decode(errors='replace')[-500:]}")
+        
+        with open(output_path, "rb") as f:
+            return f.read()
+
+
+def _process_interview_recording(interview_id: str, user_audio: str):
+    """
+    Build and store the full interview recording (runs in a background thread).
     
-    # Try to combine audio with pydub, but fallback to saving user audio if it fails
+    The AI side is rebuilt from the question audio already stored for this interview,
+    so the client only uploads its own audio. Combines everything in one ffmpeg pass,
+    falling back to the user audio alone, and records the outcome in interview.recording_status.
+    """
+    db_bg = SessionLocal()
     try:
-        from pydub import AudioSegment
-        from io import BytesIO
+        interview = db_bg.query(DBInterview).filter(DBInterview.interview_id == interview_id).first()
+        if not interview:
+            return
         
-        combined_audio = None
-        user_audio_valid = False
+        parts = []
         
-        # Try to process user audio
-        if request.user_audio:
+        # User audio first
+        user_audio_bytes = b""
+        if user_audio:
             try:
-                user_audio_bytes = base64.b64decode(request.user_audio)
+                user_audio_bytes = base64.b64decode(user_audio)
                 if len(user_audio_bytes) > 0:
-                    user_audio = AudioSegment.from_file(BytesIO(user_audio_bytes), format="webm")
-                    combined_audio = user_audio
-                    user_audio_valid = True
-                    logger.info(f"✅ Processed user audio: {len(user_audio_bytes)} bytes")
+                    parts.append((user_audio_bytes, "webm"))
             except Exception as e:
-                logger.warning(f"⚠️ Could not process user audio with pydub: {e}")
-                # Continue to try AI audio or save user audio as-is
+                logger.warning(f"⚠️ Could not decode user audio: {e}")
+                # Continue with AI audio
         
-        # Process AI audio chunks
-        if request.ai_audio_chunks and len(request.ai_audio_chunks) > 0:
-            # Sort AI audio chunks by timestamp
-            ai_chunks = sorted(request.ai_audio_chunks, key=lambda x: x.get("timestamp", 0))
-            
-            # If we don't have user audio, start with first AI chunk
-            if not user_audio_valid and len(ai_chunks) > 0:
-                try:
-                    first_chunk = ai_chunks[0]
-                    ai_audio_bytes = base64.b64decode(first_chunk["audio"])
-                    ai_format = first_chunk.get("format", "mp3")
-                    combined_audio = AudioSegment.from_file(BytesIO(ai_audio_bytes), format=ai_format)
-                    ai_chunks = ai_chunks[1:]  # Skip first chunk as we already added it
-                    logger.info(f"✅ Started with AI audio chunk")
-                except Exception as e:
-                    logger.warning(f"⚠️ Could not process first AI audio chunk: {e}")
-            
-            # Append remaining AI audio chunks
-            for chunk in ai_chunks:
-                try:
-                    ai_audio_bytes = base64.b64decode(chunk["audio"])
-                    ai_format = chunk.get("format", "mp3")
-                    ai_audio = AudioSegment.from_file(BytesIO(ai_audio_bytes), format=ai_format)
-                    # Add a small silence between chunks
-                    if combined_audio:
-                        combined_audio += AudioSegment.silent(duration=500)  # 500ms silence
-                        combined_audio += ai_audio
-                    else:
-                        combined_audio = ai_audio
-                except Exception as e:
-                    logger.warning(f"⚠️ Error processing AI audio chunk: {e}")
-                    continue
+        # Then the stored AI question audio, in question order
+        question_segments = [seg for seg in _interview_audio_segments(interview) if seg.get("type") == "question"]
+        for segment in sorted(question_segments, key=lambda x: x.get("question_number", 0)):
+            try:
+                ai_audio_bytes = _load_segment_audio(segment)
+            except Exception as e:
+                logger.warning(f"⚠️ Could not load audio for question {segment.get('question_number')}: {e}")
+                continue
+            if ai_audio_bytes:
+                parts.append((ai_audio_bytes, segment.get("format", "mp3")))
         
-        # Export combined audio to MP3
-        if combined_audio:
+        if parts:
             try:
-                output = BytesIO()
-                combined_audio.export(output, format="mp3", bitrate="128k")
-                output.seek(0)
-                
-                audio_bytes = output.read()
+                audio_bytes = _concat_audio_ffmpeg(parts)
                 audio_key = f"recordings/{interview_id}.mp3"
                 s3_upload(audio_bytes, audio_key, content_type="audio/mpeg", local_dir=UPLOADS_DIR)
-
-                # Store key in database (or base64 as fallback for backward compat)
-                if is_s3_enabled():
-                    interview.recording_audio = f"s3://{audio_key}"
-                else:
-                    interview.recording_audio = base64.b64encode(audio_bytes).decode('utf-8')
-                db.commit()
                 
-                logger.info(f"✅ Saved combined interview recording for interview: {interview_id} ({len(recording_base64)} chars)")
-                
-                return {
-                    "interview_id": interview_id,
-                    "status": "saved",
-                    "message": "Recording saved successfully"
-                }
+                # Only the storage key goes in the row
+                interview.recording_audio_path = audio_key
+                interview.recording_audio = None
+                interview.recording_status = "saved"
+                db_bg.commit()
+                logger.info(f"✅ Saved combined interview recording for interview: {interview_id} ({len(audio_bytes)} bytes, {len(parts)} parts)")
+                return
             except Exception as e:
-                logger.error(f"❌ Error exporting combined audio: {e}", exc_info=True)
+                logger.error(f"❌ Error combining interview audio: {e}", exc_info=True)
+                db_bg.rollback()
                 # Fall through to save user audio only
-    except ImportError as e:
-        logger.warning(f"⚠️ pydub not available: {e}")
+        
+        # Fallback: Save user audio only if combining failed or ffmpeg is not available
+        if user_audio_bytes:
+            audio_key = f"recordings/{interview_id}.webm"
+            s3_upload(user_audio_bytes, audio_key, content_type="audio/webm", local_dir=UPLOADS_DIR)
+            interview.recording_audio_path = audio_key  # User audio as-is (webm)
+            interview.recording_audio = None
+            interview.recording_status = "saved"
+            db_bg.commit()
+            logger.info(f"✅ Saved user audio only for interview: {interview_id} ({len(user_audio_bytes)} bytes)")
+            return
+        
+        interview.recording_status = "failed"
+        db_bg.commit()
+        logger.error(f"❌ No usable audio to save for interview: {interview_id}")
     except Exception as e:
-        logger.error(f"❌ Error in audio processing: {e}", exc_info=True)
-        # Continue to fallback
-    
-    # Fallback: Save user audio only if combining failed or pydub not available
-    if request.user_audio:
+        logger.error(f"❌ Error saving recording for interview {interview_id}: {e}", exc_info=True)
+        db_bg.rollback()
         try:
-            # Validate base64 before saving
-            try:
-                test_decode = base64.b64decode(request.user_audio)
-                if len(test_decode) == 0:
-                    raise ValueError("User audio is empty after decoding")
-            except Exception as e:
-                logger.error(f"❌ Invalid user audio data: {e}")
-                raise HTTPException(status_code=400, detail=f"Invalid audio data: {str(e)}")
-            
-            interview.recording_audio = request.user_audio  # Store user audio as-is (base64 webm)
-            db.commit()
-            logger.info(f"✅ Saved user audio only for interview: {interview_id} ({len(request.user_audio)} chars)")
-            return {
-                "interview_id": interview_id,
-                "status": "saved",
-                "message": "Recording saved (user audio only - audio combining not available)"
-            }
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.error(f"❌ Error saving user audio to database: {e}", exc_info=True)
-            raise HTTPException(status_code=500, detail=f"Failed to save recording: {str(e)}")
+            db_bg.query(DBInterview).filter(DBInterview.interview_id == interview_id).update(
+                {"recording_status": "failed"}, synchronize_session=False
+            )
+            db_bg.commit()
+        except Exception:
+            pass
+    finally:
+        db_bg.close()
+
+
+@app.post("/api/candidates/interviews/{interview_id}/async/save-recording", status_code=202)
+async def save_async_interview_recording(
+    interview_id: str,
+    request: AsyncInterviewRecordingRequest,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Accept the interview recording - user audio is combined with the stored AI audio in the background."""
+    # Verify interview exists and email matches
+    interview = await verify_interview_access(
+        db, interview_id, request.email, DBInterview.session_log_path, DBInterview.audio_segments
+    )
+    
+    # Validate that we have at least some audio to save (AI audio exists once a question has been streamed)
+    if not request.user_audio and not (interview.session_log_path or interview.audio_segments):
+        logger.warning(f"⚠️ No audio data provided for interview {interview_id}")
+        return {
+            "interview_id": interview_id,
+            "status": "skipped",
+            "message": "No audio data to save"
+        }
     
+    await db.execute(
+        update(DBInterview).where(DBInterview.interview_id == interview_id).values(
+            recording_status="processing"
+        ).execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    
+    threading.Thread(
+        target=_process_interview_recording,
+        args=(interview_id, request.user_audio),
+        daemon=True
+    ).start()
+    
+    return {
+        "interview_id": interview_id,
+        "status": "accepted",
+        "message": "Recording is being processed"
+    }
+
+
+def _store_interview_video(interview_id: str, video_key: str, content: bytes, content_type: str):
+    """Upload an interview video and point the interview at it (runs in a background thread)."""
+    try:
+        s3_upload(content, video_key, content_type=content_type, local_dir=UPLOADS_DIR)
+    except Exception as e:
+        logger.error(f"❌ Error uploading video for interview {interview_id}: {e}", exc_info=True)
+        return
+    db_bg = SessionLocal()
+    try:
+        db_bg.query(DBInterview).filter(DBInterview.interview_id == interview_id).update(
+            {"recording_video": video_key}, synchronize_session=False
+        )
+        db_bg.commit()
+        logger.info(f"✅ Video uploaded successfully for interview {interview_id}: {video_key}")
+    except Exception as e:
+        logger.error(f"❌ Error saving video key for interview {interview_id}: {e}", exc_info=True)
+        db_bg.rollback()
+    finally:
+        db_bg.close()
 
 
-@app.post("/api/candidates/interviews/{interview_id}/async/upload-video")
+@app.post("/api/candidates/interviews/{interview_id}/async/upload-video", status_code=202)
 async def upload_interview_video(
     interview_id: str,
     email: str = Form(...),
     video_file: UploadFile = File(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Upload video recording for an interview."""
-    if db is None:
-        db = next(get_db())
-    
-    # Verify interview exists
-    interview = db.query(DBInterview).filter(DBInterview.interview_id == interview_id).first()
-    if not interview:
-        raise HTTPException(status_code=404, detail="Interview not found")
+    """Accept the video recording for an interview - it is stored in the background."""
+    # Verify interview exists and email matches
+    await verify_interview_access(db, interview_id, email)
     
-    # Verify application and candidate
-    application = db.query(DBApplication).filter(DBApplication.application_id == interview.application_id).first()
-    if not application:
-        raise HTTPException(status_code=404, detail="Application not found")
+    # Nothing else needs the DB - release the connection before reading the upload
+    await db.close()
     
-    candidate = db.query(DBCandidate).filter(DBCandidate.candidate_id == application.candidate_id).first()
-    if not candidate:
-        raise HTTPException(status_code=404, detail="Candidate not found")
+    file_extension = "webm"  # Default for MediaRecorder
+    if video_file.filename and '.' in video_file.filename:
+        file_extension = video_file.filename.split('.')[-1]
+    video_key = f"videos/{interview_id}.{file_extension}"
     
-    if candidate.email != email:
-        raise HTTPException(status_code=403, detail="Access denied. Email does not match interview candidate.")
+    # The upload has to be read before responding (the request body is gone afterwards)
+    content = await video_file.read()
+    threading.Thread(
+        target=_store_interview_video,
+        args=(interview_id, video_key, content, f"video/{file_extension}"),
+        daemon=True
+    ).start()
     
-    try:
-        # Save video file
-        file_extension = "webm"  # Default for MediaRecorder
-        if video_file.filename and '.' in video_file.filename:
-            file_extension = video_file.filename.split('.')[-1]
-            
-        video_key = f"videos/{interview_id}.{file_extension}"
-        content = await video_file.read()
-        s3_upload(content, video_key, content_type=f"video/{file_extension}", local_dir=UPLOADS_DIR)
-
-        interview.recording_video = video_key
-        db.commit()
-        
-        logger.info(f"✅ Video uploaded successfully for interview {interview_id}: {video_key}")
-        
-        return {
-            "interview_id": interview_id,
-            "status": "uploaded",
-            "file_path": interview.recording_video,
-            "message": "Video uploaded successfully"
-        }
-    except Exception as e:
-        logger.error(f"❌ Error uploading video: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=f"Failed to upload video: {str(e)}")
+    return {
+        "interview_id": interview_id,
+        "status": "accepted",
+        "file_path": video_key,
+        "message": "Video is being uploaded"
+    }
 
 
 class SnapshotUploadRequest(BaseModel):
@@ -3251,26 +4412,13 @@ class SnapshotUploadRequest(BaseModel):
 async def upload_interview_snapshots(
     interview_id: str,
     request: SnapshotUploadRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Upload periodic identity verification snapshots for an interview."""
-    if db is None:
-        db = next(get_db())
-
-    interview = db.query(DBInterview).filter(DBInterview.interview_id == interview_id).first()
-    if not interview:
-        raise HTTPException(status_code=404, detail="Interview not found")
-
-    application = db.query(DBApplication).filter(DBApplication.application_id == interview.application_id).first()
-    if not application:
-        raise HTTPException(status_code=404, detail="Application not found")
 
-    candidate = db.query(DBCandidate).filter(DBCandidate.candidate_id == application.candidate_id).first()
-    if not candidate or candidate.email != request.email:
-        raise HTTPException(status_code=403, detail="Access denied")
+    await verify_interview_access(db, interview_id, request.email)
 
     try:
-        import base64
         # Create a composite image grid from snapshots
         snapshot_keys = []
         for i, snap in enumerate(request.snapshots):
@@ -3283,12 +4431,16 @@ async def upload_interview_snapshots(
             })
 
         # Store snapshot metadata as the video field (repurposed)
-        interview.recording_video = json.dumps({
-            "type": "snapshots",
-            "count": len(snapshot_keys),
-            "snapshots": snapshot_keys
-        })
-        db.commit()
+        await db.execute(
+            update(DBInterview).where(DBInterview.interview_id == interview_id).values(
+                recording_video=json.dumps({
+                    "type": "snapshots",
+                    "count": len(snapshot_keys),
+                    "snapshots": snapshot_keys
+                })
+            ).execution_options(synchronize_session=False)
+        )
+        await db.commit()
 
         logger.info(f"✅ {len(snapshot_keys)} snapshots uploaded for interview {interview_id}")
         return {"interview_id": interview_id, "status": "uploaded", "count": len(snapshot_keys)}
@@ -3302,52 +4454,52 @@ class AsyncInterviewEndRequest(BaseModel):
     email: str
 
 
-@app.post("/api/candidates/interviews/{interview_id}/async/end")
+@app.post("/api/candidates/interviews/{interview_id}/async/end", status_code=202)
 async def end_async_interview(
     interview_id: str,
     request: AsyncInterviewEndRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """End an asynchronous interview - marks as completed and generates assessment in background."""
-    if db is None:
-        db = next(get_db())
 
     # Verify interview exists and email matches
-    interview = db.query(DBInterview).filter(DBInterview.interview_id == interview_id).first()
+    interview, application, candidate, job_offer = await load_interview_bundle(db, interview_id)
     if not interview:
         raise HTTPException(status_code=404, detail="Interview not found")
 
-    application = db.query(DBApplication).filter(DBApplication.application_id == interview.application_id).first()
     if not application:
         raise HTTPException(status_code=404, detail="Application not found")
 
-    candidate = db.query(DBCandidate).filter(DBCandidate.candidate_id == application.candidate_id).first()
     if not candidate:
         raise HTTPException(status_code=404, detail="Candidate not found")
 
     if candidate.email != request.email:
         raise HTTPException(status_code=403, detail="Access denied. Email does not match interview candidate.")
 
-    # Get job offer for interview context
-    job_offer = db.query(DBJobOffer).filter(DBJobOffer.offer_id == interview.job_offer_id).first()
     if not job_offer:
         raise HTTPException(status_code=404, detail="Job offer not found")
 
-    # Get conversation history
-    conversation_history = []
-    if interview.conversation_history:
-        try:
-            conversation_history = json.loads(interview.conversation_history)
-        except:
-            conversation_history = []
-
-    # Mark as completed immediately so candidate can leave
-    interview.status = "completed"
-    interview.completed_at = datetime.utcnow()
-    if conversation_history:
-        interview.conversation_history = json.dumps(conversation_history)
-    application.interview_completed_at = datetime.utcnow()
-    db.commit()
+    # Get conversation history (from the session log; written to the column once, at completion)
+    conversation_history, _ = await asyncio.to_thread(_interview_conversation, interview)
+
+    # Mark as completed immediately so candidate can leave - one UPDATE per table, no ORM flush
+    completed_at = _utc_now()
+    assessment_status = "pending" if conversation_history else None
+    await db.execute(
+        update(DBInterview).where(DBInterview.interview_id == interview_id).values(
+            status="completed",
+            completed_at=completed_at,
+            assessment_status=assessment_status,
+            conversation_history=conversation_history or None
+        ).execution_options(synchronize_session=False)
+    )
+    await db.execute(
+        update(DBApplication).where(DBApplication.application_id == application.application_id).values(
+            interview_completed_at=completed_at
+        ).execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    await _invalidate_admin_caches()
 
     # Generate assessment in background thread
     if conversation_history and len(conversation_history) > 0:
@@ -3355,111 +4507,95 @@ async def end_async_interview(
         _interview_id = interview.interview_id
         _application_id = application.application_id
         _provider_prefs_str = getattr(interview, 'provider_preferences', None) or ""
-        _job_title = job_offer.title
-        _job_desc = job_offer.description
-        _cv_text = application.cv_text
-        _required_langs = job_offer.required_languages
-        _start_lang = job_offer.interview_start_language or "English"
-        _custom_questions = job_offer.custom_questions
-        _eval_weights = job_offer.evaluation_weights
+        _interview_context = _load_async_interview_context(interview, job_offer, application)
+        _start_lang = _interview_context.get("interview_start_language") or "English"
         _conv_history = list(conversation_history)  # copy
 
         def _run_assessment_background():
             try:
-                from backend.database import SessionLocal
                 db_bg = SessionLocal()
                 try:
                     provider_preferences = {}
                     if _provider_prefs_str:
                         try:
-                            provider_preferences = json.loads(_provider_prefs_str)
-                        except:
+                            provider_preferences = orjson.loads(_provider_prefs_str)
+                        except orjson.JSONDecodeError:
                             pass
 
-                    llm_provider = "gpt"
+                    llm_provider = DEFAULT_LLM_PROVIDER
                     llm_model = provider_preferences.get("llm_model") or LLM_PROVIDERS[llm_provider]["default_model"]
 
-                    logger.info(f"📝 [BG] Generating assessment for interview: {_interview_id}")
-
-                    required_languages_list = []
-                    if _required_langs:
-                        try:
-                            required_languages_list = json.loads(_required_langs)
-                        except:
-                            pass
-
-                    interview_context = {
-                        "job_title": _job_title,
-                        "job_offer_description": _job_desc,
-                        "candidate_cv_text": _cv_text,
-                        "required_languages": _required_langs,
-                        "interview_start_language": _start_lang,
-                        "required_languages_list": required_languages_list,
-                        "custom_questions": _custom_questions,
-                        "evaluation_weights": _eval_weights,
-                    }
+                    logger.debug("[BG] Generating assessment for interview %s (%s)", _interview_id, llm_model)
 
                     llm_funcs = get_llm_functions(llm_provider)
-                    assessment = llm_funcs["generate_assessment"](
-                        conversation_history=_conv_history,
-                        model_id=llm_model,
-                        interview_context=interview_context,
+                    assessment, assessment_hash = _generate_assessment_cached(
+                        db_bg, llm_funcs["generate_assessment"],
+                        _conv_history, llm_model, _interview_context
                     )
 
                     recommendation = extract_recommendation(assessment)
+                    interview_values = {
+                        "assessment": assessment,
+                        "assessment_hash": assessment_hash,
+                        "assessment_status": "ready",
+                        "recommendation": recommendation,
+                        "evaluation_scores": orjson.dumps(extract_detailed_scores(assessment)).decode()
+                    }
 
-                    # Update DB
-                    iv = db_bg.query(DBInterview).filter(DBInterview.interview_id == _interview_id).first()
-                    if iv:
-                        iv.assessment = assessment
-                        iv.recommendation = recommendation
-                        iv.evaluation_scores = json.dumps(extract_detailed_scores(assessment))
-                    app = db_bg.query(DBApplication).filter(DBApplication.application_id == _application_id).first()
-                    if app:
-                        app.interview_assessment = assessment
-                        app.interview_recommendation = recommendation
-                        app.updated_at = datetime.utcnow()
-                    db_bg.commit()
-                    logger.info(f"✅ [BG] Assessment saved for interview: {_interview_id}")
-
-                    # Generate transcript annotations
+                    # Transcript annotations are optional - the assessment is written either way
                     try:
-                        if llm_provider == "gpt":
-                            from backend.services.language_llm_openai import generate_transcript_annotations as gemini_ann
-                            annotations = gemini_ann(conversation_history=_conv_history, model_id=llm_model, feedback_language=_start_lang)
-                        else:
-                            from backend.services.language_llm_openai import generate_transcript_annotations as gem_ann
-                            annotations = gem_ann(conversation_history=_conv_history, model_id=llm_model, feedback_language=_start_lang)
+                        annotations = llm_generate_transcript_annotations(conversation_history=_conv_history, model_id=llm_model, feedback_language=_start_lang)
 
                         for i, msg in enumerate(_conv_history):
                             if msg["role"] == "user":
                                 idx_str = str(i)
                                 if idx_str in annotations:
                                     msg["ai_comment"] = annotations[idx_str]
-
-                        if iv:
-                            iv.conversation_history = json.dumps(_conv_history)
-                            db_bg.commit()
-                        logger.info(f"✅ [BG] Transcript annotations saved for interview: {_interview_id}")
+                        interview_values["conversation_history"] = _conv_history
                     except Exception as e:
                         logger.error(f"❌ [BG] Transcript annotations failed: {e}")
 
+                    # Assessment, annotations and application in one transaction
+                    db_bg.execute(
+                        update(DBInterview).where(DBInterview.interview_id == _interview_id).values(
+                            **interview_values
+                        ).execution_options(synchronize_session=False)
+                    )
+                    db_bg.execute(
+                        update(DBApplication).where(DBApplication.application_id == _application_id).values(
+                            interview_assessment=assessment,
+                            interview_recommendation=recommendation,
+                            updated_at=_utc_now()
+                        ).execution_options(synchronize_session=False)
+                    )
+                    db_bg.commit()
+                    logger.debug("[BG] Assessment saved for interview %s", _interview_id)
+
                 except Exception as e:
                     logger.error(f"❌ [BG] Assessment generation failed for {_interview_id}: {e}")
                     db_bg.rollback()
+                    try:
+                        db_bg.execute(
+                            update(DBInterview).where(DBInterview.interview_id == _interview_id).values(
+                                assessment_status="failed"
+                            ).execution_options(synchronize_session=False)
+                        )
+                        db_bg.commit()
+                    except Exception:
+                        pass
                 finally:
                     db_bg.close()
             except Exception as e:
                 logger.error(f"❌ [BG] Background assessment thread error: {e}")
 
-        import threading
-        threading.Thread(target=_run_assessment_background, daemon=True).start()
+        assessment_executor.submit(_run_assessment_background)
 
-    logger.info(f"✅ Marked async interview as completed (assessment generating in background): {interview_id}")
+    logger.debug("Marked async interview %s as completed (assessment generating in background)", interview_id)
 
     return {
         "interview_id": interview_id,
         "status": "completed",
+        "assessment_status": assessment_status,
         "message": "Interview ended successfully. Assessment is being generated."
     }
 
@@ -3468,184 +4604,212 @@ async def end_async_interview(
 # Admin Endpoints - Dashboard Statistics
 # ============================================================
 
+# Dashboard stats are polled on every admin page load but change far more slowly -
+# serve them from the cache for a few seconds, and drop the entry on writes that change the counts
+DASHBOARD_STATS_CACHE_KEY = "dashboard:stats"
+DASHBOARD_STATS_CACHE_TTL = 10
+
+
 @app.get("/api/admin/dashboard/stats")
 async def get_dashboard_stats(
-    db: Session = Depends(get_db),
     current_admin: DBAdmin = Depends(get_current_admin)
 ):
     """Get dashboard statistics for admin panel."""
-    if db is None:
-        db = next(get_db())
     
-    # Count applications by status
-    total_applications = db.query(DBApplication).count()
-    pending_applications = db.query(DBApplication).filter(DBApplication.hr_status == "pending").count()
-    approved_applications = db.query(DBApplication).filter(DBApplication.ai_status == "approved").count()
-    selected_applications = db.query(DBApplication).filter(DBApplication.hr_status == "selected").count()
-    rejected_applications = db.query(DBApplication).filter(DBApplication.hr_status == "rejected").count()
+    cache_headers = {"Cache-Control": f"private, max-age={DASHBOARD_STATS_CACHE_TTL}"}
+    cached = await cache_get(DASHBOARD_STATS_CACHE_KEY)
+    if cached:
+        return Response(content=cached, media_type="application/json", headers=cache_headers)
     
-    # Count interviews
-    total_interviews = db.query(DBInterview).count()
-    pending_interviews = db.query(DBInterview).filter(DBInterview.status == "pending").count()
-    completed_interviews = db.query(DBInterview).filter(DBInterview.status == "completed").count()
-    
-    # Count job offers
-    total_job_offers = db.query(DBJobOffer).count()
-    active_job_offers = db.query(DBJobOffer).count()  # All are considered active for now
-    
-    # Count candidates
-    total_candidates = db.query(DBCandidate).count()
-    
-    # Recent applications (last 7 days)
+    # One conditional-aggregation query per table instead of a COUNT round-trip per metric
     seven_days_ago = datetime.now() - timedelta(days=7)
-    recent_applications = db.query(DBApplication).filter(
-        DBApplication.submitted_at >= seven_days_ago
-    ).count()
-    
-    # Applications needing review (AI approved but HR pending)
-    needs_review = db.query(DBApplication).filter(
-        and_(
+    app_stats_query = select(
+        func.count(DBApplication.application_id).label("total"),
+        func.count(case((DBApplication.hr_status == "pending", 1))).label("pending"),
+        func.count(case((DBApplication.ai_status == "approved", 1))).label("approved"),
+        func.count(case((DBApplication.hr_status == "selected", 1))).label("selected"),
+        func.count(case((DBApplication.hr_status == "rejected", 1))).label("rejected"),
+        # Applications needing review (AI approved but HR pending)
+        func.count(case((and_(
             DBApplication.ai_status == "approved",
             DBApplication.hr_status == "pending"
-        )
-    ).count()
-    
-    return {
-        "applications": {
-            "total": total_applications,
-            "pending": pending_applications,
-            "approved": approved_applications,
-            "selected": selected_applications,
-            "rejected": rejected_applications,
-            "needs_review": needs_review,
-            "recent": recent_applications
-        },
-        "interviews": {
-            "total": total_interviews,
-            "pending": pending_interviews,
-            "completed": completed_interviews
-        },
-        "job_offers": {
-            "total": total_job_offers,
-            "active": active_job_offers
-        },
-        "candidates": {
-            "total": total_candidates
-        }
-    }
-
-
-# ============================================================
-# Admin Endpoints - Search and Filter
-# ============================================================
-
-@app.get("/api/admin/applications/search")
-async def search_applications(
-    q: Optional[str] = Query(None),
-    job_offer_id: Optional[str] = Query(None),
-    ai_status: Optional[str] = Query(None),
-    hr_status: Optional[str] = Query(None),
-    current_admin: DBAdmin = Depends(get_current_admin),
-    db: Session = Depends(get_db)
-):
-    """
-    Search and filter applications.
-    Combines all filter options.
-    """
-    if db is None:
-        db = next(get_db())
+        ), 1))).label("needs_review"),
+        # Recent applications (last 7 days)
+        func.count(case((DBApplication.submitted_at >= seven_days_ago, 1))).label("recent")
+    )
     
-    query = db.query(DBApplication)
+    interview_stats_query = select(
+        func.count(DBInterview.interview_id).label("total"),
+        func.count(case((DBInterview.status == "pending", 1))).label("pending"),
+        func.count(case((DBInterview.status == "completed", 1))).label("completed")
+    )
     
-    # Apply filters
-    if job_offer_id:
-        query = query.filter(DBApplication.job_offer_id == job_offer_id)
-    if ai_status:
-        query = query.filter(DBApplication.ai_status == ai_status)
-    if hr_status:
-        query = query.filter(DBApplication.hr_status == hr_status)
-    if q:
-        # Search in candidate name, email, or cover letter
-        search_filter = or_(
-            DBCandidate.full_name.ilike(f"%{q}%"),
-            DBCandidate.email.ilike(f"%{q}%"),
-            DBApplication.cover_letter.ilike(f"%{q}%")
-        )
-        query = query.join(DBCandidate).filter(search_filter)
+    # Job offers and candidates only need totals - one statement with two scalar subqueries
+    totals_query = select(
+        select(func.count(DBJobOffer.offer_id)).scalar_subquery().label("job_offers"),
+        select(func.count(DBCandidate.candidate_id)).scalar_subquery().label("candidates")
+    )
     
-    applications = query.order_by(DBApplication.submitted_at.desc()).all()
+    # The queries are independent - run them concurrently, each on its own session
+    # (an AsyncSession can only run one statement at a time)
+    async def fetch_row(query):
+        async with AsyncSessionLocal() as session:
+            return (await session.execute(query)).one()
     
-    result = []
-    for app in applications:
-        candidate = db.query(DBCandidate).filter(DBCandidate.candidate_id == app.candidate_id).first()
-        job_offer = db.query(DBJobOffer).filter(DBJobOffer.offer_id == app.job_offer_id).first()
-        
-        result.append({
-            "application_id": app.application_id,
-            "candidate_name": candidate.full_name,
-            "candidate_email": candidate.email,
-            "job_title": job_offer.title if job_offer else "Unknown",
-            "ai_status": app.ai_status,
-            "hr_status": app.hr_status,
-            "submitted_at": app.submitted_at.isoformat() if app.submitted_at else None
-        })
+    app_stats, interview_stats, totals = await asyncio.gather(
+        fetch_row(app_stats_query),
+        fetch_row(interview_stats_query),
+        fetch_row(totals_query)
+    )
     
-    return {"results": result, "count": len(result)}
+    # Query labels match the response keys - each row maps straight into its section
+    stats = {
+        "applications": dict(app_stats._mapping),
+        "interviews": dict(interview_stats._mapping),
+        "job_offers": {
+            "total": totals.job_offers,
+            "active": totals.job_offers  # All are considered active for now
+        },
+        "candidates": {
+            "total": totals.candidates
+        }
+    }
+    payload = orjson.dumps(stats)
+    await cache_set(DASHBOARD_STATS_CACHE_KEY, payload, DASHBOARD_STATS_CACHE_TTL)
+    return Response(content=payload, media_type="application/json", headers=cache_headers)
 
 
-@app.get("/api/admin/candidates/search")
-async def search_candidates(
-    q: Optional[str] = Query(None),
-    skills: Optional[str] = Query(None),
-    db: Session = Depends(get_db)
-):
+def annotate_transcript(history: list, model_id: Optional[str] = None, feedback_language: Optional[str] = None) -> bool:
+    """Attach the AI feedback for each candidate answer (ai_comment) to history, in place.
+
+    Annotations are optional: returns False, leaving history unchanged, if they fail.
     """
-    Search candidates by name, email, or skills (in CV text).
+    try:
+        annotations = llm_generate_transcript_annotations(
+            conversation_history=history, model_id=model_id, feedback_language=feedback_language
+        )
+    except Exception as e:
+        logger.error(f"❌ Transcript annotations failed: {e}")
+        return False
+    for i, msg in enumerate(history):
+        if msg["role"] == "user" and str(i) in annotations:
+            msg["ai_comment"] = annotations[str(i)]
+    return True
+
+
+def persist_interview_assessment(db: Session, config: dict, assessment: str, history: list, candidate_name: Optional[str]):
+    """Store a finished real-time interview's assessment on its interview (created if missing) and application.
+
+    Writes in the caller's transaction - the caller commits. Returns (interview, recommendation).
     """
-    if db is None:
-        db = next(get_db())
-    
-    query = db.query(DBCandidate)
-    
-    if q:
-        query = query.filter(
-            or_(
-                DBCandidate.full_name.ilike(f"%{q}%"),
-                DBCandidate.email.ilike(f"%{q}%")
-            )
+    recommendation = extract_recommendation(assessment)
+    detailed_scores = extract_detailed_scores(assessment)
+
+    application_id = config.get("application_id")
+    if not application_id:
+        evaluation_id = config.get("evaluation_id")
+        if evaluation_id:
+            if evaluation_id in cv_evaluations:
+                application_id = cv_evaluations[evaluation_id].get("application_id")
+            if not application_id:
+                cv_eval = db.query(DBCVEvaluation.application_id).filter(
+                    DBCVEvaluation.evaluation_id == evaluation_id
+                ).first()
+                if cv_eval:
+                    application_id = cv_eval.application_id
+
+    # The session's own interview row first, then the application's latest
+    interview = None
+    if config.get("interview_id"):
+        interview = db.query(DBInterview).filter(DBInterview.interview_id == config["interview_id"]).first()
+    if not interview and application_id:
+        interview = db.query(DBInterview).filter(
+            DBInterview.application_id == application_id
+        ).order_by(DBInterview.created_at.desc()).first()
+
+    now = _utc_now()
+    if not interview:
+        interview = DBInterview(
+            application_id=application_id,
+            job_offer_id=config.get("job_offer_id") or "",
+            candidate_name=candidate_name,
+            cv_text=config.get("candidate_cv_text_trimmed"),
+            status="completed",
+            assessment=assessment,
+            recommendation=recommendation,
+            evaluation_scores=orjson.dumps(detailed_scores).decode(),
+            conversation_history=history,
+            completed_at=now
         )
-    
-    candidates = query.all()
-    
-    result = []
-    for candidate in candidates:
-        # If skills filter, check in applications' CV text
-        if skills:
-            applications = db.query(DBApplication).filter(DBApplication.candidate_id == candidate.candidate_id).all()
-            has_skills = any(skills.lower() in app.cv_text.lower() for app in applications)
-            if not has_skills:
-                continue
-        
-        applications = db.query(DBApplication).filter(DBApplication.candidate_id == candidate.candidate_id).all()
-        
-        result.append({
-            "candidate_id": candidate.candidate_id,
-            "full_name": candidate.full_name,
-            "email": candidate.email,
-            "phone": candidate.phone,
-            "total_applications": len(applications),
-            "latest_application": applications[0].submitted_at.isoformat() if applications else None
-        })
-    
-    return {"results": result, "count": len(result)}
+        db.add(interview)
+    else:
+        interview.status = "completed"
+        interview.assessment = assessment
+        interview.recommendation = recommendation
+        interview.evaluation_scores = orjson.dumps(detailed_scores).decode()
+        interview.conversation_history = history
+        interview.completed_at = now
+
+    if application_id:
+        # Single UPDATE - the application row isn't loaded first
+        db.query(DBApplication).filter(DBApplication.application_id == application_id).update({
+            DBApplication.interview_completed_at: now,
+            DBApplication.interview_assessment: assessment,
+            DBApplication.interview_recommendation: recommendation,
+            DBApplication.updated_at: now
+        }, synchronize_session=False)
+
+    return interview, recommendation
+
+
+async def wait_for_audio_drain(websocket: WebSocket, timeout: float, deferred: Optional[deque] = None) -> bool:
+    """Wait until the client reports its last audio finished playing, at most timeout seconds.
+
+    The client sends {"type": "audio_done"} when playback ends. Returns False if the client
+    disconnected meanwhile (the socket must not be closed again). Other messages received
+    while waiting are appended to deferred, if given, for the caller's message loop.
+    """
+    if websocket.client_state == WebSocketState.DISCONNECTED:
+        return False
+
+    async def receive_audio_done() -> bool:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                if deferred is not None:
+                    deferred.append(message)
+                return False
+            text = message.get("text")
+            if text:
+                try:
+                    if orjson.loads(text).get("type") == "audio_done":
+                        return True
+                except (orjson.JSONDecodeError, AttributeError):
+                    pass  # Late non-JSON frames are passed on as they are
+            if deferred is not None:
+                deferred.append(message)
+
+    try:
+        return await asyncio.wait_for(receive_audio_done(), timeout)
+    except asyncio.TimeoutError:
+        return True
+    except (WebSocketDisconnect, RuntimeError):
+        # The disconnect was already consumed (receive() can't be called again)
+        return False
+
+
+def time_limit_remaining(conversation_id: str, sessions: dict) -> Optional[float]:
+    """Seconds left before the interview time limit, or None if the conversation isn't timed."""
+    state = sessions.get(conversation_id)
+    if state is None:
+        return None
+    return max(0.0, state.started_at + state.runtime.interview_time_limit * 60 - time.time())
 
 
 async def check_and_handle_time_limit(
     conversation_id: str,
     websocket: WebSocket,
-    active_conversations: dict,
-    session_configs: dict,
-    interview_start_times: dict
+    sessions: dict
 ) -> bool:
     """
     Check if interview time limit has been exceeded and end interview if so.
@@ -3653,27 +4817,22 @@ async def check_and_handle_time_limit(
     Returns:
         True if interview should continue, False if it was ended due to time limit
     """
-    if conversation_id not in interview_start_times:
+    state = sessions.get(conversation_id)
+    if state is None:
         return True  # No time tracking, continue
     
-    start_time = interview_start_times[conversation_id]
-    elapsed_minutes = (time.time() - start_time) / 60
+    elapsed_minutes = (time.time() - state.started_at) / 60
     
-    # Get the interview duration from config (defaults to global limit)
-    config = session_configs.get(conversation_id, {})
-    time_limit = config.get("interview_duration_minutes", INTERVIEW_TIME_LIMIT_MINUTES)
+    # Interview duration from the session (defaults to global limit)
+    time_limit = state.runtime.interview_time_limit
     
     if elapsed_minutes >= time_limit:
         logger.info(f"⏰ Time limit reached for {conversation_id}: {elapsed_minutes:.2f} minutes >= {time_limit} minutes")
         
-        # Get conversation and config
-        if conversation_id not in active_conversations:
-            return False
-        
-        conv = active_conversations[conversation_id]
+        conv = state.conversation
         history = conv.get_history_for_llm()
         interview_context = conv.get_interview_context()
-        config = session_configs.get(conversation_id, {})
+        config = state.config
         
         # Only generate assessment if we're in the actual interview phase
         current_phase = conv.get_current_phase()
@@ -3687,142 +4846,46 @@ async def check_and_handle_time_limit(
             try:
                 assessment = llm_funcs["generate_assessment"](
                     history, 
-                    model_id=config.get("llm_model", LLM_PROVIDERS[config.get("llm_provider", DEFAULT_LLM_PROVIDER)]["default_model"]),
+                    model_id=config.get("llm_model", LLM_MODEL),
                     interview_context=interview_context
                 )
                 
-                # Store assessment in database (same logic as end_interview)
+                # Transcript annotations (AI feedback) are generated first so they go into the same write
+                annotate_transcript(history, model_id=config.get("llm_model", LLM_MODEL), feedback_language=conv.interview_start_language if conv else None)
+                
+                # Store assessment in database
+                db = SessionLocal(expire_on_commit=False)
                 try:
-                    db = next(get_db())
-                    
-                    recommendation = extract_recommendation(assessment)
-                    detailed_scores = extract_detailed_scores(assessment)
-                    
-                    application_id = config.get("application_id")
-                    if not application_id:
-                        evaluation_id = config.get("evaluation_id")
-                        if evaluation_id:
-                            if evaluation_id in cv_evaluations:
-                                application_id = cv_evaluations[evaluation_id].get("application_id")
-                            if not application_id:
-                                cv_eval = db.query(DBCVEvaluation).filter(
-                                    DBCVEvaluation.evaluation_id == evaluation_id
-                                ).first()
-                                if cv_eval:
-                                    application_id = cv_eval.application_id
-                    
-                    job_offer_id = config.get("job_offer_id")
-                    candidate_name = conv.get_candidate_name() or config.get("candidate_name")
-                    cv_text = config.get("candidate_cv_text", "")
-                    
-                    interview = None
-                    if application_id:
-                        interview = db.query(DBInterview).filter(
-                            DBInterview.application_id == application_id
-                        ).order_by(DBInterview.created_at.desc()).first()
-                    
-                    if not interview:
-                        interview = DBInterview(
-                            application_id=application_id,
-                            job_offer_id=job_offer_id or "",
-                            candidate_name=candidate_name,
-                            cv_text=cv_text[:5000] if cv_text else None,
-                            status="completed",
-                            assessment=assessment,
-                            recommendation=recommendation,
-                            evaluation_scores=json.dumps(detailed_scores),
-                            conversation_history=json.dumps(history),
-                            completed_at=datetime.now()
+                    # Interview (with the annotated transcript) and application are written together or not at all
+                    with db.begin():
+                        interview, recommendation = persist_interview_assessment(
+                            db, config, assessment, history, conv.get_candidate_name() or config.get("candidate_name")
                         )
-                        db.add(interview)
-                    else:
-                        interview.status = "completed"
-                        interview.assessment = assessment
-                        interview.recommendation = recommendation
-                        interview.evaluation_scores = json.dumps(detailed_scores)
-                        interview.conversation_history = json.dumps(history)
-                        interview.completed_at = datetime.now()
-                    
-                    if application_id:
-                        application = db.query(DBApplication).filter(
-                            DBApplication.application_id == application_id
-                        ).first()
-                        if application:
-                            application.interview_completed_at = datetime.now()
-                            application.interview_assessment = assessment
-                            application.interview_recommendation = recommendation
-                            application.updated_at = datetime.now()
                     
-                    db.commit()
                     logger.info(f"✅ Time-limited interview assessment stored: interview_id={interview.interview_id}")
-                    
-                    # Generate transcript annotations (AI feedback per user message)
-                    try:
-                        llm_provider_tl = config.get("llm_provider", DEFAULT_LLM_PROVIDER)
-                        llm_model_tl = config.get("llm_model", LLM_PROVIDERS[llm_provider_tl]["default_model"])
-                        _tl_ann_lang = conv.interview_start_language if conv else None
-                        if llm_provider_tl == "gpt" or llm_provider_tl == "openai":
-                            from backend.services.language_llm_openai import generate_transcript_annotations as gemini_generate_transcript_annotations
-                            annotations = gemini_generate_transcript_annotations(conversation_history=history, model_id=llm_model_tl, feedback_language=_tl_ann_lang)
-                        else:
-                            from backend.services.language_llm_openai import generate_transcript_annotations as gemini_generate_transcript_annotations
-                            annotations = gemini_generate_transcript_annotations(conversation_history=history, model_id=llm_model_tl, feedback_language=_tl_ann_lang)
-                        
-                        for i, msg in enumerate(history):
-                            if msg["role"] == "user":
-                                idx_str = str(i)
-                                if idx_str in annotations:
-                                    msg["ai_comment"] = annotations[idx_str]
-                        
-                        interview.conversation_history = json.dumps(history)
-                        db.commit()
-                        logger.info(f"✅ Transcript annotations saved for time-limited interview: {interview.interview_id}")
-                    except Exception as e:
-                        logger.error(f"❌ Failed to generate transcript annotations for time-limited interview: {e}")
-                    
                 except Exception as e:
                     logger.error(f"❌ Error storing time-limited interview assessment: {e}")
-                    db.rollback() if 'db' in locals() else None
+                finally:
+                    db.close()
                 
                 # Store the full assessment in the database (already done above)
                 # But send neutral message to candidate (no feedback)
                 logger.info(f"📊 Assessment generated and stored. Sending neutral message to candidate.")
                 
-                await websocket.send_json({
-                    "type": "assessment",
-                    "assessment": "**Interview Completed**\n\nThank you for your time! Our HR team will review your application and get back to you soon.\n\nWe appreciate your interest in this position.",
-                    "time_limit_reached": True
-                })
             except Exception as e:
                 logger.error(f"❌ Error generating assessment for time-limited interview: {e}")
-                await websocket.send_json({
-                    "type": "assessment",
-                    "assessment": "**Interview Completed**\n\nThank you for your time! Our HR team will review your application and get back to you soon.\n\nWe appreciate your interest in this position.",
-                    "time_limit_reached": True
-                })
-        else:
-            await websocket.send_json({
-                "type": "assessment",
-                "assessment": "**Interview Completed**\n\nThank you for your time! Our HR team will review your application and get back to you soon.\n\nWe appreciate your interest in this position.",
-                "time_limit_reached": True
-            })
+        
+        await websocket.send_text(TIME_LIMIT_ASSESSMENT_PAYLOAD)
         
         # Clean up
-        if conversation_id in active_conversations:
-            del active_conversations[conversation_id]
-        if conversation_id in session_configs:
-            del session_configs[conversation_id]
-        if conversation_id in interview_start_times:
-            del interview_start_times[conversation_id]
-        cleanup_dedup_cache(conversation_id)
+        release_conversation_state(conversation_id)
         
         # Wait for any final audio to finish playing before closing
-        logger.info("⏳ Waiting 10 seconds for any audio to finish...")
-        await asyncio.sleep(10)
-        
-        # Close WebSocket connection
-        logger.info(f"🔌 Closing WebSocket connection after time limit")
-        await websocket.close(code=1000, reason="Interview time limit reached")
+        logger.info("⏳ Waiting for the client to finish playing audio...")
+        if await wait_for_audio_drain(websocket, timeout=10):
+            # Close WebSocket connection
+            logger.info(f"🔌 Closing WebSocket connection after time limit")
+            await websocket.close(code=1000, reason="Interview time limit reached")
         
         return False  # Interview ended
     
@@ -3836,6 +4899,7 @@ async def websocket_endpoint(websocket: WebSocket):
     
     conversation_id = None
     conversation = None
+    db_ws = None
     
     try:
         # Wait for conversation initialization
@@ -3850,7 +4914,8 @@ async def websocket_endpoint(websocket: WebSocket):
             
             logger.info(f"🚀 Starting interview - evaluation_id: {evaluation_id}, application_id: {application_id}, interview_id: {interview_id}")
             
-            db_ws = next(get_db())
+            # Async session - the lookups and completion writes are awaited instead of blocking the loop
+            db_ws = AsyncSessionLocal()
             candidate_cv_text = ""
             job_offer = None
             job_offer_id = None
@@ -3861,14 +4926,17 @@ async def websocket_endpoint(websocket: WebSocket):
                 interview = None
                 application = None
                 
+                # The candidate is loaded with the application (no lazy loads on an async session)
                 if interview_id:
-                    interview = db_ws.query(DBInterview).filter(DBInterview.interview_id == interview_id).first()
+                    interview = await db_ws.get(DBInterview, interview_id)
                     if interview and interview.application_id:
-                        application = db_ws.query(DBApplication).filter(DBApplication.application_id == interview.application_id).first()
+                        application = await db_ws.get(DBApplication, interview.application_id, options=[selectinload(DBApplication.candidate)])
                 elif application_id:
-                    application = db_ws.query(DBApplication).filter(DBApplication.application_id == application_id).first()
+                    application = await db_ws.get(DBApplication, application_id, options=[selectinload(DBApplication.candidate)])
                     if application:
-                        interview = db_ws.query(DBInterview).filter(DBInterview.application_id == application_id).order_by(DBInterview.created_at.desc()).first()
+                        interview = (await db_ws.execute(
+                            select(DBInterview).where(DBInterview.application_id == application_id).order_by(DBInterview.created_at.desc()).limit(1)
+                        )).scalars().first()
                 
                 if not application:
                     await websocket.send_json({
@@ -3905,7 +4973,7 @@ async def websocket_endpoint(websocket: WebSocket):
                     return
                 
                 # Get job offer
-                db_job_offer = db_ws.query(DBJobOffer).filter(DBJobOffer.offer_id == job_offer_id).first()
+                db_job_offer = await db_ws.get(DBJobOffer, job_offer_id)
                 if not db_job_offer:
                     await websocket.send_json({
                         "type": "error",
@@ -3927,6 +4995,7 @@ async def websocket_endpoint(websocket: WebSocket):
                 
                 # Store language requirements and duration for interview
                 required_languages = db_job_offer.required_languages or ""
+                required_languages_list = db_job_offer.required_languages_list or []
                 interview_start_language = db_job_offer.interview_start_language or ""
                 interview_duration_minutes = db_job_offer.interview_duration_minutes or INTERVIEW_TIME_LIMIT_MINUTES
                 custom_questions = db_job_offer.custom_questions or ""
@@ -3934,6 +5003,7 @@ async def websocket_endpoint(websocket: WebSocket):
             else:
                 # Initialize language variables if not set
                 required_languages = ""
+                required_languages_list = []
                 interview_start_language = ""
                 custom_questions = ""
                 evaluation_weights = ""
@@ -3958,7 +5028,7 @@ async def websocket_endpoint(websocket: WebSocket):
                 # Get job offer details for interview context
                 job_offer_id = evaluation.get("job_offer_id")
                 if job_offer_id:
-                    db_job_offer = db_ws.query(DBJobOffer).filter(DBJobOffer.offer_id == job_offer_id).first()
+                    db_job_offer = await db_ws.get(DBJobOffer, job_offer_id)
                     if db_job_offer:
                         from backend.models.job_offer import JobOffer
                         job_offer = JobOffer(
@@ -3971,6 +5041,7 @@ async def websocket_endpoint(websocket: WebSocket):
                         )
                         # Get language requirements and duration
                         required_languages = db_job_offer.required_languages or ""
+                        required_languages_list = db_job_offer.required_languages_list or []
                         interview_start_language = db_job_offer.interview_start_language or ""
                         interview_duration_minutes = db_job_offer.interview_duration_minutes or INTERVIEW_TIME_LIMIT_MINUTES
                         custom_questions = db_job_offer.custom_questions or ""
@@ -3978,9 +5049,14 @@ async def websocket_endpoint(websocket: WebSocket):
                 
                 candidate_cv_text = evaluation.get("parsed_cv_text", "")
             
+            # End the read transaction so the session holds no pooled connection for the rest of the interview
+            await db_ws.commit()
+            
             # Ensure we have language and duration variables initialized
             if 'required_languages' not in locals():
                 required_languages = ""
+            if 'required_languages_list' not in locals():
+                required_languages_list = []
             if 'interview_start_language' not in locals():
                 interview_start_language = ""
             if 'interview_duration_minutes' not in locals():
@@ -3991,7 +5067,7 @@ async def websocket_endpoint(websocket: WebSocket):
                 evaluation_weights = ""
             
             # Create new conversation with job and candidate context
-            conversation_id = f"conv_{len(active_conversations)}"
+            conversation_id = f"conv_{uuid.uuid4().hex}"  # Unique across concurrent starts (the dict size was not)
             conversation = ConversationManager(
                 job_offer_description=job_offer.get_full_description() if job_offer else None,
                 candidate_cv_text=candidate_cv_text,
@@ -4005,30 +5081,34 @@ async def websocket_endpoint(websocket: WebSocket):
             if 'candidate_name_from_cv' in locals() and candidate_name_from_cv:
                 conversation.set_cv_candidate_name(candidate_name_from_cv)
                 logger.info(f"✅ Set CV candidate name: {candidate_name_from_cv}")
-            active_conversations[conversation_id] = conversation
             
             logger.info(f"📋 Interview context set - Job: {job_offer.title if job_offer else 'Unknown'}, CV: {len(candidate_cv_text)} chars")
             
             # Store session configuration — always OpenAI Realtime for real-time
             config = {
                 "tts_provider": DEFAULT_TTS_PROVIDER,
-                "tts_model": TTS_PROVIDERS[DEFAULT_TTS_PROVIDER]["default_model"],
+                "tts_model": TTS_MODEL,
                 "stt_provider": DEFAULT_STT_PROVIDER,
-                "stt_model": STT_PROVIDERS[DEFAULT_STT_PROVIDER]["default_model"],
+                "stt_model": STT_MODEL,
                 "llm_provider": DEFAULT_LLM_PROVIDER,
-                "llm_model": LLM_PROVIDERS[DEFAULT_LLM_PROVIDER]["default_model"],
+                "llm_model": LLM_MODEL,
                 "evaluation_id": evaluation_id,
                 "application_id": application_id,
                 "interview_id": interview_id,
                 "job_offer_id": job_offer_id,
                 "candidate_cv_text": candidate_cv_text,
+                # Trimmed once here for the fallback interview row rather than at every completion
+                "candidate_cv_text_trimmed": candidate_cv_text[:5000] if candidate_cv_text else None,
                 "candidate_name": candidate_name_from_cv if 'candidate_name_from_cv' in locals() and candidate_name_from_cv else None,
                 "interview_duration_minutes": interview_duration_minutes
             }
-            session_configs[conversation_id] = config
-
-            # Track interview start time for time limit
-            interview_start_times[conversation_id] = time.time()
+            # Start time tracks the time limit
+            sessions[conversation_id] = SessionState(
+                conversation=conversation,
+                config=config,
+                runtime=SessionRuntime.from_config(config),
+                started_at=time.time()
+            )
 
             logger.info(f"🚀 New interview started: {conversation_id}")
             logger.info(f"⏱️ Time limit: {interview_duration_minutes} minutes")
@@ -4039,7 +5119,6 @@ async def websocket_endpoint(websocket: WebSocket):
             if True:  # Always use OpenAI Realtime for real-time interviews
                 logger.info("🎙️ OPENAI REALTIME MODE — real-time audio conversation")
                 from backend.services.openai_realtime import OpenAIRealtimeSession
-                from backend.config import OPENAI_API_KEY, OPENAI_REALTIME_MODEL, OPENAI_REALTIME_VOICE, build_interviewer_system_prompt
 
                 # Build system prompt with full interview context
                 live_system_prompt = build_interviewer_system_prompt(
@@ -4054,13 +5133,8 @@ async def websocket_endpoint(websocket: WebSocket):
                     custom_questions=custom_questions,
                     evaluation_weights=evaluation_weights,
                 )
-                # Parse required languages for multi-language support
-                _req_langs_list = []
-                if required_languages:
-                    try:
-                        _req_langs_list = json.loads(required_languages) if required_languages else []
-                    except Exception:
-                        _req_langs_list = []
+                # Required languages for multi-language support (parsed when the offer was saved)
+                _req_langs_list = required_languages_list
                 # Parse custom questions count for end-interview guard
                 _custom_questions_count = 0
                 if custom_questions:
@@ -4207,12 +5281,12 @@ MULTI-LANGUAGE INTERVIEW — MANDATORY:
                         return
                     # Capture AI audio for full interview recording
                     recording_timeline.append(("output", pcm_base64))
+                    # Raw PCM goes out as a binary frame (no base64/JSON envelope) - the client
+                    # treats binary frames without a pending audio message as live audio
+                    pcm_bytes = base64.b64decode(pcm_base64)
                     async with ws_lock:
                         try:
-                            await websocket.send_json({
-                                "type": "live_audio",
-                                "audio": pcm_base64,
-                            })
+                            await websocket.send_bytes(pcm_bytes)
                         except Exception:
                             pass
 
@@ -4377,7 +5451,7 @@ MULTI-LANGUAGE INTERVIEW — MANDATORY:
 
                     # Guard 2: reject if untested languages remain in multi-language interviews
                     if _req_langs_list and len(_req_langs_list) > 1 and reason != "candidate_requested":
-                        untested = [l for l in _req_langs_list if l not in conversation.get_tested_languages()]
+                        untested = conversation.get_untested_languages()
                         if untested:
                             next_lang = untested[0]
                             logger.warning(f"🚫 Rejected end_interview: untested languages remain: {untested}")
@@ -4622,7 +5696,7 @@ MULTI-LANGUAGE INTERVIEW — MANDATORY:
                             # --- LANGUAGE SWITCH LOGIC ---
                             # Strategy: At Q3, buffer a hint so the model incorporates the switch
                             # into its NEXT natural response. If ignored by Q5+, force it.
-                            untested = [l for l in _req_langs_list if l not in conversation.get_tested_languages()]
+                            untested = conversation.get_untested_languages()
 
                             if untested and not switch_sent[0] and not is_forced_switch_turn:
                                 if questions_in_current_lang[0] >= 3:
@@ -4712,7 +5786,7 @@ MULTI-LANGUAGE INTERVIEW — MANDATORY:
                     while not live_concluded:
                         if not session.connected:
                             # Check if we should attempt reconnection
-                            untested_langs = [l for l in _req_langs_list if l not in conversation.get_tested_languages()] if _req_langs_list and len(_req_langs_list) > 1 else []
+                            untested_langs = conversation.get_untested_languages() if _req_langs_list and len(_req_langs_list) > 1 else []
                             if not interview_ending and untested_langs and reconnect_attempts[0] < max_reconnects:
                                 reconnect_attempts[0] += 1
                                 logger.warning(f"⚠️ OpenAI Realtime disconnected with untested languages {untested_langs} — attempting reconnect ({reconnect_attempts[0]}/{max_reconnects})")
@@ -4775,7 +5849,7 @@ MULTI-LANGUAGE INTERVIEW — MANDATORY:
                             message = await asyncio.wait_for(websocket.receive(), timeout=1.0)
                         except asyncio.TimeoutError:
                             # Check if interview time has expired
-                            elapsed = (time.time() - interview_start_times.get(conversation_id, time.time())) / 60
+                            elapsed = (time.time() - sessions[conversation_id].started_at) / 60 if conversation_id in sessions else 0
                             if elapsed >= interview_duration_minutes + 1:
                                 logger.info(f"⏰ Interview time limit exceeded ({elapsed:.0f} min) — forcing exit (ai_turns={ai_turn_count[0]}, tested={conversation.get_tested_languages()})")
                                 break
@@ -4783,7 +5857,7 @@ MULTI-LANGUAGE INTERVIEW — MANDATORY:
                             if _req_langs_list and len(_req_langs_list) > 1 and not switch_sent[0]:
                                 halfway = interview_duration_minutes / 2
                                 if elapsed >= halfway:
-                                    untested = [l for l in _req_langs_list if l not in conversation.get_tested_languages()]
+                                    untested = conversation.get_untested_languages()
                                     if untested:
                                         next_lang = untested[0]
                                         switch_sent[0] = True
@@ -4842,42 +5916,42 @@ MULTI-LANGUAGE INTERVIEW — MANDATORY:
                     # Now close the session
                     await session.close()
 
-                    # If AI concluded, wait for the farewell audio to finish playing
+                    # If AI concluded, wait (at most 5s) for the client to report the farewell audio played
                     if live_concluded or interview_ending:
                         logger.info("⏳ Waiting for conclusion audio to finish playing...")
-                        await asyncio.sleep(5)
+                        await wait_for_audio_drain(websocket, timeout=5)
 
                     # Generate assessment for any interview with conversation history
                     history = conversation.get_history_for_llm() if conversation else []
                     if len(history) >= 2:
                         # Mark interview as completed and save transcript IMMEDIATELY
-                        _fin_config = session_configs.get(conversation_id, {})
+                        _fin_config = session_config(conversation_id)
                         _app_id_fin = _fin_config.get("application_id")
                         _iv_id_fin = _fin_config.get("interview_id")
                         _iv_fin = None
                         try:
                             # Look up by interview_id first (most reliable), then application_id
                             if _iv_id_fin:
-                                _iv_fin = db_ws.query(DBInterview).filter(
-                                    DBInterview.interview_id == _iv_id_fin
-                                ).first()
+                                _iv_fin = await db_ws.get(DBInterview, _iv_id_fin)
                             if not _iv_fin and _app_id_fin:
-                                _iv_fin = db_ws.query(DBInterview).filter(
-                                    DBInterview.application_id == _app_id_fin
-                                ).order_by(DBInterview.created_at.desc()).first()
+                                _iv_fin = (await db_ws.execute(
+                                    select(DBInterview).where(
+                                        DBInterview.application_id == _app_id_fin
+                                    ).order_by(DBInterview.created_at.desc()).limit(1)
+                                )).scalars().first()
 
                             if _iv_fin:
+                                now = _utc_now()
                                 if _iv_fin.status != "completed":
                                     _iv_fin.status = "completed"
-                                    _iv_fin.completed_at = datetime.now()
+                                    _iv_fin.completed_at = now
                                 # Also update the application
                                 if _iv_fin.application_id:
-                                    _app_fin = db_ws.query(DBApplication).filter(
-                                        DBApplication.application_id == _iv_fin.application_id
-                                    ).first()
-                                    if _app_fin:
-                                        _app_fin.interview_completed_at = datetime.now()
-                                        _app_fin.updated_at = datetime.now()
+                                    await db_ws.execute(
+                                        update(DBApplication).where(
+                                            DBApplication.application_id == _iv_fin.application_id
+                                        ).values(interview_completed_at=now, updated_at=now).execution_options(synchronize_session=False)
+                                    )
                                 # Upload per-turn audio files and update history with audio_key
                                 if per_turn_audio_data:
                                     import struct, io
@@ -4908,7 +5982,7 @@ MULTI-LANGUAGE INTERVIEW — MANDATORY:
                                     for msg in history:
                                         msg.pop("audio_turn", None)
                                 # Save transcript immediately so admin can see it
-                                _iv_fin.conversation_history = json.dumps(history)
+                                _iv_fin.conversation_history = history
                                 # Save full interview recording (both AI + candidate audio) as WAV to S3
                                 logger.info(f"📊 Audio: {len(recording_timeline)} timeline chunks, {len(per_turn_audio_data)} per-turn segments")
                                 if recording_timeline:
@@ -4966,11 +6040,11 @@ MULTI-LANGUAGE INTERVIEW — MANDATORY:
                                             wav_bytes = wav_buf.getvalue()
                                             audio_key = f"recordings/{_iv_fin.interview_id}.wav"
                                             s3_upload(wav_bytes, audio_key, content_type="audio/wav", local_dir=UPLOADS_DIR)
-                                            _iv_fin.recording_audio = audio_key
+                                            _iv_fin.recording_audio_path = audio_key
                                             logger.info(f"💾 Saved full interview recording ({len(pcm_data)} bytes PCM → WAV) to {audio_key}")
                                     except Exception as e:
                                         logger.error(f"Failed to save audio recording: {e}")
-                                db_ws.commit()
+                                await db_ws.commit()
                                 logger.info(f"✅ Live interview {_iv_fin.interview_id} marked completed with transcript ({len(history)} messages)")
                             else:
                                 logger.warning(f"⚠️ Could not find interview record to mark completed (interview_id={_iv_id_fin}, application_id={_app_id_fin})")
@@ -4981,7 +6055,7 @@ MULTI-LANGUAGE INTERVIEW — MANDATORY:
                         try:
                             await websocket.send_json({
                                 "type": "assessment",
-                                "assessment": "**Interview Completed**\n\nThank you for your time! Our HR team will review your application and get back to you soon.\n\nWe appreciate your interest in this position."
+                                "assessment": INTERVIEW_COMPLETED_MESSAGE
                             })
                         except Exception:
                             pass
@@ -4989,103 +6063,30 @@ MULTI-LANGUAGE INTERVIEW — MANDATORY:
                         # Log tested languages before assessment
                         if _req_langs_list and len(_req_langs_list) > 1:
                             tested = conversation.get_tested_languages()
-                            untested = [l for l in _req_langs_list if l not in tested]
+                            untested = conversation.get_untested_languages()
                             logger.info(f"🌐 Assessment: Tested languages: {list(tested)}, Untested: {untested}")
 
                         # Run assessment + DB write in background
                         _history_f = list(history)
                         _ctx_f = dict(conversation.get_interview_context()) if conversation.get_interview_context() else {}
-                        _config_f = dict(session_configs.get(conversation_id, {}))
+                        _config_f = dict(session_config(conversation_id))
                         _candidate_name_f = conversation.get_candidate_name() or _config_f.get("candidate_name")
                         _feedback_language_f = interview_start_language or None
 
                         def _run_live_final_assessment_bg():
                             try:
-                                from backend.database import SessionLocal
                                 db_bg = SessionLocal()
                                 try:
-                                    from backend.services.openai_llm import generate_assessment as gen_assess
-                                    assessment = gen_assess(_history_f, interview_context=_ctx_f)
-                                    recommendation = extract_recommendation(assessment)
-                                    detailed_scores = extract_detailed_scores(assessment)
-
-                                    application_id = _config_f.get("application_id")
-                                    if not application_id:
-                                        evaluation_id = _config_f.get("evaluation_id")
-                                        if evaluation_id:
-                                            if evaluation_id in cv_evaluations:
-                                                application_id = cv_evaluations[evaluation_id].get("application_id")
-                                            if not application_id:
-                                                cv_eval = db_bg.query(DBCVEvaluation).filter(
-                                                    DBCVEvaluation.evaluation_id == evaluation_id
-                                                ).first()
-                                                if cv_eval:
-                                                    application_id = cv_eval.application_id
-
-                                    job_offer_id = _config_f.get("job_offer_id")
-                                    cv_text = _config_f.get("candidate_cv_text", "")
-
-                                    interview_rec = None
-                                    _bg_iv_id = _config_f.get("interview_id")
-                                    if _bg_iv_id:
-                                        interview_rec = db_bg.query(DBInterview).filter(
-                                            DBInterview.interview_id == _bg_iv_id
-                                        ).first()
-                                    if not interview_rec and application_id:
-                                        interview_rec = db_bg.query(DBInterview).filter(
-                                            DBInterview.application_id == application_id
-                                        ).order_by(DBInterview.created_at.desc()).first()
-
-                                    if not interview_rec:
-                                        interview_rec = DBInterview(
-                                            application_id=application_id,
-                                            job_offer_id=job_offer_id or "",
-                                            candidate_name=_candidate_name_f,
-                                            cv_text=cv_text[:5000] if cv_text else None,
-                                            status="completed",
-                                            assessment=assessment,
-                                            recommendation=recommendation,
-                                            evaluation_scores=json.dumps(detailed_scores),
-                                            conversation_history=json.dumps(_history_f),
-                                            completed_at=datetime.now()
-                                        )
-                                        db_bg.add(interview_rec)
-                                    else:
-                                        interview_rec.status = "completed"
-                                        interview_rec.assessment = assessment
-                                        interview_rec.recommendation = recommendation
-                                        interview_rec.evaluation_scores = json.dumps(detailed_scores)
-                                        interview_rec.conversation_history = json.dumps(_history_f)
-                                        interview_rec.completed_at = datetime.now()
-
-                                    if application_id:
-                                        app = db_bg.query(DBApplication).filter(
-                                            DBApplication.application_id == application_id
-                                        ).first()
-                                        if app:
-                                            app.interview_completed_at = datetime.now()
-                                            app.interview_assessment = assessment
-                                            app.interview_recommendation = recommendation
-                                            app.updated_at = datetime.now()
+                                    assessment = openai_generate_assessment(_history_f, interview_context=_ctx_f)
+                                    annotate_transcript(_history_f, feedback_language=_feedback_language_f)
 
+                                    # Assessment, annotated transcript and application in one transaction
+                                    interview_rec, recommendation = persist_interview_assessment(
+                                        db_bg, _config_f, assessment, _history_f, _candidate_name_f
+                                    )
                                     db_bg.commit()
                                     logger.info(f"✅ [BG] OpenAI Realtime assessment stored: {interview_rec.interview_id}")
 
-                                    # Generate transcript annotations
-                                    try:
-                                        from backend.services.language_llm_openai import generate_transcript_annotations as gem_ann
-                                        annotations = gem_ann(conversation_history=_history_f, feedback_language=_feedback_language_f)
-                                        for i, msg in enumerate(_history_f):
-                                            if msg["role"] == "user":
-                                                idx_str = str(i)
-                                                if idx_str in annotations:
-                                                    msg["ai_comment"] = annotations[idx_str]
-                                        interview_rec.conversation_history = json.dumps(_history_f)
-                                        db_bg.commit()
-                                        logger.info(f"✅ [BG] Live transcript annotations saved: {interview_rec.interview_id}")
-                                    except Exception as e:
-                                        logger.error(f"❌ [BG] Live transcript annotations failed: {e}")
-
                                 except Exception as e:
                                     logger.error(f"❌ [BG] OpenAI Realtime assessment error: {e}")
                                     db_bg.rollback()
@@ -5112,8 +6113,7 @@ MULTI-LANGUAGE INTERVIEW — MANDATORY:
                             except Exception as e:
                                 logger.error(f"❌ [BG] OpenAI Realtime assessment thread error: {e}")
 
-                        import threading
-                        threading.Thread(target=_run_live_final_assessment_bg, daemon=True).start()
+                        assessment_executor.submit(_run_live_final_assessment_bg)
                     else:
                         # Not enough history — still send a completion message
                         try:
@@ -5139,23 +6139,23 @@ MULTI-LANGUAGE INTERVIEW — MANDATORY:
 
             # Start with pre-check phase: audio check
             logger.info("🎯 Starting pre-check phase: audio check...")
-            llm_funcs = get_llm_functions(config["llm_provider"])
+            rt = get_session_runtime(conversation_id, config)
+            llm_funcs = rt.llm_funcs
             interview_start_language = conversation.interview_start_language if conversation.interview_start_language else None
-            audio_check_text = llm_funcs["generate_audio_check"](model_id=config["llm_model"], language=interview_start_language)
+            # The LLM and TTS calls are blocking HTTP requests - run them off the event loop
+            audio_check_text = await asyncio.to_thread(
+                llm_funcs["generate_audio_check"], model_id=rt.llm_model, language=interview_start_language
+            )
             logger.info(f"💬 Audio check: {audio_check_text}")
             conversation.add_message("interviewer", audio_check_text)
             
             # Convert to speech using selected TTS provider
-            tts_func = get_tts_function(config["tts_provider"])
-            voice_id = get_voice_id(config["tts_provider"])
+            tts_func = rt.tts_func
+            voice_id = rt.voice_id
+            audio_format = "mp3" if rt.tts_provider == "elevenlabs" else "wav"  # cartesia returns WAV
             
             try:
-                if config["tts_provider"] == "elevenlabs":
-                    audio_bytes = tts_func(audio_check_text, voice_id, config["tts_model"])
-                    audio_format = "mp3"
-                else:  # cartesia
-                    audio_bytes = tts_func(audio_check_text, voice_id, config["tts_model"])
-                    audio_format = "wav"
+                audio_bytes = await asyncio.to_thread(tts_func, audio_check_text, voice_id, rt.tts_model)
             except ValueError as e:
                 # Quota exceeded or other user-friendly error
                 error_msg = str(e)
@@ -5168,36 +6168,44 @@ MULTI-LANGUAGE INTERVIEW — MANDATORY:
             except Exception as e:
                 error_msg = f"TTS service error: {str(e)}"
                 logger.error(f"❌ TTS Error: {error_msg}")
-                await websocket.send_json({
-                    "type": "error",
-                    "message": "Text-to-speech service error. Please try again or switch to a different TTS provider."
-                })
+                await websocket.send_text(ERR_TTS_SERVICE)
                 return
             
-            audio_base64 = base64.b64encode(audio_bytes).decode('utf-8')
-            
+            # Metadata first, then the audio itself as a binary frame (audio_len announces it)
             await websocket.send_json({
                 "type": "greeting",
                 "conversation_id": conversation_id,
                 "text": audio_check_text,
-                "audio": audio_base64,
                 "audio_format": audio_format,
+                "audio_len": len(audio_bytes),
                 "phase": conversation.get_current_phase(),
                 "time_limit_minutes": interview_duration_minutes
             })
+            await websocket.send_bytes(audio_bytes)
         
+        # Client messages read while waiting for the closing audio - handled before new ones
+        deferred_messages = deque()
+
         # Handle messages
         while True:
-            message = await websocket.receive()
-            
-            # Check time limit before processing any message
-            if conversation_id:
-                should_continue = await check_and_handle_time_limit(
-                    conversation_id, websocket, active_conversations, 
-                    session_configs, interview_start_times
-                )
-                if not should_continue:
-                    break  # Interview ended due to time limit
+            if deferred_messages:
+                message = deferred_messages.popleft()
+            else:
+                # Wait for the next message only until the time limit, so a silent client
+                # still gets the interview ended on time
+                remaining = time_limit_remaining(conversation_id, sessions) if conversation_id else None
+                try:
+                    message = await asyncio.wait_for(websocket.receive(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    should_continue = await check_and_handle_time_limit(
+                        conversation_id, websocket, sessions
+                    )
+                    if not should_continue:
+                        break  # Interview ended due to time limit
+                    continue
+
+            if message["type"] == "websocket.disconnect":
+                break  # Client left (possibly seen while waiting for audio to drain)
             
             if "text" in message:
                 data = json.loads(message["text"])
@@ -5205,11 +6213,11 @@ MULTI-LANGUAGE INTERVIEW — MANDATORY:
                 # Handle end interview request
                 if data.get("type") == "end_interview":
                     conv_id = data.get("conversation_id")
-                    if conv_id and conv_id in active_conversations:
-                        conv = active_conversations[conv_id]
+                    if conv_id and conv_id in sessions:
+                        conv = sessions[conv_id].conversation
                         history = conv.get_history_for_llm()
                         interview_context = conv.get_interview_context()
-                        config = session_configs.get(conv_id, {})
+                        config = sessions[conv_id].config
 
                         current_phase = conv.get_current_phase()
                         is_interview_phase = current_phase == ConversationManager.PHASE_INTERVIEW
@@ -5219,18 +6227,20 @@ MULTI-LANGUAGE INTERVIEW — MANDATORY:
                             # Mark interview as completed IMMEDIATELY to prevent restart
                             _app_id = config.get("application_id")
                             if _app_id:
-                                _iv = db_ws.query(DBInterview).filter(
-                                    DBInterview.application_id == _app_id
-                                ).order_by(DBInterview.created_at.desc()).first()
+                                _iv = (await db_ws.execute(
+                                    select(DBInterview).where(
+                                        DBInterview.application_id == _app_id
+                                    ).order_by(DBInterview.created_at.desc()).limit(1)
+                                )).scalars().first()
                                 if _iv and _iv.status == "pending":
                                     _iv.status = "completed"
-                                    _iv.completed_at = datetime.now()
-                                    db_ws.commit()
+                                    _iv.completed_at = _utc_now()
+                                    await db_ws.commit()
                                     logger.info(f"✅ Interview {_iv.interview_id} marked completed immediately")
 
                             await websocket.send_json({
                                 "type": "assessment",
-                                "assessment": "**Interview Completed**\n\nThank you for your time! Our HR team will review your application and get back to you soon.\n\nWe appreciate your interest in this position."
+                                "assessment": INTERVIEW_COMPLETED_MESSAGE
                             })
 
                             # Run assessment + annotations in background thread
@@ -5243,97 +6253,25 @@ MULTI-LANGUAGE INTERVIEW — MANDATORY:
 
                             def _run_classic_assessment_bg():
                                 try:
-                                    from backend.database import SessionLocal
                                     db_bg = SessionLocal()
+                                    interview_rec = None
                                     try:
                                         llm_prov = _config.get("llm_provider", DEFAULT_LLM_PROVIDER)
-                                        llm_mod = _config.get("llm_model", LLM_PROVIDERS[llm_prov]["default_model"])
+                                        llm_mod = _config.get("llm_model", LLM_MODEL)
                                         llm_funcs_bg = get_llm_functions(llm_prov)
 
                                         assessment = llm_funcs_bg["generate_assessment"](
                                             _history, model_id=llm_mod, interview_context=_ctx
                                         )
-                                        recommendation = extract_recommendation(assessment)
-                                        detailed_scores = extract_detailed_scores(assessment)
-
-                                        application_id = _config.get("application_id")
-                                        if not application_id:
-                                            evaluation_id = _config.get("evaluation_id")
-                                            if evaluation_id:
-                                                if evaluation_id in cv_evaluations:
-                                                    application_id = cv_evaluations[evaluation_id].get("application_id")
-                                                if not application_id:
-                                                    cv_eval = db_bg.query(DBCVEvaluation).filter(
-                                                        DBCVEvaluation.evaluation_id == evaluation_id
-                                                    ).first()
-                                                    if cv_eval:
-                                                        application_id = cv_eval.application_id
-
-                                        job_offer_id = _config.get("job_offer_id")
-                                        cv_text = _config.get("candidate_cv_text", "")
-
-                                        interview_rec = None
-                                        if application_id:
-                                            interview_rec = db_bg.query(DBInterview).filter(
-                                                DBInterview.application_id == application_id
-                                            ).order_by(DBInterview.created_at.desc()).first()
-
-                                        if not interview_rec:
-                                            interview_rec = DBInterview(
-                                                application_id=application_id,
-                                                job_offer_id=job_offer_id or "",
-                                                candidate_name=_candidate_name,
-                                                cv_text=cv_text[:5000] if cv_text else None,
-                                                status="completed",
-                                                assessment=assessment,
-                                                recommendation=recommendation,
-                                                evaluation_scores=json.dumps(detailed_scores),
-                                                conversation_history=json.dumps(_history),
-                                                completed_at=datetime.now()
-                                            )
-                                            db_bg.add(interview_rec)
-                                        else:
-                                            interview_rec.status = "completed"
-                                            interview_rec.assessment = assessment
-                                            interview_rec.recommendation = recommendation
-                                            interview_rec.evaluation_scores = json.dumps(detailed_scores)
-                                            interview_rec.conversation_history = json.dumps(_history)
-                                            interview_rec.completed_at = datetime.now()
-
-                                        if application_id:
-                                            app = db_bg.query(DBApplication).filter(
-                                                DBApplication.application_id == application_id
-                                            ).first()
-                                            if app:
-                                                app.interview_completed_at = datetime.now()
-                                                app.interview_assessment = assessment
-                                                app.interview_recommendation = recommendation
-                                                app.updated_at = datetime.now()
+                                        annotate_transcript(_history, model_id=llm_mod, feedback_language=_classic_feedback_lang)
 
+                                        # Assessment, annotated transcript and application in one transaction
+                                        interview_rec, recommendation = persist_interview_assessment(
+                                            db_bg, _config, assessment, _history, _candidate_name
+                                        )
                                         db_bg.commit()
                                         logger.info(f"✅ [BG] Classic interview assessment stored: {interview_rec.interview_id}")
 
-                                        # Generate transcript annotations
-                                        try:
-                                            if llm_prov == "gpt" or llm_prov == "openai":
-                                                from backend.services.language_llm_openai import generate_transcript_annotations as gemini_ann
-                                                annotations = gemini_ann(conversation_history=_history, model_id=llm_mod, feedback_language=_classic_feedback_lang)
-                                            else:
-                                                from backend.services.language_llm_openai import generate_transcript_annotations as gem_ann
-                                                annotations = gem_ann(conversation_history=_history, model_id=llm_mod, feedback_language=_classic_feedback_lang)
-
-                                            for i, msg in enumerate(_history):
-                                                if msg["role"] == "user":
-                                                    idx_str = str(i)
-                                                    if idx_str in annotations:
-                                                        msg["ai_comment"] = annotations[idx_str]
-
-                                            interview_rec.conversation_history = json.dumps(_history)
-                                            db_bg.commit()
-                                            logger.info(f"✅ [BG] Transcript annotations saved: {interview_rec.interview_id}")
-                                        except Exception as e:
-                                            logger.error(f"❌ [BG] Transcript annotations failed: {e}")
-
                                     except Exception as e:
                                         logger.error(f"❌ [BG] Classic assessment error: {e}")
                                         db_bg.rollback()
@@ -5352,8 +6290,7 @@ MULTI-LANGUAGE INTERVIEW — MANDATORY:
                                 except Exception as e:
                                     logger.error(f"❌ [BG] Classic assessment thread error: {e}")
 
-                            import threading
-                            threading.Thread(target=_run_classic_assessment_bg, daemon=True).start()
+                            assessment_executor.submit(_run_classic_assessment_bg)
                         elif not is_interview_phase:
                             logger.warning(f"⚠️ Interview ended during {current_phase} phase - no assessment generated")
                             await websocket.send_json({
@@ -5368,39 +6305,30 @@ MULTI-LANGUAGE INTERVIEW — MANDATORY:
                             })
                         
                         # Clean up
-                        if conv_id in active_conversations:
-                            del active_conversations[conv_id]
-                        if conv_id in session_configs:
-                            del session_configs[conv_id]
-                        if conv_id in interview_start_times:
-                            del interview_start_times[conv_id]
-                        cleanup_dedup_cache(conv_id)
+                        release_conversation_state(conv_id)
                         
                         # Wait for any final audio before closing
-                        logger.info("⏳ Waiting 5 seconds before closing connection...")
-                        await asyncio.sleep(5)
-                        
-                        # Close WebSocket connection
-                        logger.info(f"🔌 Closing WebSocket connection after manual end")
-                        await websocket.close(code=1000, reason="Interview ended by user")
+                        logger.info("⏳ Waiting for the client to finish playing audio...")
+                        if await wait_for_audio_drain(websocket, timeout=5):
+                            # Close WebSocket connection
+                            logger.info(f"🔌 Closing WebSocket connection after manual end")
+                            await websocket.close(code=1000, reason="Interview ended by user")
                     break
                 
                 # Handle streaming audio start
                 elif data.get("type") == "audio_stream_start":
                     conversation_id = data.get("conversation_id")
-                    if conversation_id not in active_conversations:
-                        await websocket.send_json({
-                            "type": "error",
-                            "message": "Conversation not found"
-                        })
+                    if conversation_id not in sessions:
+                        await websocket.send_text(ERR_CONVERSATION_NOT_FOUND)
                         continue
                     
-                    config = session_configs.get(conversation_id, {})
+                    state = sessions[conversation_id]
+                    rt = state.runtime
                     
                     # Create streaming STT session
-                    if is_streaming_stt_provider(config.get("stt_provider")):
+                    if is_streaming_stt_provider(rt.stt_provider):
                         # Determine STT language from conversation/job offer
-                        conv = active_conversations.get(conversation_id)
+                        conv = state.conversation
                         stt_lang = "en"
                         if conv and conv.interview_start_language:
                             stt_lang = get_language_code(conv.interview_start_language) or "en"
@@ -5412,7 +6340,7 @@ MULTI-LANGUAGE INTERVIEW — MANDATORY:
                         )
                         
                         if await stt_session.connect():
-                            streaming_stt_sessions[conversation_id] = {
+                            state.stt_session = {
                                 "session": stt_session,
                                 "start_time": time.time(),
                             }
@@ -5432,10 +6360,11 @@ MULTI-LANGUAGE INTERVIEW — MANDATORY:
                     audio_data = data.get("audio")
                     audio_format = data.get("format", "webm")
 
-                    if conversation_id in streaming_stt_sessions:
+                    state = sessions.get(conversation_id)
+                    if state and state.stt_session:
                         try:
                             audio_bytes = base64.b64decode(audio_data)
-                            stt_session = streaming_stt_sessions[conversation_id]["session"]
+                            stt_session = state.stt_session["session"]
                             await stt_session.send_audio_chunk(audio_bytes, audio_format=audio_format)
                         except ValueError as e:
                             # Conversion failed - send error to client
@@ -5445,27 +6374,25 @@ MULTI-LANGUAGE INTERVIEW — MANDATORY:
                                 "message": "Audio conversion failed. Please install ffmpeg to use streaming STT."
                             })
                             # Clean up session
-                            if conversation_id in streaming_stt_sessions:
-                                await streaming_stt_sessions[conversation_id]["session"].close()
-                                del streaming_stt_sessions[conversation_id]
+                            await state.stt_session["session"].close()
+                            state.stt_session = None
                 
                 # Handle streaming audio commit (end of speech)
                 elif data.get("type") == "audio_commit":
                     conversation_id = data.get("conversation_id")
                     
-                    if conversation_id not in active_conversations:
-                        await websocket.send_json({
-                            "type": "error",
-                            "message": "Conversation not found"
-                        })
+                    if conversation_id not in sessions:
+                        await websocket.send_text(ERR_CONVERSATION_NOT_FOUND)
                         continue
                     
-                    conversation = active_conversations[conversation_id]
-                    config = session_configs.get(conversation_id, {})
+                    state = sessions[conversation_id]
+                    conversation = state.conversation
+                    config = state.config
+                    rt = state.runtime
                     
-                    if conversation_id in streaming_stt_sessions:
+                    if state.stt_session:
                         # Get streaming STT result
-                        stt_info = streaming_stt_sessions[conversation_id]
+                        stt_info = state.stt_session
                         stt_session = stt_info["session"]
                         stt_start_time = stt_info["start_time"]
                         
@@ -5483,7 +6410,7 @@ MULTI-LANGUAGE INTERVIEW — MANDATORY:
                         
                         # Close session
                         await stt_session.close()
-                        del streaming_stt_sessions[conversation_id]
+                        state.stt_session = None
                         
                         if not user_text.strip():
                             logger.warning(f"⚠️ No transcript received after timeout")
@@ -5499,7 +6426,7 @@ MULTI-LANGUAGE INTERVIEW — MANDATORY:
                         conversation.add_message("user", user_text)
                         
                         # Check if we're in pre-check phase
-                        llm_funcs = get_llm_functions(config.get("llm_provider", DEFAULT_LLM_PROVIDER))
+                        llm_funcs = rt.llm_funcs
                         should_continue = await handle_precheck_response(
                             conversation, user_text, config, llm_funcs, websocket, conversation_id
                         )
@@ -5509,25 +6436,32 @@ MULTI-LANGUAGE INTERVIEW — MANDATORY:
                         
                         # Normal interview response
                         history = conversation.get_history_for_llm()
-                        llm_provider = config.get("llm_provider", DEFAULT_LLM_PROVIDER)
-                        llm_model = config.get("llm_model", LLM_PROVIDERS[llm_provider]["default_model"])
+                        llm_provider = rt.llm_provider
+                        llm_model = rt.llm_model
                         
                         # Calculate time remaining using config duration
                         time_remaining_minutes = None
-                        interview_time_limit = config.get("interview_duration_minutes", INTERVIEW_TIME_LIMIT_MINUTES)
-                        if conversation_id in interview_start_times:
-                            elapsed_minutes = (time.time() - interview_start_times[conversation_id]) / 60
+                        interview_time_limit = rt.interview_time_limit
+                        state = sessions.get(conversation_id)
+                        if state:
+                            elapsed_minutes = (time.time() - state.started_at) / 60
                             time_remaining_minutes = max(0, interview_time_limit - elapsed_minutes)
                         
                         # Get interview context for contextual responses
                         interview_context = conversation.get_interview_context(time_remaining_minutes=time_remaining_minutes, total_interview_minutes=interview_time_limit)
                         
                         llm_start = time.time()
-                        interviewer_response = llm_funcs["generate_response"](
-                            history[:-1], 
-                            user_text, 
-                            model_id=llm_model,
-                            interview_context=interview_context
+                        # TTS runs per sentence while the LLM is still generating (both in worker threads)
+                        interviewer_response, pipelined_audio = await asyncio.to_thread(
+                            _generate_response_pipelined,
+                            llm_funcs,
+                            dict(
+                                conversation_history=history[:-1],
+                                user_message=user_text,
+                                model_id=llm_model,
+                                interview_context=interview_context
+                            ),
+                            rt.voice_id, rt.tts_model
                         )
                         llm_duration = time.time() - llm_start
                         logger.info(f"⏱️ LLM took {llm_duration:.2f}s")
@@ -5536,26 +6470,16 @@ MULTI-LANGUAGE INTERVIEW — MANDATORY:
                         response_lower = interviewer_response.lower()
                         required_langs = conversation.get_required_languages_list()
                         current_lang = conversation.get_current_language()
-                        tested_langs = conversation.get_tested_languages()
                         
                         # Check if AI is switching to an untested language
                         if required_langs and len(required_langs) > 1:
-                            untested_langs = [lang for lang in required_langs if lang not in tested_langs]
+                            untested_langs = conversation.get_untested_languages()
+                            response_langs = mentioned_languages(response_lower)
                             for lang in untested_langs:
-                                lang_keywords = {
-                                    "French": ["français", "francais", "french", "en français", "continuons en français"],
-                                    "English": ["english", "anglais", "in english", "let's continue in english"],
-                                    "Arabic": ["arabic", "arabe", "en arabe", "بالعربية"],
-                                    "Spanish": ["spanish", "espagnol", "español", "en español"],
-                                    "German": ["german", "allemand", "deutsch", "auf deutsch"]
-                                }
-                                if lang in lang_keywords:
-                                    for keyword in lang_keywords[lang]:
-                                        if keyword in response_lower and lang != current_lang:
-                                            # AI is proactively switching to this language
-                                            conversation.set_current_language(lang)
-                                            logger.info(f"🌐 AI proactively switched to {lang} for language testing")
-                                            break
+                                if lang in response_langs and lang != current_lang:
+                                    # AI is proactively switching to this language
+                                    conversation.set_current_language(lang)
+                                    logger.info(f"🌐 AI proactively switched to {lang} for language testing")
                         
                         conversation.add_message("interviewer", interviewer_response)
                         # Increment question count for current language
@@ -5567,13 +6491,12 @@ MULTI-LANGUAGE INTERVIEW — MANDATORY:
                         
                         # Strip the token so it doesn't get spoken or shown to candidate
                         if "[interview_concluded]" in response_lower:
-                            import re
-                            interviewer_response = re.sub(r'\[INTERVIEW_CONCLUDED\]', '', interviewer_response, flags=re.IGNORECASE).strip()
+                            interviewer_response = INTERVIEW_CONCLUDED_RE.sub('', interviewer_response).strip()
                         
                         # Text to Speech using selected provider
-                        tts_func = get_tts_function(config.get("tts_provider", DEFAULT_TTS_PROVIDER))
-                        voice_id = get_voice_id(config.get("tts_provider", DEFAULT_TTS_PROVIDER))
-                        tts_model = config.get("tts_model")
+                        tts_func = rt.tts_func
+                        voice_id = rt.voice_id
+                        tts_model = rt.tts_model
                         
                         tts_start = time.time()
                         try:
@@ -5581,7 +6504,10 @@ MULTI-LANGUAGE INTERVIEW — MANDATORY:
                                 # Avoid throwing ValueError if AI only responded with conclusion token
                                 response_audio_bytes = b""
                                 audio_format = "mp3"
-                            elif config.get("tts_provider") == "cartesia":
+                            elif pipelined_audio:
+                                response_audio_bytes = pipelined_audio
+                                audio_format = "mp3"
+                            elif rt.tts_provider == "cartesia":
                                 response_audio_bytes = tts_func(interviewer_response, voice_id, tts_model)
                                 audio_format = "wav"
                             else:  # elevenlabs
@@ -5610,28 +6536,31 @@ MULTI-LANGUAGE INTERVIEW — MANDATORY:
                         total_duration = time.time() - total_start
                         logger.info(f"⏱️ TOTAL post-speech processing: {total_duration:.2f}s (LLM: {llm_duration:.2f}s + TTS: {tts_duration:.2f}s)")
                         
-                        # Send the response first
-                        response_audio_base64 = base64.b64encode(response_audio_bytes).decode('utf-8')
+                        # Send the response first - metadata, then the audio itself as a binary frame (audio_len announces it)
                         await websocket.send_json({
                             "type": "response",
                             "user_text": user_text,
                             "interviewer_text": interviewer_response,
-                            "audio": response_audio_base64,
+                            "audio_len": len(response_audio_bytes),
                             "audio_format": audio_format
                         })
+                        if response_audio_bytes:
+                            await websocket.send_bytes(response_audio_bytes)
                         
                         # If AI concluded and we're in interview phase, auto-generate assessment
                         if is_conclusion and conversation.get_current_phase() == ConversationManager.PHASE_INTERVIEW:
                             logger.info("🎯 AI concluded the interview - auto-generating assessment")
                             
-                            # Wait for the closing audio to finish playing (typical closing is 10-15 seconds)
-                            logger.info("⏳ Waiting 12 seconds for closing audio to finish...")
-                            await asyncio.sleep(12)
+                            # Wait for the closing audio to finish playing - the client acks once it is idle
+                            # (at most 12 seconds; typical closing is 10-15 seconds)
+                            await websocket.send_json({"type": "interview_ended", "reason": "concluded"})
+                            logger.info("⏳ Waiting for the closing audio to finish...")
+                            client_connected = await wait_for_audio_drain(websocket, timeout=12, deferred=deferred_messages)
                             
                             # Generate assessment
                             history = conversation.get_history_for_llm()
                             interview_context_final = conversation.get_interview_context()
-                            llm_funcs = get_llm_functions(config.get("llm_provider", DEFAULT_LLM_PROVIDER))
+                            llm_funcs = rt.llm_funcs
                             
                             try:
                                 assessment = llm_funcs["generate_assessment"](
@@ -5640,124 +6569,44 @@ MULTI-LANGUAGE INTERVIEW — MANDATORY:
                                     interview_context=interview_context_final
                                 )
                                 
+                                # Transcript annotations (AI feedback) are generated first so they go into the same write
+                                annotate_transcript(history, model_id=llm_model, feedback_language=conversation.interview_start_language if conversation else None)
+                                
                                 # Store assessment in database
+                                db = SessionLocal(expire_on_commit=False)
                                 try:
-                                    db = next(get_db())
-                                    
-                                    recommendation = extract_recommendation(assessment)
-                                    detailed_scores = extract_detailed_scores(assessment)
-                                    
-                                    application_id = config.get("application_id")
-                                    if not application_id:
-                                        evaluation_id = config.get("evaluation_id")
-                                        if evaluation_id:
-                                            if evaluation_id in cv_evaluations:
-                                                application_id = cv_evaluations[evaluation_id].get("application_id")
-                                            if not application_id:
-                                                cv_eval = db.query(DBCVEvaluation).filter(
-                                                    DBCVEvaluation.evaluation_id == evaluation_id
-                                                ).first()
-                                                if cv_eval:
-                                                    application_id = cv_eval.application_id
-                                    
-                                    job_offer_id = config.get("job_offer_id")
-                                    candidate_name = conversation.get_candidate_name() or config.get("candidate_name")
-                                    cv_text = config.get("candidate_cv_text", "")
-                                    
-                                    interview = None
-                                    if application_id:
-                                        interview = db.query(DBInterview).filter(
-                                            DBInterview.application_id == application_id
-                                        ).order_by(DBInterview.created_at.desc()).first()
-                                    
-                                    if not interview:
-                                        interview = DBInterview(
-                                            application_id=application_id,
-                                            job_offer_id=job_offer_id or "",
-                                            candidate_name=candidate_name,
-                                            cv_text=cv_text[:5000] if cv_text else None,
-                                            status="completed",
-                                            assessment=assessment,
-                                            recommendation=recommendation,
-                                            evaluation_scores=json.dumps(detailed_scores),
-                                            conversation_history=json.dumps(history),
-                                            completed_at=datetime.now()
+                                    # Interview (with the annotated transcript) and application are written together or not at all
+                                    with db.begin():
+                                        interview, recommendation = persist_interview_assessment(
+                                            db, config, assessment, history, conversation.get_candidate_name() or config.get("candidate_name")
                                         )
-                                        db.add(interview)
-                                    else:
-                                        interview.status = "completed"
-                                        interview.assessment = assessment
-                                        interview.recommendation = recommendation
-                                        interview.evaluation_scores = json.dumps(detailed_scores)
-                                        interview.conversation_history = json.dumps(history)
-                                        interview.completed_at = datetime.now()
                                     
-                                    if application_id:
-                                        application = db.query(DBApplication).filter(
-                                            DBApplication.application_id == application_id
-                                        ).first()
-                                        if application:
-                                            application.interview_completed_at = datetime.now()
-                                            application.interview_assessment = assessment
-                                            application.interview_recommendation = recommendation
-                                            application.updated_at = datetime.now()
-                                    
-                                    db.commit()
                                     logger.info(f"✅ Interview assessment stored: interview_id={interview.interview_id}, recommendation={recommendation}")
-                                    
-                                    # Generate transcript annotations (AI feedback)
-                                    _ws_ann_lang = conversation.interview_start_language if conversation else None
-                                    try:
-                                        if config.get("llm_provider", DEFAULT_LLM_PROVIDER) == "gpt":
-                                            from backend.services.language_llm_openai import generate_transcript_annotations as gemini_generate_transcript_annotations
-                                            annotations = gemini_generate_transcript_annotations(conversation_history=history, model_id=llm_model, feedback_language=_ws_ann_lang)
-                                        else:
-                                            from backend.services.language_llm_openai import generate_transcript_annotations as gemini_generate_transcript_annotations
-                                            annotations = gemini_generate_transcript_annotations(conversation_history=history, model_id=llm_model, feedback_language=_ws_ann_lang)
-                                        
-                                        # Update conversation history with annotations
-                                        for i, msg in enumerate(history):
-                                            if msg["role"] == "user":
-                                                idx_str = str(i)
-                                                if idx_str in annotations:
-                                                    msg["ai_comment"] = annotations[idx_str]
-                                        
-                                        interview.conversation_history = json.dumps(history)
-                                        db.commit()
-                                        logger.info("✅ Saved real-time interview transcript annotations")
-                                    except Exception as e:
-                                        logger.error(f"❌ Error generating real-time transcript annotations: {e}")
-                                    
                                 except Exception as e:
                                     logger.error(f"❌ Error storing interview assessment: {e}")
-                                    db.rollback() if 'db' in locals() else None
+                                finally:
+                                    db.close()
                                 
-                                # Send neutral completion message to candidate (no feedback)
-                                await websocket.send_json({
-                                    "type": "assessment",
-                                    "assessment": "**Interview Completed**\n\nThank you for your time! Our HR team will review your application and get back to you soon.\n\nWe appreciate your interest in this position.",
-                                    "interview_completed": True,
-                                    "interview_id": interview.interview_id if 'interview' in locals() and interview else None
-                                })
+                                # Send neutral completion message to candidate (no feedback) - unless they already left
+                                if client_connected:
+                                    await websocket.send_json({
+                                        "type": "assessment",
+                                        "assessment": INTERVIEW_COMPLETED_MESSAGE,
+                                        "interview_completed": True,
+                                        "interview_id": interview.interview_id if 'interview' in locals() and interview else None
+                                    })
                                 
                                 # Clean up and close connection
-                                if conversation_id in active_conversations:
-                                    del active_conversations[conversation_id]
-                                if conversation_id in session_configs:
-                                    del session_configs[conversation_id]
-                                if conversation_id in interview_start_times:
-                                    del interview_start_times[conversation_id]
-                                cleanup_dedup_cache(conversation_id)
+                                release_conversation_state(conversation_id)
                                 
                                 logger.info("✅ Interview auto-concluded by AI")
                                 
-                                # Wait additional time before closing to ensure audio finished
-                                logger.info("⏳ Waiting 5 more seconds before closing connection...")
-                                await asyncio.sleep(5)
-                                
-                                # Close WebSocket connection
-                                logger.info(f"🔌 Closing WebSocket connection after AI conclusion")
-                                await websocket.close(code=1000, reason="Interview concluded by AI")
+                                # Wait until the closing audio has finished playing before closing
+                                logger.info("⏳ Waiting for the client to finish playing audio...")
+                                if client_connected and await wait_for_audio_drain(websocket, timeout=5):
+                                    # Close WebSocket connection
+                                    logger.info(f"🔌 Closing WebSocket connection after AI conclusion")
+                                    await websocket.close(code=1000, reason="Interview concluded by AI")
                                 break  # Exit message loop
                                 
                             except Exception as e:
@@ -5767,19 +6616,18 @@ MULTI-LANGUAGE INTERVIEW — MANDATORY:
                 # Handle audio message (batch mode - existing)
                 elif data.get("type") == "audio":
                     conversation_id = data.get("conversation_id")
-                    if conversation_id not in active_conversations:
-                        await websocket.send_json({
-                            "type": "error",
-                            "message": "Conversation not found"
-                        })
+                    if conversation_id not in sessions:
+                        await websocket.send_text(ERR_CONVERSATION_NOT_FOUND)
                         continue
                     
-                    conversation = active_conversations[conversation_id]
-                    config = session_configs.get(conversation_id, {})
+                    state = sessions[conversation_id]
+                    conversation = state.conversation
+                    config = state.config
+                    rt = state.runtime
                     audio_data = data.get("audio")
                     
-                    # Decode audio
-                    audio_bytes = base64.b64decode(audio_data)
+                    # Decode audio (off the event loop - a whole utterance can be large)
+                    audio_bytes = await asyncio.to_thread(base64.b64decode, audio_data)
                     logger.info(f"🎧 Received audio: {len(audio_bytes)} bytes")
                     
                     # Check for duplicate audio message
@@ -5790,23 +6638,20 @@ MULTI-LANGUAGE INTERVIEW — MANDATORY:
                     total_start = time.time()
                     
                     # Speech to Text using selected provider
-                    stt_func = get_stt_function(config.get("stt_provider", DEFAULT_STT_PROVIDER))
-                    stt_model = config.get("stt_model", STT_PROVIDERS[DEFAULT_STT_PROVIDER]["default_model"])
+                    stt_func = rt.stt_func
+                    stt_model = rt.stt_model
                     
-                    logger.info(f"🎤 Processing with STT: {config.get('stt_provider')} / {stt_model}")
+                    logger.info(f"🎤 Processing with STT: {rt.stt_provider} / {stt_model}")
                     
                     stt_start = time.time()
                     try:
-                        if config.get("stt_provider") == "cartesia":
+                        if rt.stt_provider == "cartesia":
                             user_text = stt_func(audio_bytes, audio_format="webm", model_id=stt_model)
                         else:
                             user_text = stt_func(audio_bytes, model_id=stt_model)
                     except Exception as e:
                         logger.warning(f"⚠️ STT failed to process chunk (likely too short): {e}")
-                        await websocket.send_json({
-                            "type": "error",
-                            "message": "Audio chunk too short or unrecognized. Please speak again."
-                        })
+                        await websocket.send_text(ERR_AUDIO_TOO_SHORT)
                         continue
 
                     stt_duration = time.time() - stt_start
@@ -5814,16 +6659,13 @@ MULTI-LANGUAGE INTERVIEW — MANDATORY:
                     
                     logger.info(f"📝 User said: {user_text}")
                     if not user_text.strip():
-                        await websocket.send_json({
-                            "type": "error",
-                            "message": "No speech detected"
-                        })
+                        await websocket.send_text(ERR_NO_SPEECH)
                         continue
                     
                     conversation.add_message("user", user_text)
                     
                     # Check if we're in pre-check phase
-                    llm_funcs = get_llm_functions(config.get("llm_provider", DEFAULT_LLM_PROVIDER))
+                    llm_funcs = rt.llm_funcs
                     should_continue = await handle_precheck_response(
                         conversation, user_text, config, llm_funcs, websocket, conversation_id
                     )
@@ -5836,43 +6678,31 @@ MULTI-LANGUAGE INTERVIEW — MANDATORY:
                     
                     # Calculate time remaining using config duration
                     time_remaining_minutes = None
-                    interview_time_limit = config.get("interview_duration_minutes", INTERVIEW_TIME_LIMIT_MINUTES)
-                    if conversation_id in interview_start_times:
-                        elapsed_minutes = (time.time() - interview_start_times[conversation_id]) / 60
+                    interview_time_limit = rt.interview_time_limit
+                    state = sessions.get(conversation_id)
+                    if state:
+                        elapsed_minutes = (time.time() - state.started_at) / 60
                         time_remaining_minutes = max(0, interview_time_limit - elapsed_minutes)
                     
                     interview_context = conversation.get_interview_context(time_remaining_minutes=time_remaining_minutes, total_interview_minutes=interview_time_limit)
-                    llm_provider = config.get("llm_provider", DEFAULT_LLM_PROVIDER)
-                    llm_model = config.get("llm_model", LLM_PROVIDERS[llm_provider]["default_model"])
+                    llm_provider = rt.llm_provider
+                    llm_model = rt.llm_model
                     
                     # Detect language switch requests from candidate
-                    language_switch_keywords = [
-                        "switch to", "switch language", "speak in", "parler en", "parlez", "continue in",
-                        "now in", "in english", "in french", "en français", "en anglais", "en arabe",
-                        "can we speak", "peut-on parler", "let's speak", "parlons", "change to",
-                        "change language", "changer de langue", "autre langue"
-                    ]
                     user_lower = user_text.lower()
-                    is_language_switch = any(keyword in user_lower for keyword in language_switch_keywords)
+                    is_language_switch = LANGUAGE_SWITCH_RE.search(user_lower) is not None
                     
                     # Detect target language
                     target_language = None
                     if is_language_switch:
-                        if "french" in user_lower or "français" in user_lower or "francais" in user_lower:
-                            target_language = "French"
-                        elif "english" in user_lower or "anglais" in user_lower:
-                            target_language = "English"
-                        elif "arabic" in user_lower or "arabe" in user_lower:
-                            target_language = "Arabic"
-                        elif "spanish" in user_lower or "espagnol" in user_lower:
-                            target_language = "Spanish"
+                        named_langs = mentioned_languages(user_lower, TARGET_LANGUAGE_RE)
+                        target_language = next((lang for lang in TARGET_LANGUAGE_RE.groupindex if lang in named_langs), None)
                         # If language switch detected but no specific language, check required languages
                         if not target_language:
                             required_langs = conversation.get_required_languages_list()
                             if required_langs:
                                 # Switch to first untested language or next in list
-                                tested = conversation.get_tested_languages()
-                                untested = [lang for lang in required_langs if lang not in tested]
+                                untested = conversation.get_untested_languages()
                                 if untested:
                                     target_language = untested[0]
                     
@@ -5881,11 +6711,17 @@ MULTI-LANGUAGE INTERVIEW — MANDATORY:
                         logger.info(f"🌐 Language switch detected: Switching to {target_language}")
                     
                     llm_start = time.time()
-                    interviewer_response = llm_funcs["generate_response"](
-                        history[:-1], 
-                        user_text, 
-                        model_id=llm_model,
-                        interview_context=interview_context
+                    # TTS runs per sentence while the LLM is still generating (both in worker threads)
+                    interviewer_response, pipelined_audio = await asyncio.to_thread(
+                        _generate_response_pipelined,
+                        llm_funcs,
+                        dict(
+                            conversation_history=history[:-1],
+                            user_message=user_text,
+                            model_id=llm_model,
+                            interview_context=interview_context
+                        ),
+                        rt.voice_id, rt.tts_model
                     )
                     llm_duration = time.time() - llm_start
                     logger.info(f"⏱️ LLM took {llm_duration:.2f}s")
@@ -5894,26 +6730,16 @@ MULTI-LANGUAGE INTERVIEW — MANDATORY:
                     response_lower = interviewer_response.lower()
                     required_langs = conversation.get_required_languages_list()
                     current_lang = conversation.get_current_language()
-                    tested_langs = conversation.get_tested_languages()
                     
                     # Check if AI is switching to an untested language
                     if required_langs and len(required_langs) > 1:
-                        untested_langs = [lang for lang in required_langs if lang not in tested_langs]
+                        untested_langs = conversation.get_untested_languages()
+                        response_langs = mentioned_languages(response_lower)
                         for lang in untested_langs:
-                            lang_keywords = {
-                                "French": ["français", "francais", "french", "en français", "continuons en français"],
-                                "English": ["english", "anglais", "in english", "let's continue in english"],
-                                "Arabic": ["arabic", "arabe", "en arabe", "بالعربية"],
-                                "Spanish": ["spanish", "espagnol", "español", "en español"],
-                                "German": ["german", "allemand", "deutsch", "auf deutsch"]
-                            }
-                            if lang in lang_keywords:
-                                for keyword in lang_keywords[lang]:
-                                    if keyword in response_lower and lang != current_lang:
-                                        # AI is proactively switching to this language
-                                        conversation.set_current_language(lang)
-                                        logger.info(f"🌐 AI proactively switched to {lang} for language testing")
-                                        break
+                            if lang in response_langs and lang != current_lang:
+                                # AI is proactively switching to this language
+                                conversation.set_current_language(lang)
+                                logger.info(f"🌐 AI proactively switched to {lang} for language testing")
                     
                     conversation.add_message("interviewer", interviewer_response)
                     # Increment question count for current language
@@ -5925,13 +6751,12 @@ MULTI-LANGUAGE INTERVIEW — MANDATORY:
                     
                     # Strip the token so it doesn't get spoken or shown to candidate
                     if "[interview_concluded]" in response_lower:
-                        import re
-                        interviewer_response = re.sub(r'\[INTERVIEW_CONCLUDED\]', '', interviewer_response, flags=re.IGNORECASE).strip()
+                        interviewer_response = INTERVIEW_CONCLUDED_RE.sub('', interviewer_response).strip()
                     
                     # Text to Speech using selected provider
-                    tts_func = get_tts_function(config.get("tts_provider", DEFAULT_TTS_PROVIDER))
-                    voice_id = get_voice_id(config.get("tts_provider", DEFAULT_TTS_PROVIDER))
-                    tts_model = config.get("tts_model")
+                    tts_func = rt.tts_func
+                    voice_id = rt.voice_id
+                    tts_model = rt.tts_model
                     
                     tts_start = time.time()
                     try:
@@ -5939,7 +6764,10 @@ MULTI-LANGUAGE INTERVIEW — MANDATORY:
                             # Avoid throwing ValueError if AI only responded with conclusion token
                             response_audio_bytes = b""
                             audio_format = "mp3"
-                        elif config.get("tts_provider") == "cartesia":
+                        elif pipelined_audio:
+                            response_audio_bytes = pipelined_audio
+                            audio_format = "mp3"
+                        elif rt.tts_provider == "cartesia":
                             response_audio_bytes = tts_func(interviewer_response, voice_id, tts_model)
                             audio_format = "wav"
                         else:  # elevenlabs
@@ -5959,34 +6787,34 @@ MULTI-LANGUAGE INTERVIEW — MANDATORY:
                     except Exception as e:
                         error_msg = f"TTS service error: {str(e)}"
                         logger.error(f"❌ TTS Error: {error_msg}")
-                        await websocket.send_json({
-                            "type": "error",
-                            "message": "Text-to-speech service error. Please try again or switch to a different TTS provider."
-                        })
+                        await websocket.send_text(ERR_TTS_SERVICE)
                         continue
                     
-                    # Send the response first
-                    response_audio_base64 = base64.b64encode(response_audio_bytes).decode('utf-8')
+                    # Send the response first - metadata, then the audio itself as a binary frame (audio_len announces it)
                     await websocket.send_json({
                         "type": "response",
                         "user_text": user_text,
                         "interviewer_text": interviewer_response,
-                        "audio": response_audio_base64,
+                        "audio_len": len(response_audio_bytes),
                         "audio_format": audio_format
                     })
+                    if response_audio_bytes:
+                        await websocket.send_bytes(response_audio_bytes)
                     
                     # If AI concluded and we're in interview phase, auto-generate assessment
                     if is_conclusion and conversation.get_current_phase() == ConversationManager.PHASE_INTERVIEW:
                         logger.info("🎯 AI concluded the interview - auto-generating assessment")
                         
-                        # Wait for the closing audio to finish playing (typical closing is 10-15 seconds)
-                        logger.info("⏳ Waiting 12 seconds for closing audio to finish...")
-                        await asyncio.sleep(12)
+                        # Wait for the closing audio to finish playing - the client acks once it is idle
+                        # (at most 12 seconds; typical closing is 10-15 seconds)
+                        await websocket.send_json({"type": "interview_ended", "reason": "concluded"})
+                        logger.info("⏳ Waiting for the closing audio to finish...")
+                        client_connected = await wait_for_audio_drain(websocket, timeout=12, deferred=deferred_messages)
                         
                         # Generate assessment
                         history = conversation.get_history_for_llm()
                         interview_context_final = conversation.get_interview_context()
-                        llm_funcs = get_llm_functions(config.get("llm_provider", DEFAULT_LLM_PROVIDER))
+                        llm_funcs = rt.llm_funcs
                         
                         try:
                             assessment = llm_funcs["generate_assessment"](
@@ -5995,124 +6823,44 @@ MULTI-LANGUAGE INTERVIEW — MANDATORY:
                                 interview_context=interview_context_final
                             )
                             
+                            # Transcript annotations (AI feedback) are generated first so they go into the same write
+                            annotate_transcript(history, model_id=llm_model, feedback_language=conversation.interview_start_language if conversation else None)
+                            
                             # Store assessment in database
+                            db = SessionLocal(expire_on_commit=False)
                             try:
-                                db = next(get_db())
-                                
-                                recommendation = extract_recommendation(assessment)
-                                detailed_scores = extract_detailed_scores(assessment)
-                                
-                                application_id = config.get("application_id")
-                                if not application_id:
-                                    evaluation_id = config.get("evaluation_id")
-                                    if evaluation_id:
-                                        if evaluation_id in cv_evaluations:
-                                            application_id = cv_evaluations[evaluation_id].get("application_id")
-                                        if not application_id:
-                                            cv_eval = db.query(DBCVEvaluation).filter(
-                                                DBCVEvaluation.evaluation_id == evaluation_id
-                                            ).first()
-                                            if cv_eval:
-                                                application_id = cv_eval.application_id
-                                
-                                job_offer_id = config.get("job_offer_id")
-                                candidate_name = conversation.get_candidate_name() or config.get("candidate_name")
-                                cv_text = config.get("candidate_cv_text", "")
-                                
-                                interview = None
-                                if application_id:
-                                    interview = db.query(DBInterview).filter(
-                                        DBInterview.application_id == application_id
-                                    ).order_by(DBInterview.created_at.desc()).first()
-                                
-                                if not interview:
-                                    interview = DBInterview(
-                                        application_id=application_id,
-                                        job_offer_id=job_offer_id or "",
-                                        candidate_name=candidate_name,
-                                        cv_text=cv_text[:5000] if cv_text else None,
-                                        status="completed",
-                                        assessment=assessment,
-                                        recommendation=recommendation,
-                                        evaluation_scores=json.dumps(detailed_scores),
-                                        conversation_history=json.dumps(history),
-                                        completed_at=datetime.now()
+                                # Interview (with the annotated transcript) and application are written together or not at all
+                                with db.begin():
+                                    interview, recommendation = persist_interview_assessment(
+                                        db, config, assessment, history, conversation.get_candidate_name() or config.get("candidate_name")
                                     )
-                                    db.add(interview)
-                                else:
-                                    interview.status = "completed"
-                                    interview.assessment = assessment
-                                    interview.recommendation = recommendation
-                                    interview.evaluation_scores = json.dumps(detailed_scores)
-                                    interview.conversation_history = json.dumps(history)
-                                    interview.completed_at = datetime.now()
-                                
-                                if application_id:
-                                    application = db.query(DBApplication).filter(
-                                        DBApplication.application_id == application_id
-                                    ).first()
-                                    if application:
-                                        application.interview_completed_at = datetime.now()
-                                        application.interview_assessment = assessment
-                                        application.interview_recommendation = recommendation
-                                        application.updated_at = datetime.now()
                                 
-                                db.commit()
                                 logger.info(f"✅ Interview assessment stored: interview_id={interview.interview_id}, recommendation={recommendation}")
-                                
-                                # Generate transcript annotations (AI feedback)
-                                _rt_ann_lang = conversation.interview_start_language if conversation else None
-                                try:
-                                    if config.get("llm_provider", DEFAULT_LLM_PROVIDER) == "gpt":
-                                        from backend.services.language_llm_openai import generate_transcript_annotations as gemini_generate_transcript_annotations
-                                        annotations = gemini_generate_transcript_annotations(conversation_history=history, model_id=llm_model, feedback_language=_rt_ann_lang)
-                                    else:
-                                        from backend.services.language_llm_openai import generate_transcript_annotations as gemini_generate_transcript_annotations
-                                        annotations = gemini_generate_transcript_annotations(conversation_history=history, model_id=llm_model, feedback_language=_rt_ann_lang)
-                                    
-                                    # Update conversation history with annotations
-                                    for i, msg in enumerate(history):
-                                        if msg["role"] == "user":
-                                            idx_str = str(i)
-                                            if idx_str in annotations:
-                                                msg["ai_comment"] = annotations[idx_str]
-                                    
-                                    interview.conversation_history = json.dumps(history)
-                                    db.commit()
-                                    logger.info("✅ Saved real-time interview transcript annotations")
-                                except Exception as e:
-                                    logger.error(f"❌ Error generating real-time transcript annotations: {e}")
-                                
                             except Exception as e:
                                 logger.error(f"❌ Error storing interview assessment: {e}")
-                                db.rollback() if 'db' in locals() else None
+                            finally:
+                                db.close()
                             
-                            # Send neutral completion message to candidate (no feedback)
-                            await websocket.send_json({
-                                "type": "assessment",
-                                "assessment": "**Interview Completed**\n\nThank you for your time! Our HR team will review your application and get back to you soon.\n\nWe appreciate your interest in this position.",
-                                "interview_completed": True,
-                                "interview_id": interview.interview_id if 'interview' in locals() and interview else None
-                            })
+                            # Send neutral completion message to candidate (no feedback) - unless they already left
+                            if client_connected:
+                                await websocket.send_json({
+                                    "type": "assessment",
+                                    "assessment": INTERVIEW_COMPLETED_MESSAGE,
+                                    "interview_completed": True,
+                                    "interview_id": interview.interview_id if 'interview' in locals() and interview else None
+                                })
                             
                             # Clean up and close connection
-                            if conversation_id in active_conversations:
-                                del active_conversations[conversation_id]
-                            if conversation_id in session_configs:
-                                del session_configs[conversation_id]
-                            if conversation_id in interview_start_times:
-                                del interview_start_times[conversation_id]
-                            cleanup_dedup_cache(conversation_id)
+                            release_conversation_state(conversation_id)
                             
                             logger.info("✅ Interview auto-concluded by AI")
                             
-                            # Wait additional time before closing to ensure audio finished
-                            logger.info("⏳ Waiting 5 more seconds before closing connection...")
-                            await asyncio.sleep(5)
-                            
-                            # Close WebSocket connection
-                            logger.info(f"🔌 Closing WebSocket connection after AI conclusion")
-                            await websocket.close(code=1000, reason="Interview concluded by AI")
+                            # Wait until the closing audio has finished playing before closing
+                            logger.info("⏳ Waiting for the client to finish playing audio...")
+                            if client_connected and await wait_for_audio_drain(websocket, timeout=5):
+                                # Close WebSocket connection
+                                logger.info(f"🔌 Closing WebSocket connection after AI conclusion")
+                                await websocket.close(code=1000, reason="Interview concluded by AI")
                             break  # Exit message loop
                             
                         except Exception as e:
@@ -6121,24 +6869,16 @@ MULTI-LANGUAGE INTERVIEW — MANDATORY:
                     
                     # Track topics covered (simple keyword-based tracking)
                     # This is a basic implementation - the LLM should also be aware of topics
-                    topic_keywords = {
-                        "technical_skills": ["technical", "skill", "technology", "programming", "coding", "development"],
-                        "experience": ["experience", "worked", "project", "previous", "past", "background"],
-                        "education": ["education", "degree", "university", "school", "studied"],
-                        "problem_solving": ["problem", "challenge", "solve", "solution", "approach"],
-                        "communication": ["communicate", "explain", "present", "team", "collaborate"],
-                        "motivation": ["motivation", "interested", "why", "passion", "excited"]
-                    }
                     response_lower = interviewer_response.lower()
-                    for topic, keywords in topic_keywords.items():
+                    for topic, keywords in TOPIC_KEYWORDS.items():
                         if any(keyword in response_lower for keyword in keywords):
                             conversation.add_covered_topic(topic)
                     
                     # Also check if LLM switched language in response
-                    if any(phrase in interviewer_response.lower() for phrase in ["now let's continue in", "maintenant, continuons en", "let's switch to", "changeons de langue"]):
+                    if any(phrase in response_lower for phrase in LLM_LANGUAGE_SWITCH_PHRASES):
                         # Extract language from response if possible
-                        for lang in ["French", "English", "Arabic", "Spanish"]:
-                            if lang.lower() in interviewer_response.lower():
+                        for lang in ("French", "English", "Arabic", "Spanish"):
+                            if lang.lower() in response_lower:
                                 conversation.set_current_language(lang)
                                 logger.info(f"🌐 LLM initiated language switch to: {lang}")
                                 break
@@ -6152,36 +6892,31 @@ MULTI-LANGUAGE INTERVIEW — MANDATORY:
                 # Handle binary audio data
                 if conversation_id and conversation:
                     audio_bytes = message["bytes"]
-                    config = session_configs.get(conversation_id, {})
+                    config = session_config(conversation_id)
+                    rt = get_session_runtime(conversation_id, config)
                     
                     # Speech to Text using selected provider
-                    stt_func = get_stt_function(config.get("stt_provider", DEFAULT_STT_PROVIDER))
-                    stt_model = config.get("stt_model", STT_PROVIDERS[DEFAULT_STT_PROVIDER]["default_model"])
+                    stt_func = rt.stt_func
+                    stt_model = rt.stt_model
                     
                     try:
-                        if config.get("stt_provider") == "cartesia":
+                        if rt.stt_provider == "cartesia":
                             user_text = stt_func(audio_bytes, audio_format="webm", model_id=stt_model)
                         else:
                             user_text = stt_func(audio_bytes, model_id=stt_model)
                     except Exception as e:
                         logger.warning(f"⚠️ STT failed to process chunk (likely too short): {e}")
-                        await websocket.send_json({
-                            "type": "error",
-                            "message": "Audio chunk too short or unrecognized. Please speak again."
-                        })
+                        await websocket.send_text(ERR_AUDIO_TOO_SHORT)
                         continue
                     
                     if not user_text.strip():
-                        await websocket.send_json({
-                            "type": "error",
-                            "message": "No speech detected"
-                        })
+                        await websocket.send_text(ERR_NO_SPEECH)
                         continue
                     
                     conversation.add_message("user", user_text)
                     
                     # Check if we're in pre-check phase
-                    llm_funcs = get_llm_functions(config.get("llm_provider", DEFAULT_LLM_PROVIDER))
+                    llm_funcs = rt.llm_funcs
                     should_continue = await handle_precheck_response(
                         conversation, user_text, config, llm_funcs, websocket, conversation_id
                     )
@@ -6194,45 +6929,42 @@ MULTI-LANGUAGE INTERVIEW — MANDATORY:
                     
                     # Calculate time remaining using config duration
                     time_remaining_minutes = None
-                    interview_time_limit = config.get("interview_duration_minutes", INTERVIEW_TIME_LIMIT_MINUTES)
-                    if conversation_id in interview_start_times:
-                        elapsed_minutes = (time.time() - interview_start_times[conversation_id]) / 60
+                    interview_time_limit = rt.interview_time_limit
+                    state = sessions.get(conversation_id)
+                    if state:
+                        elapsed_minutes = (time.time() - state.started_at) / 60
                         time_remaining_minutes = max(0, interview_time_limit - elapsed_minutes)
                     
                     interview_context = conversation.get_interview_context(time_remaining_minutes=time_remaining_minutes, total_interview_minutes=interview_time_limit)
-                    llm_provider = config.get("llm_provider", DEFAULT_LLM_PROVIDER)
-                    llm_model = config.get("llm_model", LLM_PROVIDERS[llm_provider]["default_model"])
-                    interviewer_response = llm_funcs["generate_response"](
-                        history[:-1], 
-                        user_text, 
-                        model_id=llm_model,
-                        interview_context=interview_context
+                    llm_provider = rt.llm_provider
+                    llm_model = rt.llm_model
+                    # TTS runs per sentence while the LLM is still generating (both in worker threads)
+                    interviewer_response, pipelined_audio = await asyncio.to_thread(
+                        _generate_response_pipelined,
+                        llm_funcs,
+                        dict(
+                            conversation_history=history[:-1],
+                            user_message=user_text,
+                            model_id=llm_model,
+                            interview_context=interview_context
+                        ),
+                        rt.voice_id, rt.tts_model
                     )
                     
                     # Detect proactive language switch in AI response
                     response_lower = interviewer_response.lower()
                     required_langs = conversation.get_required_languages_list()
                     current_lang = conversation.get_current_language()
-                    tested_langs = conversation.get_tested_languages()
                     
                     # Check if AI is switching to an untested language
                     if required_langs and len(required_langs) > 1:
-                        untested_langs = [lang for lang in required_langs if lang not in tested_langs]
+                        untested_langs = conversation.get_untested_languages()
+                        response_langs = mentioned_languages(response_lower)
                         for lang in untested_langs:
-                            lang_keywords = {
-                                "French": ["français", "francais", "french", "en français", "continuons en français"],
-                                "English": ["english", "anglais", "in english", "let's continue in english"],
-                                "Arabic": ["arabic", "arabe", "en arabe", "بالعربية"],
-                                "Spanish": ["spanish", "espagnol", "español", "en español"],
-                                "German": ["german", "allemand", "deutsch", "auf deutsch"]
-                            }
-                            if lang in lang_keywords:
-                                for keyword in lang_keywords[lang]:
-                                    if keyword in response_lower and lang != current_lang:
-                                        # AI is proactively switching to this language
-                                        conversation.set_current_language(lang)
-                                        logger.info(f"🌐 AI proactively switched to {lang} for language testing")
-                                        break
+                            if lang in response_langs and lang != current_lang:
+                                # AI is proactively switching to this language
+                                conversation.set_current_language(lang)
+                                logger.info(f"🌐 AI proactively switched to {lang} for language testing")
                     
                     conversation.add_message("interviewer", interviewer_response)
                     # Increment question count for current language
@@ -6244,20 +6976,22 @@ MULTI-LANGUAGE INTERVIEW — MANDATORY:
                     
                     # Strip the token so it doesn't get spoken or shown to candidate
                     if "[interview_concluded]" in response_lower:
-                        import re
-                        interviewer_response = re.sub(r'\[INTERVIEW_CONCLUDED\]', '', interviewer_response, flags=re.IGNORECASE).strip()
+                        interviewer_response = INTERVIEW_CONCLUDED_RE.sub('', interviewer_response).strip()
                     
                     # Text to Speech using selected provider
-                    tts_func = get_tts_function(config.get("tts_provider", DEFAULT_TTS_PROVIDER))
-                    voice_id = get_voice_id(config.get("tts_provider", DEFAULT_TTS_PROVIDER))
-                    tts_model = config.get("tts_model")
+                    tts_func = rt.tts_func
+                    voice_id = rt.voice_id
+                    tts_model = rt.tts_model
                     
                     try:
                         if not interviewer_response.strip():
                             # Avoid throwing ValueError if AI only responded with conclusion token
                             response_audio_bytes = b""
                             audio_format = "mp3"
-                        elif config.get("tts_provider") == "cartesia":
+                        elif pipelined_audio:
+                            response_audio_bytes = pipelined_audio
+                            audio_format = "mp3"
+                        elif rt.tts_provider == "cartesia":
                             response_audio_bytes = tts_func(interviewer_response, voice_id, tts_model)
                             audio_format = "wav"
                         else:  # elevenlabs
@@ -6275,34 +7009,34 @@ MULTI-LANGUAGE INTERVIEW — MANDATORY:
                     except Exception as e:
                         error_msg = f"TTS service error: {str(e)}"
                         logger.error(f"❌ TTS Error: {error_msg}")
-                        await websocket.send_json({
-                            "type": "error",
-                            "message": "Text-to-speech service error. Please try again or switch to a different TTS provider."
-                        })
+                        await websocket.send_text(ERR_TTS_SERVICE)
                         continue
                     
-                    # Send the response first
-                    response_audio_base64 = base64.b64encode(response_audio_bytes).decode('utf-8')
+                    # Send the response first - metadata, then the audio itself as a binary frame (audio_len announces it)
                     await websocket.send_json({
                         "type": "response",
                         "user_text": user_text,
                         "interviewer_text": interviewer_response,
-                        "audio": response_audio_base64,
+                        "audio_len": len(response_audio_bytes),
                         "audio_format": audio_format
                     })
+                    if response_audio_bytes:
+                        await websocket.send_bytes(response_audio_bytes)
                     
                     # If AI concluded and we're in interview phase, auto-generate assessment
                     if is_conclusion and conversation.get_current_phase() == ConversationManager.PHASE_INTERVIEW:
                         logger.info("🎯 AI concluded the interview - auto-generating assessment")
                         
-                        # Wait for the closing audio to finish playing (typical closing is 10-15 seconds)
-                        logger.info("⏳ Waiting 12 seconds for closing audio to finish...")
-                        await asyncio.sleep(12)
+                        # Wait for the closing audio to finish playing - the client acks once it is idle
+                        # (at most 12 seconds; typical closing is 10-15 seconds)
+                        await websocket.send_json({"type": "interview_ended", "reason": "concluded"})
+                        logger.info("⏳ Waiting for the closing audio to finish...")
+                        client_connected = await wait_for_audio_drain(websocket, timeout=12, deferred=deferred_messages)
                         
                         # Generate assessment
                         history = conversation.get_history_for_llm()
                         interview_context_final = conversation.get_interview_context()
-                        llm_funcs = get_llm_functions(config.get("llm_provider", DEFAULT_LLM_PROVIDER))
+                        llm_funcs = rt.llm_funcs
                         
                         try:
                             assessment = llm_funcs["generate_assessment"](
@@ -6311,124 +7045,44 @@ MULTI-LANGUAGE INTERVIEW — MANDATORY:
                                 interview_context=interview_context_final
                             )
                             
+                            # Transcript annotations (AI feedback) are generated first so they go into the same write
+                            annotate_transcript(history, model_id=llm_model, feedback_language=conversation.interview_start_language if conversation else None)
+                            
                             # Store assessment in database
+                            db = SessionLocal(expire_on_commit=False)
                             try:
-                                db = next(get_db())
-                                
-                                recommendation = extract_recommendation(assessment)
-                                detailed_scores = extract_detailed_scores(assessment)
-                                
-                                application_id = config.get("application_id")
-                                if not application_id:
-                                    evaluation_id = config.get("evaluation_id")
-                                    if evaluation_id:
-                                        if evaluation_id in cv_evaluations:
-                                            application_id = cv_evaluations[evaluation_id].get("application_id")
-                                        if not application_id:
-                                            cv_eval = db.query(DBCVEvaluation).filter(
-                                                DBCVEvaluation.evaluation_id == evaluation_id
-                                            ).first()
-                                            if cv_eval:
-                                                application_id = cv_eval.application_id
-                                
-                                job_offer_id = config.get("job_offer_id")
-                                candidate_name = conversation.get_candidate_name() or config.get("candidate_name")
-                                cv_text = config.get("candidate_cv_text", "")
-                                
-                                interview = None
-                                if application_id:
-                                    interview = db.query(DBInterview).filter(
-                                        DBInterview.application_id == application_id
-                                    ).order_by(DBInterview.created_at.desc()).first()
-                                
-                                if not interview:
-                                    interview = DBInterview(
-                                        application_id=application_id,
-                                        job_offer_id=job_offer_id or "",
-                                        candidate_name=candidate_name,
-                                        cv_text=cv_text[:5000] if cv_text else None,
-                                        status="completed",
-                                        assessment=assessment,
-                                        recommendation=recommendation,
-                                        evaluation_scores=json.dumps(detailed_scores),
-                                        conversation_history=json.dumps(history),
-                                        completed_at=datetime.now()
+                                # Interview (with the annotated transcript) and application are written together or not at all
+                                with db.begin():
+                                    interview, recommendation = persist_interview_assessment(
+                                        db, config, assessment, history, conversation.get_candidate_name() or config.get("candidate_name")
                                     )
-                                    db.add(interview)
-                                else:
-                                    interview.status = "completed"
-                                    interview.assessment = assessment
-                                    interview.recommendation = recommendation
-                                    interview.evaluation_scores = json.dumps(detailed_scores)
-                                    interview.conversation_history = json.dumps(history)
-                                    interview.completed_at = datetime.now()
-                                
-                                if application_id:
-                                    application = db.query(DBApplication).filter(
-                                        DBApplication.application_id == application_id
-                                    ).first()
-                                    if application:
-                                        application.interview_completed_at = datetime.now()
-                                        application.interview_assessment = assessment
-                                        application.interview_recommendation = recommendation
-                                        application.updated_at = datetime.now()
                                 
-                                db.commit()
                                 logger.info(f"✅ Interview assessment stored: interview_id={interview.interview_id}, recommendation={recommendation}")
-                                
-                                # Generate transcript annotations (AI feedback)
-                                _rt_ann_lang = conversation.interview_start_language if conversation else None
-                                try:
-                                    if config.get("llm_provider", DEFAULT_LLM_PROVIDER) == "gpt":
-                                        from backend.services.language_llm_openai import generate_transcript_annotations as gemini_generate_transcript_annotations
-                                        annotations = gemini_generate_transcript_annotations(conversation_history=history, model_id=llm_model, feedback_language=_rt_ann_lang)
-                                    else:
-                                        from backend.services.language_llm_openai import generate_transcript_annotations as gemini_generate_transcript_annotations
-                                        annotations = gemini_generate_transcript_annotations(conversation_history=history, model_id=llm_model, feedback_language=_rt_ann_lang)
-                                    
-                                    # Update conversation history with annotations
-                                    for i, msg in enumerate(history):
-                                        if msg["role"] == "user":
-                                            idx_str = str(i)
-                                            if idx_str in annotations:
-                                                msg["ai_comment"] = annotations[idx_str]
-                                    
-                                    interview.conversation_history = json.dumps(history)
-                                    db.commit()
-                                    logger.info("✅ Saved real-time interview transcript annotations")
-                                except Exception as e:
-                                    logger.error(f"❌ Error generating real-time transcript annotations: {e}")
-                                
                             except Exception as e:
                                 logger.error(f"❌ Error storing interview assessment: {e}")
-                                db.rollback() if 'db' in locals() else None
+                            finally:
+                                db.close()
                             
-                            # Send neutral completion message to candidate (no feedback)
-                            await websocket.send_json({
-                                "type": "assessment",
-                                "assessment": "**Interview Completed**\n\nThank you for your time! Our HR team will review your application and get back to you soon.\n\nWe appreciate your interest in this position.",
-                                "interview_completed": True,
-                                "interview_id": interview.interview_id if 'interview' in locals() and interview else None
-                            })
+                            # Send neutral completion message to candidate (no feedback) - unless they already left
+                            if client_connected:
+                                await websocket.send_json({
+                                    "type": "assessment",
+                                    "assessment": INTERVIEW_COMPLETED_MESSAGE,
+                                    "interview_completed": True,
+                                    "interview_id": interview.interview_id if 'interview' in locals() and interview else None
+                                })
                             
                             # Clean up and close connection
-                            if conversation_id in active_conversations:
-                                del active_conversations[conversation_id]
-                            if conversation_id in session_configs:
-                                del session_configs[conversation_id]
-                            if conversation_id in interview_start_times:
-                                del interview_start_times[conversation_id]
-                            cleanup_dedup_cache(conversation_id)
+                            release_conversation_state(conversation_id)
                             
                             logger.info("✅ Interview auto-concluded by AI")
                             
-                            # Wait additional time before closing to ensure audio finished
-                            logger.info("⏳ Waiting 5 more seconds before closing connection...")
-                            await asyncio.sleep(5)
-                            
-                            # Close WebSocket connection
-                            logger.info(f"🔌 Closing WebSocket connection after AI conclusion")
-                            await websocket.close(code=1000, reason="Interview concluded by AI")
+                            # Wait until the closing audio has finished playing before closing
+                            logger.info("⏳ Waiting for the client to finish playing audio...")
+                            if client_connected and await wait_for_audio_drain(websocket, timeout=5):
+                                # Close WebSocket connection
+                                logger.info(f"🔌 Closing WebSocket connection after AI conclusion")
+                                await websocket.close(code=1000, reason="Interview concluded by AI")
                             break  # Exit message loop
                             
                         except Exception as e:
@@ -6436,15 +7090,7 @@ MULTI-LANGUAGE INTERVIEW — MANDATORY:
                             # Continue normally if assessment generation fails
     
     except WebSocketDisconnect:
-        # Clean up conversation if needed
-        if conversation_id and conversation_id in active_conversations:
-            del active_conversations[conversation_id]
-        if conversation_id and conversation_id in session_configs:
-            del session_configs[conversation_id]
-        if conversation_id:
-            cleanup_dedup_cache(conversation_id)
-        if conversation_id and conversation_id in interview_start_times:
-            del interview_start_times[conversation_id]
+        pass  # Conversation state is released below
     except Exception as e:
         logger.error(f"WebSocket error: {e}")
         try:
@@ -6452,8 +7098,14 @@ MULTI-LANGUAGE INTERVIEW — MANDATORY:
                 "type": "error",
                 "message": str(e)
             })
-        except:
+        except Exception:
             pass
+    finally:
+        # Release per-conversation state however the socket ended (errors included), so nothing leaks
+        if conversation_id:
+            release_conversation_state(conversation_id)
+        if db_ws is not None:
+            await db_ws.close()
 
 
 if __name__ == "__main__":
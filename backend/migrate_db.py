@@ -1,11 +1,13 @@
 """Database migration script - adds missing columns to existing tables."""
 import sys
 import os
+import json
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from backend.database import engine
+from backend.models.db_models import APPLICATION_STATS_TRIGGERS, POSTGRES_APPLICATION_STATS_TRIGGERS, parse_required_languages
 from sqlalchemy import text
 import logging
 
@@ -13,8 +15,147 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Admin search column-filter/sort index - shared by the SQLite and PostgreSQL migrations
+ADMIN_SEARCH_INDEX = (
+    'applications(job_offer_id, ai_status, hr_status, submitted_at DESC, application_id, '
+    'candidate_name, candidate_email, job_title)'
+)
+
+# Search indexes created concurrently on PostgreSQL databases (trigram indexes serve the ILIKE filters)
+POSTGRES_SEARCH_INDEXES = {
+    'ix_app_admin_search': ADMIN_SEARCH_INDEX,
+    'ix_interviews_assessment_hash': 'interviews(assessment_hash)',
+    'ix_candidates_full_name_trgm': 'candidates USING gin (full_name gin_trgm_ops)',
+    'ix_candidates_email_trgm': 'candidates USING gin (email gin_trgm_ops)',
+    'ix_app_candidate_name_trgm': 'applications USING gin (candidate_name gin_trgm_ops)',
+    'ix_app_candidate_email_trgm': 'applications USING gin (candidate_email gin_trgm_ops)',
+    'ix_app_cover_letter_trgm': 'applications USING gin (cover_letter gin_trgm_ops)',
+    'ix_app_cv_text_trgm': 'applications USING gin (cv_text gin_trgm_ops)',
+}
+
+# Columns added to existing tables after the first release - mirrors the SQLite column checks below
+POSTGRES_ADDED_COLUMNS = {
+    'job_offers': {
+        'required_languages_list': 'JSON',
+    },
+    'interviews': {
+        'assessment_hash': 'VARCHAR(64)',
+        'assessment_status': 'VARCHAR',
+        'recording_audio_path': 'VARCHAR(512)',
+        'recording_status': 'VARCHAR',
+        'session_log_path': 'VARCHAR(512)',
+        'cached_context': 'TEXT',
+    },
+}
+
+# Copies candidate name/email and job title onto applications rows that predate the denormalized columns
+APPLICATION_SEARCH_FIELDS_BACKFILL = """
+    UPDATE applications SET
+        candidate_name = (
+            SELECT full_name FROM candidates WHERE candidates.candidate_id = applications.candidate_id
+        ),
+        candidate_email = (
+            SELECT email FROM candidates WHERE candidates.candidate_id = applications.candidate_id
+        ),
+        job_title = (
+            SELECT title FROM job_offers WHERE job_offers.offer_id = applications.job_offer_id
+        )
+    WHERE candidate_name IS NULL
+"""
+
+# Recomputes the denormalized candidate application stats - shared by the SQLite and PostgreSQL migrations
+CANDIDATE_STATS_BACKFILL = """
+    UPDATE candidates SET
+        total_applications = (
+            SELECT COUNT(*) FROM applications WHERE applications.candidate_id = candidates.candidate_id
+        ),
+        latest_application_at = (
+            SELECT MAX(submitted_at) FROM applications WHERE applications.candidate_id = candidates.candidate_id
+        )
+"""
+
+
+def migrate_postgres_columns():
+    """Add the missing job offer/interview columns on PostgreSQL and convert conversation_history to JSONB."""
+    with engine.begin() as conn:
+        for table_name, columns in POSTGRES_ADDED_COLUMNS.items():
+            for column_name, column_type in columns.items():
+                conn.execute(text(f"ALTER TABLE {table_name} ADD COLUMN IF NOT EXISTS {column_name} {column_type}"))
+        
+        # Backfill required_languages_list from the JSON strings (new writes keep it in sync)
+        rows = conn.execute(text(
+            "SELECT offer_id, required_languages FROM job_offers WHERE required_languages_list IS NULL"
+        )).fetchall()
+        for offer_id, required_languages in rows:
+            conn.execute(
+                text("UPDATE job_offers SET required_languages_list = :languages WHERE offer_id = :offer_id"),
+                {"languages": json.dumps(parse_required_languages(required_languages)), "offer_id": offer_id}
+            )
+        if rows:
+            logger.info(f"✅ Backfilled 'required_languages_list' on {len(rows)} job offers")
+        
+        # conversation_history used to be TEXT - empty strings (not valid JSON) become NULL
+        data_type = conn.execute(text(
+            "SELECT data_type FROM information_schema.columns "
+            "WHERE table_name = 'interviews' AND column_name = 'conversation_history'"
+        )).scalar()
+        if data_type and data_type != 'jsonb':
+            conn.execute(text(
+                "ALTER TABLE interviews ALTER COLUMN conversation_history TYPE jsonb "
+                "USING NULLIF(conversation_history::text, '')::jsonb"
+            ))
+            logger.info(f"✅ Converted 'conversation_history' from {data_type} to jsonb")
+    logger.info("✅ Job offer and interview columns ready")
+
+
+def migrate_postgres_search_columns():
+    """Add and backfill the denormalized admin search columns on PostgreSQL."""
+    with engine.begin() as conn:
+        for column_name in ('candidate_name', 'candidate_email', 'job_title'):
+            conn.execute(text(f"ALTER TABLE applications ADD COLUMN IF NOT EXISTS {column_name} VARCHAR"))
+        result = conn.execute(text(APPLICATION_SEARCH_FIELDS_BACKFILL))
+    if result.rowcount:
+        logger.info(f"✅ Backfilled candidate/job fields on {result.rowcount} applications")
+
+
+def migrate_postgres_application_stats():
+    """Add the candidate application stats columns on PostgreSQL and keep them in sync with a trigger."""
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE candidates ADD COLUMN IF NOT EXISTS total_applications INTEGER DEFAULT 0"))
+        conn.execute(text("ALTER TABLE candidates ADD COLUMN IF NOT EXISTS latest_application_at TIMESTAMP"))
+        has_trigger = conn.execute(text(
+            "SELECT COUNT(*) FROM pg_trigger WHERE tgname = 'trg_applications_stats'"
+        )).scalar() > 0
+        if not has_trigger:
+            # Stats were never maintained without the trigger - recompute them once, in the same transaction
+            conn.execute(text(CANDIDATE_STATS_BACKFILL))
+            logger.info("✅ Backfilled candidate application stats")
+        for trigger_sql in POSTGRES_APPLICATION_STATS_TRIGGERS:
+            conn.execute(text(trigger_sql))
+    logger.info("✅ Application stats trigger ready")
+
+
+def migrate_postgres_indexes():
+    """Create the PostgreSQL-only search indexes without locking writes (CREATE INDEX CONCURRENTLY)."""
+    # CONCURRENTLY cannot run inside a transaction block
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        for index_name, index_target in POSTGRES_SEARCH_INDEXES.items():
+            conn.execute(text(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} ON {index_target}"))
+            logger.info(f"✅ Index '{index_name}' ready")
+
+
 def migrate_database():
     """Add missing columns to existing database tables."""
+    if engine.dialect.name == "postgresql":
+        # The column checks below read SQLite's pragma_table_info - PostgreSQL has its own column, stats and index steps
+        migrate_postgres_columns()
+        migrate_postgres_search_columns()
+        migrate_postgres_application_stats()
+        migrate_postgres_indexes()
+        logger.info("✅ Database migration completed successfully!")
+        return
+
     try:
         with engine.connect() as conn:
             # Check if required_languages column exists in job_offers table
@@ -137,6 +278,32 @@ def migrate_database():
             else:
                 logger.info("Column 'interview_mode' already exists")
             
+            # Check if required_languages_list column exists (parsed copy of required_languages)
+            result = conn.execute(text("""
+                SELECT COUNT(*) as count 
+                FROM pragma_table_info('job_offers') 
+                WHERE name='required_languages_list'
+            """))
+            has_required_languages_list = result.fetchone()[0] > 0
+            
+            # Add required_languages_list column and backfill it from the JSON strings
+            if not has_required_languages_list:
+                logger.info("Adding 'required_languages_list' column to job_offers table...")
+                conn.execute(text("""
+                    ALTER TABLE job_offers 
+                    ADD COLUMN required_languages_list JSON
+                """))
+                rows = conn.execute(text("SELECT offer_id, required_languages FROM job_offers")).fetchall()
+                for offer_id, required_languages in rows:
+                    conn.execute(
+                        text("UPDATE job_offers SET required_languages_list = :languages WHERE offer_id = :offer_id"),
+                        {"languages": json.dumps(parse_required_languages(required_languages)), "offer_id": offer_id}
+                    )
+                conn.commit()
+                logger.info(f"✅ Added 'required_languages_list' column (backfilled {len(rows)} job offers)")
+            else:
+                logger.info("Column 'required_languages_list' already exists")
+            
             # Check and add missing columns in applications table
             logger.info("Checking applications table for missing columns...")
             
@@ -154,6 +321,9 @@ def migrate_database():
                 'archived_at': ('DATETIME', None),
                 'language_check_json': ('TEXT', None),
                 'job_fit_check_json': ('TEXT', None),
+                'candidate_name': ('VARCHAR', None),
+                'candidate_email': ('VARCHAR', None),
+                'job_title': ('VARCHAR', None),
             }
             
             # Add missing columns
@@ -170,6 +340,12 @@ def migrate_database():
                 else:
                     logger.info(f"Column '{column_name}' already exists")
             
+            # Backfill the denormalized candidate/job fields used by the admin search
+            result = conn.execute(text(APPLICATION_SEARCH_FIELDS_BACKFILL))
+            conn.commit()
+            if result.rowcount:
+                logger.info(f"✅ Backfilled candidate/job fields on {result.rowcount} applications")
+            
             # Check and add missing columns in interviews table
             logger.info("Checking interviews table for missing columns...")
             
@@ -182,7 +358,13 @@ def migrate_database():
             # Define expected columns for interviews table
             expected_interview_columns = {
                 'evaluation_scores': ('TEXT', None),
+                'assessment_hash': ('VARCHAR(64)', None),
+                'assessment_status': ('VARCHAR', None),
                 'recording_audio': ('TEXT', None),
+                'recording_audio_path': ('VARCHAR(512)', None),
+                'session_log_path': ('VARCHAR(512)', None),
+                'cached_context': ('TEXT', None),
+                'recording_status': ('VARCHAR', None),
                 'provider_preferences': ('TEXT', None),
                 'audio_segments': ('TEXT', None),
                 'recording_video': ('TEXT', None),
@@ -218,6 +400,72 @@ def migrate_database():
             else:
                 logger.info("Column 'cv_file_path' already exists")
 
+            # Denormalized application stats on candidates
+            logger.info("Checking candidates table for missing columns...")
+            result = conn.execute(text("""
+                SELECT name FROM pragma_table_info('candidates')
+            """))
+            existing_candidate_columns = {row[0] for row in result.fetchall()}
+            
+            expected_candidate_columns = {
+                'total_applications': ('INTEGER', '0'),
+                'latest_application_at': ('DATETIME', None),
+            }
+            
+            added_candidate_stats = False
+            for column_name, (column_type, default_value) in expected_candidate_columns.items():
+                if column_name not in existing_candidate_columns:
+                    logger.info(f"Adding '{column_name}' column to candidates table...")
+                    if default_value is not None:
+                        sql = f"ALTER TABLE candidates ADD COLUMN {column_name} {column_type} DEFAULT {default_value}"
+                    else:
+                        sql = f"ALTER TABLE candidates ADD COLUMN {column_name} {column_type}"
+                    conn.execute(text(sql))
+                    conn.commit()
+                    added_candidate_stats = True
+                    logger.info(f"✅ Added '{column_name}' column")
+                else:
+                    logger.info(f"Column '{column_name}' already exists")
+            
+            if added_candidate_stats:
+                logger.info("Backfilling candidate application stats...")
+                conn.execute(text(CANDIDATE_STATS_BACKFILL))
+                conn.commit()
+                logger.info("✅ Backfilled candidate application stats")
+            
+            for trigger_sql in APPLICATION_STATS_TRIGGERS:
+                conn.execute(text(trigger_sql))
+            conn.commit()
+            logger.info("✅ Application stats triggers ready")
+            
+            # conversation_history is a JSON column now - existing rows already hold JSON text,
+            # only empty strings (not valid JSON) need clearing
+            conn.execute(text("UPDATE interviews SET conversation_history = NULL WHERE conversation_history = ''"))
+            conn.commit()
+            
+            # Create missing indexes
+            logger.info("Checking for missing indexes...")
+            expected_indexes = {
+                'ix_app_status': 'applications(candidate_id, hr_status, ai_status)',
+                'ix_app_hr_ai_status': 'applications(hr_status, ai_status)',
+                'ix_app_submitted_at': 'applications(submitted_at)',
+                'ix_app_admin_search': ADMIN_SEARCH_INDEX,
+                'ix_app_needs_review': (
+                    "applications(application_id) WHERE ai_status = 'approved' AND hr_status = 'pending'"
+                ),
+                'ix_interview_status': 'interviews(status)',
+                'ix_interviews_assessment_hash': 'interviews(assessment_hash)',
+                'ix_interviews_active_recent': (
+                    'interviews(created_at DESC, interview_id, application_id, job_offer_id, status, '
+                    'recommendation, candidate_name, completed_at, archived_at, is_archived) '
+                    'WHERE is_archived IS NOT 1'
+                ),
+            }
+            for index_name, index_target in expected_indexes.items():
+                conn.execute(text(f"CREATE INDEX IF NOT EXISTS {index_name} ON {index_target}"))
+                conn.commit()
+                logger.info(f"✅ Index '{index_name}' ready")
+
             logger.info("✅ Database migration completed successfully!")
 
     except Exception as e:
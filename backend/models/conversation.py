@@ -40,6 +40,7 @@ class ConversationManager:
         self.candidate_cv_text = candidate_cv_text
         self.job_title = job_title
         self.required_languages = required_languages
+        self._required_languages_list: Optional[List[str]] = None  # Parsed once, on first use
         self.interview_start_language = interview_start_language
         self.custom_questions = custom_questions
         self.evaluation_weights = evaluation_weights
@@ -60,7 +61,7 @@ class ConversationManager:
     def get_interview_context(self, time_remaining_minutes: Optional[float] = None, total_interview_minutes: Optional[float] = None) -> Dict[str, Optional[str]]:
         """Get the interview context (job offer and candidate profile)."""
         required_list = self.get_required_languages_list()
-        untested = [lang for lang in required_list if lang not in self.tested_languages]
+        untested = self.get_untested_languages()
         
         # Provide information for AI to make intelligent decisions - no forcing
         context = {
@@ -160,12 +161,19 @@ class ConversationManager:
     
     def get_required_languages_list(self) -> List[str]:
         """Get list of required languages."""
-        if not self.required_languages:
-            return []
-        try:
-            return json.loads(self.required_languages) if isinstance(self.required_languages, str) else self.required_languages
-        except:
-            return []
+        if self._required_languages_list is None:
+            if not self.required_languages:
+                self._required_languages_list = []
+            else:
+                try:
+                    self._required_languages_list = json.loads(self.required_languages) if isinstance(self.required_languages, str) else self.required_languages
+                except (ValueError, TypeError):
+                    self._required_languages_list = []
+        return self._required_languages_list
+    
+    def get_untested_languages(self) -> List[str]:
+        """Get required languages not tested yet, in required order."""
+        return [lang for lang in self.get_required_languages_list() if lang not in self.tested_languages]
     
     def add_message(self, role: str, text: str, **extra):
         """
@@ -1,8 +1,10 @@
 """Database models for the application."""
-from sqlalchemy import Column, String, Text, Integer, DateTime, ForeignKey, Boolean
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Text, Integer, DateTime, ForeignKey, Boolean, Index, DDL, JSON, event
+from sqlalchemy.orm import relationship, validates
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 from datetime import datetime
+import json
 import uuid
 from backend.database import Base
 
@@ -12,6 +14,17 @@ def generate_id():
     return f"{uuid.uuid4().hex[:12]}"
 
 
+def parse_required_languages(value) -> list:
+    """Parse a job offer's required_languages JSON string into a list (empty if unset or malformed)."""
+    if not value:
+        return []
+    try:
+        languages = json.loads(value)
+    except (json.JSONDecodeError, TypeError):
+        return []
+    return languages if isinstance(languages, list) else []
+
+
 class JobOffer(Base):
     """Job offer model."""
     __tablename__ = "job_offers"
@@ -23,6 +36,7 @@ class JobOffer(Base):
     experience_level = Column(String, default="")
     education_requirements = Column(Text, default="")
     required_languages = Column(Text, default="")  # JSON array of languages, e.g., ["English", "French"]
+    required_languages_list = Column(JSON, nullable=True)  # required_languages parsed at write time - read this instead of json.loads
     interview_start_language = Column(String, default="")  # Language to start the interview with
     interview_duration_minutes = Column(Integer, default=20)  # Interview duration in minutes (default 20)
     
@@ -44,6 +58,12 @@ class JobOffer(Base):
     # Relationships
     applications = relationship("Application", back_populates="job_offer", cascade="all, delete-orphan")
 
+    @validates("required_languages")
+    def _sync_required_languages_list(self, key, value):
+        """Keep the parsed list in step with the JSON string on every write."""
+        self.required_languages_list = parse_required_languages(value)
+        return value
+
 
 class Candidate(Base):
     """Candidate model - stores unique candidate information."""
@@ -57,10 +77,26 @@ class Candidate(Base):
     portfolio = Column(String)
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    
+    # Denormalized application stats (maintained by triggers on applications)
+    total_applications = Column(Integer, default=0)
+    latest_application_at = Column(DateTime, nullable=True)
 
     # Relationships
     applications = relationship("Application", back_populates="candidate", cascade="all, delete-orphan")
 
+    # Trigram indexes serve the admin search's ILIKE '%q%' filters (PostgreSQL only)
+    __table_args__ = (
+        Index(
+            "ix_candidates_full_name_trgm", "full_name",
+            postgresql_using="gin", postgresql_ops={"full_name": "gin_trgm_ops"}
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_candidates_email_trgm", "email",
+            postgresql_using="gin", postgresql_ops={"email": "gin_trgm_ops"}
+        ).ddl_if(dialect="postgresql"),
+    )
+
 
 class Application(Base):
     """Application model - links candidates to job offers."""
@@ -77,6 +113,11 @@ class Application(Base):
     cv_filename = Column(String)
     cv_file_path = Column(String, nullable=True)  # Path to stored PDF file (e.g. "cvs/app_xxx.pdf")
     
+    # Denormalized for the admin search (copied on submit; job_title re-synced when the offer is renamed)
+    candidate_name = Column(String, nullable=True)
+    candidate_email = Column(String, nullable=True)
+    job_title = Column(String, nullable=True)
+    
     # AI Evaluation
     ai_status = Column(String, default="pending")  # "approved", "rejected", "pending"
     ai_reasoning = Column(Text, default="")
@@ -113,6 +154,43 @@ class Application(Base):
     job_offer = relationship("JobOffer", back_populates="applications")
     interviews = relationship("Interview", back_populates="application", cascade="all, delete-orphan")
 
+    # Indexes
+    __table_args__ = (
+        Index("ix_app_status", "candidate_id", "hr_status", "ai_status"),  # Candidate list status filter/join
+        Index("ix_app_hr_ai_status", "hr_status", "ai_status"),  # Dashboard status counts
+        Index("ix_app_submitted_at", "submitted_at"),  # Dashboard recent applications
+        # Covering index for search_applications: status filters, newest-first order and every
+        # returned column, so the common no-text-query search is answered from the index alone
+        Index(
+            "ix_app_admin_search",
+            job_offer_id, ai_status, hr_status, submitted_at.desc(), application_id,
+            candidate_name, candidate_email, job_title
+        ),
+        # Partial index for the dashboard "needs review" count (AI approved, HR pending)
+        Index(
+            "ix_app_needs_review", "application_id",
+            sqlite_where=(ai_status == "approved") & (hr_status == "pending"),
+            postgresql_where=(ai_status == "approved") & (hr_status == "pending")
+        ),
+        # Trigram indexes for the admin search (name, email, cover letter text, CV skills) - PostgreSQL only
+        Index(
+            "ix_app_candidate_name_trgm", "candidate_name",
+            postgresql_using="gin", postgresql_ops={"candidate_name": "gin_trgm_ops"}
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_app_candidate_email_trgm", "candidate_email",
+            postgresql_using="gin", postgresql_ops={"candidate_email": "gin_trgm_ops"}
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_app_cover_letter_trgm", "cover_letter",
+            postgresql_using="gin", postgresql_ops={"cover_letter": "gin_trgm_ops"}
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_app_cv_text_trgm", "cv_text",
+            postgresql_using="gin", postgresql_ops={"cv_text": "gin_trgm_ops"}
+        ).ddl_if(dialect="postgresql"),
+    )
+
 
 class CVEvaluation(Base):
     """CV Evaluation model - stores CV evaluation results."""
@@ -146,8 +224,12 @@ class Interview(Base):
     job_offer_id = Column(String, ForeignKey("job_offers.offer_id"), nullable=False)
     
     # Interview data
-    conversation_history = Column(Text, nullable=True)  # JSON string of conversation
+    conversation_history = Column(
+        JSON(none_as_null=True).with_variant(JSONB(none_as_null=True), "postgresql"), nullable=True
+    )  # Conversation as a list of {"role", "content", ...} messages (JSONB on Postgres)
     assessment = Column(Text, nullable=True)  # Full assessment text
+    assessment_status = Column(String, nullable=True)  # "pending", "ready", "failed" - assessments are generated in the background
+    assessment_hash = Column(String(64), nullable=True, index=True)  # sha256 of the assessment input (model, conversation, context) - dedupes repeat LLM calls
     recommendation = Column(String, nullable=True)  # "recommended", "not_recommended"
     candidate_name = Column(String, nullable=True)
     cv_text = Column(Text, nullable=True)  # Reference to CV text used
@@ -157,15 +239,22 @@ class Interview(Base):
     # Example: {"technical_skills": 8, "job_fit": 7, "communication": 9, "problem_solving": 8, "cv_consistency": 7, "linguistic_capacity": {"English": 9, "French": 8}, "overall_score": 7.8}
     
     # Interview recording (stored as base64 encoded audio or file path)
-    recording_audio = Column(Text, nullable=True)  # Base64 encoded audio file of the entire interview (deprecated, use audio_segments)
+    recording_audio = Column(Text, nullable=True)  # Legacy: base64 audio / storage key of the entire interview (use recording_audio_path)
+    recording_audio_path = Column(String(512), nullable=True)  # Storage key of the full recording (e.g., "recordings/interview_id.mp3")
+    recording_status = Column(String, nullable=True)  # "processing", "saved", "failed" - full recording is built in the background
     
     # Audio segments - stores question/answer audio separately like WhatsApp messages
-    # JSON format: [{"type": "question"|"answer", "question_number": int, "audio": base64, "format": "mp3"|"webm", "text": str, "timestamp": iso}]
-    audio_segments = Column(Text, nullable=True)  # JSON array of audio segments
+    # JSON format: [{"type": "question"|"answer", "question_number": int, "audio_key": storage key, "format": "mp3"|"webm", "text": str, "timestamp": iso}]
+    # (older rows carry the audio inline as base64 in "audio")
+    audio_segments = Column(Text, nullable=True)  # JSON array of audio segments (legacy - see session_log_path)
+    session_log_path = Column(String(512), nullable=True)  # Append-only JSONL log of the async session's segments (e.g., "sessions/interview_id.jsonl")
     
     # Video recording (stores relative path to the video file in uploads directory)
     recording_video = Column(String, nullable=True)  # Path to video file (e.g., "videos/interview_id.webm")
     
+    # LLM interview context materialized when an async interview starts (stored as JSON string)
+    cached_context = Column(Text, nullable=True)  # JSON: {"job_title": ..., "candidate_cv_text": ..., "required_languages_list": [...], ...}
+    
     # Provider preferences (stored as JSON string)
     provider_preferences = Column(Text, nullable=True)  # JSON: {"tts_provider": "...", "tts_model": "...", "stt_provider": "...", "stt_model": "...", "llm_provider": "...", "llm_model": "..."}
     
@@ -183,6 +272,19 @@ class Interview(Base):
     # Relationships
     application = relationship("Application", back_populates="interviews")
 
+    # Indexes
+    __table_args__ = (
+        # Covering partial index for the default list_interviews path (active, newest first)
+        Index(
+            "ix_interviews_active_recent",
+            created_at.desc(), interview_id, application_id, job_offer_id, status,
+            recommendation, candidate_name, completed_at, archived_at, is_archived,
+            sqlite_where=is_archived.isnot(True),
+            postgresql_where=is_archived.isnot(True)
+        ),
+        Index("ix_interview_status", "status"),  # Dashboard interview counts
+    )
+
 
 class Admin(Base):
     """Admin model - stores admin user credentials."""
@@ -197,5 +299,69 @@ class Admin(Base):
     last_login = Column(DateTime, nullable=True)
 
 
+# Triggers keeping Candidate.total_applications / latest_application_at in sync
+# with the applications table (SQLite syntax - also used by migrate_db.py)
+APPLICATION_STATS_TRIGGERS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_applications_stats_insert
+    AFTER INSERT ON applications
+    BEGIN
+        UPDATE candidates
+        SET total_applications = COALESCE(total_applications, 0) + 1,
+            latest_application_at = CASE
+                WHEN latest_application_at IS NULL OR NEW.submitted_at > latest_application_at
+                THEN NEW.submitted_at ELSE latest_application_at END
+        WHERE candidate_id = NEW.candidate_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_applications_stats_delete
+    AFTER DELETE ON applications
+    BEGIN
+        UPDATE candidates
+        SET total_applications = MAX(COALESCE(total_applications, 0) - 1, 0),
+            latest_application_at = (
+                SELECT MAX(submitted_at) FROM applications WHERE candidate_id = OLD.candidate_id
+            )
+        WHERE candidate_id = OLD.candidate_id;
+    END
+    """,
+]
+
+# PostgreSQL variant - one plpgsql function behind a row trigger (also used by migrate_db.py)
+POSTGRES_APPLICATION_STATS_TRIGGERS = [
+    """
+    CREATE OR REPLACE FUNCTION applications_stats_sync() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+            UPDATE candidates
+            SET total_applications = COALESCE(total_applications, 0) + 1,
+                latest_application_at = GREATEST(latest_application_at, NEW.submitted_at)
+            WHERE candidate_id = NEW.candidate_id;
+            RETURN NEW;
+        END IF;
+        UPDATE candidates
+        SET total_applications = GREATEST(COALESCE(total_applications, 0) - 1, 0),
+            latest_application_at = (
+                SELECT MAX(submitted_at) FROM applications WHERE candidate_id = OLD.candidate_id
+            )
+        WHERE candidate_id = OLD.candidate_id;
+        RETURN OLD;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS trg_applications_stats ON applications",
+    """
+    CREATE TRIGGER trg_applications_stats
+    AFTER INSERT OR DELETE ON applications
+    FOR EACH ROW EXECUTE FUNCTION applications_stats_sync()
+    """,
+]
 
+for _trigger_sql in APPLICATION_STATS_TRIGGERS:
+    event.listen(Application.__table__, "after_create", DDL(_trigger_sql).execute_if(dialect="sqlite"))
+for _trigger_sql in POSTGRES_APPLICATION_STATS_TRIGGERS:
+    event.listen(Application.__table__, "after_create", DDL(_trigger_sql).execute_if(dialect="postgresql"))
 
+# The trigram indexes need pg_trgm before any table is created
+event.listen(Base.metadata, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"))
@@ -0,0 +1,95 @@
+"""Cache service — Redis when configured, in-process TTL cache otherwise.
+
+Configure via environment variables:
+  REDIS_URL  — e.g. redis://localhost:6379/0
+
+Falls back to an in-process cache if Redis is not configured or the redis
+package is not installed (fine for a single-process deployment).
+"""
+import os
+import time
+import logging
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+REDIS_URL = os.getenv("REDIS_URL", "")
+
+_redis_client = None
+_redis_checked = False
+
+# In-process fallback: key -> (expires_at, value)
+_local_cache: dict = {}
+_LOCAL_CACHE_MAX_ITEMS = 10000
+
+
+def _get_redis_client():
+    """Lazy-init the async Redis client."""
+    global _redis_client, _redis_checked
+    if _redis_checked:
+        return _redis_client
+    _redis_checked = True
+
+    if not REDIS_URL:
+        logger.info("Redis not configured — using in-process cache")
+        return None
+
+    try:
+        import redis.asyncio as redis_asyncio
+        _redis_client = redis_asyncio.from_url(REDIS_URL)
+        logger.info("Redis cache enabled")
+    except ImportError:
+        logger.warning("redis not installed — using in-process cache. Install with: pip install redis")
+        _redis_client = None
+    return _redis_client
+
+
+async def cache_get(key: str) -> Optional[bytes]:
+    """Get a cached value, or None if missing/expired."""
+    client = _get_redis_client()
+    if client is not None:
+        try:
+            return await client.get(key)
+        except Exception as e:
+            logger.warning(f"Redis get failed for {key}: {e}")
+            return None
+
+    entry = _local_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, value = entry
+    if expires_at < time.monotonic():
+        _local_cache.pop(key, None)
+        return None
+    return value
+
+
+async def cache_set(key: str, value: bytes, ttl: int):
+    """Cache a value for ttl seconds."""
+    client = _get_redis_client()
+    if client is not None:
+        try:
+            await client.setex(key, ttl, value)
+        except Exception as e:
+            logger.warning(f"Redis set failed for {key}: {e}")
+        return
+
+    if len(_local_cache) >= _LOCAL_CACHE_MAX_ITEMS:
+        now = time.monotonic()
+        for expired_key in [k for k, (expires_at, _) in _local_cache.items() if expires_at < now]:
+            _local_cache.pop(expired_key, None)
+        if len(_local_cache) >= _LOCAL_CACHE_MAX_ITEMS:
+            _local_cache.pop(next(iter(_local_cache)))
+    _local_cache[key] = (time.monotonic() + ttl, value)
+
+
+async def cache_delete(key: str):
+    """Drop a cached value."""
+    client = _get_redis_client()
+    if client is not None:
+        try:
+            await client.delete(key)
+        except Exception as e:
+            logger.warning(f"Redis delete failed for {key}: {e}")
+        return
+    _local_cache.pop(key, None)
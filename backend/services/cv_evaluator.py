@@ -9,6 +9,17 @@ from backend.config import OPENAI_API_KEY
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# One client for all evaluations - it keeps its HTTPS connection pool between calls
+_openai_client = None
+
+
+def _get_openai_client():
+    global _openai_client
+    if _openai_client is None:
+        from openai import OpenAI
+        _openai_client = OpenAI(api_key=OPENAI_API_KEY)
+    return _openai_client
+
 
 def evaluate_cv_fit(
     cv_text: str,
@@ -55,8 +66,7 @@ Please evaluate the candidate's fit for this position. Provide your assessment i
 Be thorough and specific. If the candidate clearly doesn't match (e.g., wrong field, missing critical skills), set status to "rejected" and explain why. If there's reasonable fit, set status to "approved"."""
 
     try:
-        from openai import OpenAI
-        client = OpenAI(api_key=OPENAI_API_KEY)
+        client = _get_openai_client()
         response = client.chat.completions.create(
             model=llm_model,
             messages=[
@@ -331,7 +331,7 @@ class ElevenLabsSTTStreaming:
         if self.websocket:
             try:
                 await self.websocket.close()
-            except:
+            except Exception:
                 pass
             self.websocket = None
             
@@ -377,8 +377,8 @@ async def transcribe_audio_stream(
             
             await client.commit()
             
-            # Wait a bit for final transcript
-            await asyncio.sleep(0.5)
+            # Wait for the committed transcript (set by the receiver, no fixed sleep)
+            await client.wait_for_transcript(timeout=5.0)
             
     finally:
         await client.close()
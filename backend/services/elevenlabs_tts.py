@@ -2,7 +2,7 @@
 import logging
 import time
 import socket
-from typing import Optional
+from typing import Optional, Iterator
 from elevenlabs import ElevenLabs
 from backend.config import ELEVENLABS_API_KEY, TTS_PROVIDERS, DEFAULT_TTS_PROVIDER, DEFAULT_VOICE_ID, TTS_MAX_RETRIES, TTS_RETRY_DELAY, TTS_OUTPUT_FORMAT
 
@@ -134,3 +134,48 @@ def text_to_speech(
     error_msg = f"ElevenLabs TTS failed after {MAX_RETRIES} attempts. Please check your internet connection and try again."
     logger.error(f"❌ {error_msg} Last error: {last_error}")
     raise Exception(error_msg)
+
+
+def text_to_speech_stream(
+    text: str,
+    voice_id: Optional[str] = None,
+    model_id: Optional[str] = None
+) -> Iterator[bytes]:
+    """
+    Stream text to speech using ElevenLabs' streaming endpoint.
+    
+    Yields MP3 chunks as they are produced so playback can start on the first
+    chunk instead of waiting for the whole utterance. No retries - a failure
+    mid-stream can't be replayed transparently.
+    
+    Args:
+        text: The text to convert to speech
+        voice_id: The voice ID to use (defaults to DEFAULT_VOICE_ID)
+        model_id: The TTS model to use (defaults to config default)
+    
+    Yields:
+        Audio bytes chunks in MP3 format
+    """
+    if voice_id is None:
+        voice_id = DEFAULT_VOICE_ID
+    
+    if model_id is None:
+        model_id = DEFAULT_TTS_MODEL
+    
+    logger.info(f"🔊 ElevenLabs TTS stream: Using model '{model_id}' with voice '{voice_id}'")
+    
+    client = get_client()
+    # SDK 2.x renamed convert_as_stream -> stream
+    stream_func = getattr(client.text_to_speech, "stream", None) or client.text_to_speech.convert_as_stream
+    total_bytes = 0
+    for chunk in stream_func(
+        voice_id=voice_id,
+        text=text,
+        model_id=model_id,
+        output_format=TTS_OUTPUT_FORMAT
+    ):
+        if chunk:
+            total_bytes += len(chunk)
+            yield chunk
+    
+    logger.info(f"🔊 ElevenLabs TTS stream: Streamed {total_bytes} bytes of audio")
@@ -421,7 +421,7 @@ A proper evaluation cannot be provided as there was insufficient interview conte
             try:
                 import json
                 evaluation_weights_dict = json.loads(eval_weights) if eval_weights else {}
-            except:
+            except ValueError:
                 pass
         
         # Parse custom questions
@@ -430,7 +430,7 @@ A proper evaluation cannot be provided as there was insufficient interview conte
             try:
                 import json
                 custom_questions_list = json.loads(custom_q) if custom_q else []
-            except:
+            except ValueError:
                 pass
         
         logger.info(f"🤖 LLM: Generating context-aware assessment for position: {job_title}")
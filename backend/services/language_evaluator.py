@@ -151,7 +151,7 @@ def _check_languages(cv_text: str, job_offer_description: str, required_language
     if required_languages:
         try:
             languages_to_check = json.loads(required_languages) if required_languages else []
-        except:
+        except ValueError:
             languages_to_check = [l.strip() for l in required_languages.split(",")]
     
     # If no languages specified, try to extract from job description
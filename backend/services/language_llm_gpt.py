@@ -194,7 +194,7 @@ def generate_opening_greeting(
         if req_langs:
             try:
                 required_languages = json.loads(req_langs)
-            except:
+            except ValueError:
                 required_languages = [req_langs]
     
     prompt = get_opening_greeting_prompt(
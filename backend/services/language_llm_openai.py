@@ -9,14 +9,15 @@ import re
 import logging
 import json
 from openai import OpenAI
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterator
 
 from backend.config import (
     OPENAI_API_KEY, LANGUAGE_LLM_TEMPERATURE,
     ASSESSMENT_TEMPERATURE, ASSESSMENT_MAX_TOKENS
 )
 from backend.services.language_prompts import (
-    build_language_evaluator_prompt,
+    build_language_evaluator_static_prompt,
+    build_language_evaluator_turn_prompt,
     build_language_assessment_prompt,
     get_audio_check_prompt,
     get_name_request_prompt,
@@ -49,47 +50,68 @@ def _chat(messages: list, model: str = None, temperature: float = LANGUAGE_LLM_T
     return response.choices[0].message.content.strip()
 
 
-def generate_response(
+def _chat_stream(messages: list, model: str = None, temperature: float = LANGUAGE_LLM_TEMPERATURE,
+                 max_tokens: int = 300) -> Iterator[str]:
+    """Send a streaming chat completion request to OpenAI, yielding text deltas."""
+    stream = client.chat.completions.create(
+        model=model or DEFAULT_LLM_MODEL,
+        messages=messages,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        stream=True,
+    )
+    for chunk in stream:
+        if chunk.choices and chunk.choices[0].delta.content:
+            yield chunk.choices[0].delta.content
+
+
+def _build_response_messages(
     conversation_history: List[Dict[str, str]],
     user_message: str,
-    model_id: Optional[str] = None,
     interview_context: Optional[Dict[str, str]] = None
-) -> str:
-    """Generate a language evaluation response using OpenAI LLM."""
-    model = model_id or DEFAULT_LLM_MODEL
-    logger.info(f"🌐 Language LLM (OpenAI): model '{model}'")
-
-    # Build system prompt
-    if interview_context:
-        system_prompt = build_language_evaluator_prompt(
-            job_title=interview_context.get("job_title"),
-            candidate_cv_text=interview_context.get("candidate_cv_text"),
-            required_languages=interview_context.get("required_languages"),
-            interview_start_language=interview_context.get("interview_start_language"),
-            confirmed_candidate_name=interview_context.get("confirmed_candidate_name"),
-            time_remaining_minutes=interview_context.get("time_remaining_minutes"),
-            total_interview_minutes=interview_context.get("total_interview_minutes"),
-            tested_languages=interview_context.get("tested_languages"),
-            current_language=interview_context.get("current_language"),
-            required_languages_list=interview_context.get("required_languages_list"),
-            questions_in_current_language=interview_context.get("questions_in_current_language")
-        )
-    else:
-        system_prompt = build_language_evaluator_prompt()
+) -> list:
+    """
+    Build the chat messages for an interviewer response.
+    
+    Ordered for prompt caching: the system prompt and conversation history are a
+    byte-identical prefix from one turn to the next, and everything that changes per
+    turn (time, language progress) goes in a trailing system message.
+    """
+    context = interview_context or {}
+    # Example questions are fixed per interview (same job + CV -> same selection)
+    seed = f"{context.get('job_title')}|{context.get('candidate_cv_text')}" if interview_context else None
+    system_prompt = build_language_evaluator_static_prompt(
+        job_title=context.get("job_title"),
+        required_languages=context.get("required_languages"),
+        interview_start_language=context.get("interview_start_language"),
+        confirmed_candidate_name=context.get("confirmed_candidate_name"),
+        seed=seed
+    )
+    turn_prompt = build_language_evaluator_turn_prompt(
+        interview_start_language=context.get("interview_start_language"),
+        time_remaining_minutes=context.get("time_remaining_minutes"),
+        total_interview_minutes=context.get("total_interview_minutes"),
+        tested_languages=context.get("tested_languages"),
+        current_language=context.get("current_language"),
+        required_languages_list=context.get("required_languages_list"),
+        questions_in_current_language=context.get("questions_in_current_language")
+    )
 
-    current_language = interview_context.get("current_language") if interview_context else None
-    interview_start_language = interview_context.get("interview_start_language") if interview_context else None
-    language_to_use = current_language or interview_start_language or "English"
+    language_to_use = context.get("current_language") or context.get("interview_start_language") or "English"
 
-    # Build messages
-    messages = [
-        {"role": "system", "content": system_prompt + f"\n\nRESPOND ENTIRELY IN {language_to_use.upper()}. ONE language per message. No mixing. No prefix."}
-    ]
+    # Build messages - static prefix first
+    messages = [{"role": "system", "content": system_prompt}]
     for msg in conversation_history:
         role = "assistant" if msg["role"] == "assistant" else "user"
         messages.append({"role": role, "content": msg["content"]})
     messages.append({"role": "user", "content": user_message})
 
+    # Per-turn state last
+    messages.append({
+        "role": "system",
+        "content": turn_prompt + f"\n\nRESPOND ENTIRELY IN {language_to_use.upper()}. ONE language per message. No mixing. No prefix."
+    })
+
     # Time awareness
     if interview_context:
         time_remaining = interview_context.get("time_remaining_minutes")
@@ -99,11 +121,39 @@ def generate_response(
             elif time_remaining <= 2:
                 messages.append({"role": "user", "content": f"[SYSTEM] {time_remaining:.1f} min left - wrap up in {language_to_use}."})
 
+    return messages
+
+
+def generate_response(
+    conversation_history: List[Dict[str, str]],
+    user_message: str,
+    model_id: Optional[str] = None,
+    interview_context: Optional[Dict[str, str]] = None
+) -> str:
+    """Generate a language evaluation response using OpenAI LLM."""
+    model = model_id or DEFAULT_LLM_MODEL
+    logger.info(f"🌐 Language LLM (OpenAI): model '{model}'")
+
+    messages = _build_response_messages(conversation_history, user_message, interview_context)
     cleaned = clean_response(_chat(messages, model))
     logger.info(f"🌐 Language LLM response: '{cleaned[:50]}...'")
     return cleaned
 
 
+def generate_response_stream(
+    conversation_history: List[Dict[str, str]],
+    user_message: str,
+    model_id: Optional[str] = None,
+    interview_context: Optional[Dict[str, str]] = None
+) -> Iterator[str]:
+    """Stream a language evaluation response as raw text deltas (caller cleans the full text)."""
+    model = model_id or DEFAULT_LLM_MODEL
+    logger.info(f"🌐 Language LLM (OpenAI, streaming): model '{model}'")
+
+    messages = _build_response_messages(conversation_history, user_message, interview_context)
+    yield from _chat_stream(messages, model)
+
+
 def generate_audio_check_message(model_id: Optional[str] = None, language: Optional[str] = None) -> str:
     """Generate the audio check message."""
     logger.info(f"🌐 Language LLM: Audio check in '{language or 'English'}'")
@@ -145,7 +195,7 @@ def generate_opening_greeting(
         if req_langs:
             try:
                 required_languages = json.loads(req_langs)
-            except:
+            except ValueError:
                 required_languages = [req_langs]
 
     prompt = get_opening_greeting_prompt(
@@ -168,7 +218,7 @@ def generate_assessment(
 ) -> str:
     """Generate a LANGUAGE-ONLY assessment with CEFR levels."""
     model = model_id or DEFAULT_LLM_MODEL
-    logger.info(f"🌐 Language LLM (OpenAI): Generating CEFR assessment")
+    logger.debug("Language LLM (OpenAI): generating CEFR assessment with %s", model)
 
     # Build transcript
     transcript_lines = []
@@ -198,6 +248,69 @@ def generate_assessment(
     return _chat(messages, model, temperature=ASSESSMENT_TEMPERATURE, max_tokens=ASSESSMENT_MAX_TOKENS)
 
 
+# Upper bound on the completion size of one batched assessment call
+BATCH_ASSESSMENT_MAX_TOKENS = 16384
+
+
+def generate_assessments_batch(
+    interviews: List[Dict],
+    model_id: Optional[str] = None,
+    interview_context: Optional[Dict[str, str]] = None
+) -> Dict[str, str]:
+    """
+    Generate LANGUAGE-ONLY assessments for several interviews of one job offer in a single call.
+
+    interviews: [{"interview_id", "conversation_history", "candidate_name", "tested_languages"}]
+    Returns {interview_id: assessment}; interviews missing from the answer are left out.
+    """
+    model = model_id or DEFAULT_LLM_MODEL
+    logger.info(f"🌐 Language LLM (OpenAI): Generating {len(interviews)} CEFR assessments in one batch")
+
+    batch = []
+    for interview in interviews:
+        transcript_lines = []
+        for msg in interview["conversation_history"]:
+            role = "Evaluator" if msg["role"] == "assistant" else "Candidate"
+            transcript_lines.append(f"{role}: {msg['content']}")
+        batch.append({
+            "interview_id": interview["interview_id"],
+            "candidate_name": interview.get("candidate_name"),
+            "tested_languages": interview.get("tested_languages") or [],
+            "transcript": "\n".join(transcript_lines)
+        })
+
+    from backend.services.language_prompts import build_language_batch_assessment_prompt
+    prompt = build_language_batch_assessment_prompt(
+        batch,
+        required_languages=interview_context.get("required_languages") if interview_context else None,
+        job_title=interview_context.get("job_title") if interview_context else None
+    )
+
+    response = client.chat.completions.create(
+        model=model,
+        messages=[
+            {"role": "system", "content": "You are an expert language proficiency assessor. Respond in JSON format only."},
+            {"role": "user", "content": prompt}
+        ],
+        temperature=ASSESSMENT_TEMPERATURE,
+        max_tokens=min(ASSESSMENT_MAX_TOKENS * len(interviews), BATCH_ASSESSMENT_MAX_TOKENS),
+        response_format={"type": "json_object"},
+    )
+    content = response.choices[0].message.content.strip()
+    try:
+        entries = json.loads(content).get("assessments", [])
+    except (json.JSONDecodeError, AttributeError):
+        logger.warning(f"Could not parse batch assessment JSON: {content[:200]}")
+        return {}
+
+    wanted = {interview["interview_id"] for interview in interviews}
+    return {
+        entry["interview_id"]: entry["assessment"].strip()
+        for entry in entries
+        if isinstance(entry, dict) and entry.get("interview_id") in wanted and entry.get("assessment")
+    }
+
+
 def _parse_annotation_json(content: str) -> Optional[dict]:
     """Parse annotation JSON robustly, handling truncated or malformed responses."""
     import re as _re
@@ -245,7 +358,7 @@ def generate_transcript_annotations(
 ) -> Dict[str, str]:
     """Generate language feedback for each candidate message."""
     model = model_id or DEFAULT_LLM_MODEL
-    logger.info(f"🌐 Language LLM (OpenAI): Generating annotations (feedback in {feedback_language or 'English'})")
+    logger.debug("Language LLM (OpenAI): generating annotations (feedback in %s)", feedback_language or "English")
 
     transcript_lines = []
     for i, msg in enumerate(conversation_history):
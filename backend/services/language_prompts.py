@@ -121,9 +121,15 @@ Your role is to:
 """
 
 
-def _get_randomized_system_prompt() -> str:
-    """Build the system prompt with a randomly selected subset of example questions."""
-    selected = random.sample(LANGUAGE_QUESTION_POOL, min(QUESTIONS_PER_PROMPT, len(LANGUAGE_QUESTION_POOL)))
+def _get_randomized_system_prompt(seed: Optional[str] = None) -> str:
+    """
+    Build the system prompt with a randomly selected subset of example questions.
+    
+    With a seed the selection is stable, so every turn of one interview gets a
+    byte-identical prompt (and hits the provider's prompt cache).
+    """
+    rng = random.Random(seed) if seed is not None else random
+    selected = rng.sample(LANGUAGE_QUESTION_POOL, min(QUESTIONS_PER_PROMPT, len(LANGUAGE_QUESTION_POOL)))
     examples_block = "\n".join(f'   - "{q}"' for q in selected)
     return LANGUAGE_EVALUATOR_SYSTEM_PROMPT.format(question_examples=examples_block)
 
@@ -167,7 +173,38 @@ def build_language_evaluator_prompt(
     Returns:
         Complete system prompt with language evaluation context
     """
-    prompt_parts = [_get_randomized_system_prompt()]
+    static_prompt = build_language_evaluator_static_prompt(
+        job_title=job_title,
+        required_languages=required_languages,
+        interview_start_language=interview_start_language,
+        confirmed_candidate_name=confirmed_candidate_name
+    )
+    turn_prompt = build_language_evaluator_turn_prompt(
+        interview_start_language=interview_start_language,
+        time_remaining_minutes=time_remaining_minutes,
+        total_interview_minutes=total_interview_minutes,
+        tested_languages=tested_languages,
+        current_language=current_language,
+        required_languages_list=required_languages_list,
+        questions_in_current_language=questions_in_current_language
+    )
+    return static_prompt + "\n" + turn_prompt
+
+
+def build_language_evaluator_static_prompt(
+    job_title: str = None,
+    required_languages: str = None,
+    interview_start_language: str = None,
+    confirmed_candidate_name: str = None,
+    seed: Optional[str] = None
+) -> str:
+    """
+    Build the part of the evaluator prompt that stays the same for every turn of an interview.
+    
+    Keep this free of per-turn state (time, language progress) so it can be sent as an
+    unchanging message prefix; pass a per-interview seed to fix the example questions.
+    """
+    prompt_parts = [_get_randomized_system_prompt(seed)]
     
     # Add job context (for reference only, not evaluation)
     if job_title:
@@ -186,7 +223,7 @@ def build_language_evaluator_prompt(
                 prompt_parts.append(f"Start in: {interview_start_language or languages[0]}")
                 prompt_parts.append(f"You MUST test ALL these languages during the interview.")
                 prompt_parts.append(f"Remember: Use only ONE language per message. When testing French, speak entirely in French.")
-        except:
+        except (ValueError, TypeError):
             if required_languages:
                 prompt_parts.append(f"\n\n=== LANGUAGES TO EVALUATE ===")
                 prompt_parts.append(f"Required Languages: {required_languages}")
@@ -196,6 +233,21 @@ def build_language_evaluator_prompt(
         prompt_parts.append(f"\n\n=== CANDIDATE NAME ===")
         prompt_parts.append(f"Candidate: {confirmed_candidate_name}")
     
+    return "\n".join(prompt_parts)
+
+
+def build_language_evaluator_turn_prompt(
+    interview_start_language: str = None,
+    time_remaining_minutes: float = None,
+    total_interview_minutes: float = None,
+    tested_languages: list = None,
+    current_language: str = None,
+    required_languages_list: list = None,
+    questions_in_current_language: int = None
+) -> str:
+    """Build the per-turn part of the evaluator prompt (time management and language progress)."""
+    prompt_parts = []
+    
     # Add time management
     total_time = total_interview_minutes if total_interview_minutes is not None else 20
     remaining = time_remaining_minutes if time_remaining_minutes is not None else total_time
@@ -359,6 +411,10 @@ Extract and quote specific things the candidate said. For errors, show the corre
 Highlight the candidate's main grammatical strengths and weaknesses.
 Include whether the candidate meets the language requirements for the position.
 Do NOT include hiring recommendations - only language assessment.]
+
+**Language Requirements Met:** [YES/NO/PARTIAL]
+
+The report MUST end with that exact "**Language Requirements Met:**" line, filled in with YES, NO or PARTIAL.
 """
 
 
@@ -396,7 +452,7 @@ def build_language_assessment_prompt(
         try:
             languages = json.loads(required_languages) if required_languages else []
             prompt_parts.append(f"\nREQUIRED LANGUAGES: {', '.join(languages)}")
-        except:
+        except (ValueError, TypeError):
             prompt_parts.append(f"\nREQUIRED LANGUAGES: {required_languages}")
     
     if tested_languages:
@@ -409,7 +465,7 @@ def build_language_assessment_prompt(
                 untested = [l for l in all_langs if l not in tested_languages]
                 if untested:
                     prompt_parts.append(f"LANGUAGES NOT TESTED: {', '.join(untested)}")
-            except:
+            except (ValueError, TypeError):
                 pass
     
     # Add transcript
@@ -424,6 +480,62 @@ def build_language_assessment_prompt(
     return "\n".join(prompt_parts)
 
 
+def build_language_batch_assessment_prompt(
+    interviews: List[Dict],
+    required_languages: str = None,
+    job_title: str = None
+) -> str:
+    """
+    Build one assessment prompt covering several interviews for the same job offer.
+
+    The assessment instructions are sent once and each interview is assessed
+    independently, so K interviews cost one prompt preamble instead of K.
+
+    Args:
+        interviews: [{"interview_id", "candidate_name", "tested_languages", "transcript"}]
+        required_languages: JSON string of required languages (shared by the job offer)
+        job_title: Job title (for context only)
+
+    Returns:
+        Complete batch assessment prompt (answer is a JSON object)
+    """
+    prompt_parts = [LANGUAGE_ASSESSMENT_PROMPT]
+
+    if job_title:
+        prompt_parts.append(f"\n\nPOSITION: {job_title} (for context only - do NOT evaluate job fit)")
+
+    if required_languages:
+        try:
+            languages = json.loads(required_languages) if required_languages else []
+            prompt_parts.append(f"\nREQUIRED LANGUAGES: {', '.join(languages)}")
+        except (ValueError, TypeError):
+            prompt_parts.append(f"\nREQUIRED LANGUAGES: {required_languages}")
+
+    prompt_parts.append(
+        f"\n\nThe following {len(interviews)} interviews are SEPARATE candidates. "
+        "Assess each one ONLY from its own transcript, exactly as if it were the only interview."
+    )
+
+    for interview in interviews:
+        prompt_parts.append(f"\n\n{'='*60}")
+        prompt_parts.append(f"INTERVIEW ID: {interview['interview_id']}")
+        if interview.get("candidate_name"):
+            prompt_parts.append(f"CANDIDATE: {interview['candidate_name']}")
+        if interview.get("tested_languages"):
+            prompt_parts.append(f"LANGUAGES TESTED: {', '.join(interview['tested_languages'])}")
+        prompt_parts.append("INTERVIEW TRANSCRIPT")
+        prompt_parts.append(f"{'='*60}")
+        prompt_parts.append(interview["transcript"])
+        prompt_parts.append(f"{'='*60}")
+
+    prompt_parts.append(
+        '\n\nRespond with a JSON object only: {"assessments": [{"interview_id": "...", "assessment": "..."}]} '
+        "with one entry per interview, where each assessment is the full assessment text in the format above."
+    )
+
+    return "\n".join(prompt_parts)
+
+
 # =============================================================================
 # AUDIO CHECK PROMPT
 # =============================================================================
@@ -0,0 +1,82 @@
+"""Append-only JSONL session logs for asynchronous interviews.
+
+Each interview gets one file with one JSON object per line. Turns only ever
+append a line, so a turn costs the same at question 10 as at question 1
+(no load-modify-rewrite of a growing JSON column).
+
+Line types:
+  {"type": "question"|"answer", "question_number": int, "audio_key": str, "format": str, "text": str, "timestamp": iso}
+  {"type": "question_audio", "question_number": int, "audio_key": str}  — question audio stored after streaming
+  {"type": "message", "role": "assistant"|"user", "content": str}  — conversation turn (the LLM history)
+
+Events may carry datetime values directly; orjson writes them as ISO 8601 strings.
+"""
+import os
+import logging
+import threading
+from typing import List
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# Appends come from request handlers and TTS worker threads
+_write_lock = threading.Lock()
+
+
+def start_log(path: str, events: List[dict]):
+    """Create (or reset) a session log with its initial events."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with _write_lock, open(path, "wb") as f:
+        f.write(b"".join(orjson.dumps(event) + b"\n" for event in events))
+
+
+def append_events(path: str, events: List[dict]):
+    """Append events to a session log."""
+    with _write_lock, open(path, "ab") as f:
+        f.write(b"".join(orjson.dumps(event) + b"\n" for event in events))
+
+
+def read_audio_segments(path: str) -> List[dict]:
+    """Rebuild the audio segment list from a session log (question_audio lines fold into their question)."""
+    segments = []
+    question_audio = {}
+    if not os.path.exists(path):
+        return segments
+    with open(path, "rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                event = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                logger.warning(f"Skipping corrupt session log line in {path}")
+                continue
+            event_type = event.get("type")
+            if event_type == "question_audio":
+                question_audio[event.get("question_number")] = event.get("audio_key")
+            elif event_type != "message":
+                segments.append(event)
+    for segment in segments:
+        if segment.get("type") == "question" and segment.get("question_number") in question_audio:
+            segment["audio_key"] = question_audio[segment["question_number"]]
+    return segments
+
+
+def read_conversation(path: str) -> List[dict]:
+    """Rebuild the conversation history ({"role", "content"} messages) from a session log's message lines."""
+    messages = []
+    if not os.path.exists(path):
+        return messages
+    with open(path, "rb") as f:
+        for line in f:
+            if b'"message"' not in line:
+                continue
+            try:
+                event = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                logger.warning(f"Skipping corrupt session log line in {path}")
+                continue
+            if event.get("type") == "message":
+                messages.append({"role": event.get("role"), "content": event.get("content")})
+    return messages
@@ -35,7 +35,6 @@ function AsynchronousInterviewInterface({ interview, onClose }) {
   const fullInterviewRecorderRef = useRef(null)
   const fullInterviewChunksRef = useRef([])
   const fullInterviewStreamRef = useRef(null)
-  const aiAudioChunksRef = useRef([])
 
   // ── Cleanup ────────────────────────────────────────────────────
   useEffect(() => {
@@ -82,8 +81,6 @@ function AsynchronousInterviewInterface({ interview, onClose }) {
 
       setIsAiSpeaking(true)
 
-      aiAudioChunksRef.current.push({ audio: audioBase64, format, timestamp: Date.now() })
-
       const audioData = atob(audioBase64)
       const audioBytes = new Uint8Array(audioData.length)
       for (let i = 0; i < audioData.length; i++) audioBytes[i] = audioData.charCodeAt(i)
@@ -105,16 +102,39 @@ function AsynchronousInterviewInterface({ interview, onClose }) {
     }
   }, [])
 
-  // ── Play question (audio or browser fallback) ──────────────────
-  const playQuestion = useCallback(async (questionText, questionAudio, audioFormat) => {
+  // ── Streamed audio playback (starts on the first chunk) ────────
+  const playAudioUrl = useCallback(async (audioUrl, questionNumber, format = 'mp3') => {
+    if (currentAudioRef.current) { currentAudioRef.current.pause(); currentAudioRef.current = null }
+    if (playbackAudioRef.current) { playbackAudioRef.current.pause(); playbackAudioRef.current = null; setIsPlayingRecording(false) }
+
+    setIsAiSpeaking(true)
+    currentAudioRef.current = new Audio(audioUrl)
+
+    await new Promise((resolve, reject) => {
+      if (!currentAudioRef.current) { setIsAiSpeaking(false); reject(new Error('Audio cleared')); return }
+      currentAudioRef.current.onended = () => { currentAudioRef.current = null; setIsAiSpeaking(false); resolve() }
+      currentAudioRef.current.onerror = (err) => { currentAudioRef.current = null; setIsAiSpeaking(false); reject(err) }
+      currentAudioRef.current.play().catch((err) => { setIsAiSpeaking(false); reject(err) })
+    })
+  }, [])
+
+  // ── Play question (streamed audio, inline audio or browser fallback) ──
+  const playQuestion = useCallback(async (question) => {
     setPhase('listening')
-    if (questionAudio) {
-      await playAudio(questionAudio, audioFormat)
+    if (question.audioUrl) {
+      try {
+        await playAudioUrl(question.audioUrl, question.number, question.format)
+      } catch (err) {
+        console.error('Error streaming question audio, using browser speech:', err)
+        await speakWithBrowser(question.text)
+      }
+    } else if (question.audio) {
+      await playAudio(question.audio, question.format)
     } else {
-      await speakWithBrowser(questionText)
+      await speakWithBrowser(question.text)
     }
     setPhase('recording')
-  }, [playAudio, speakWithBrowser])
+  }, [playAudio, playAudioUrl, speakWithBrowser])
 
   // ── Video recording ────────────────────────────────────────────
   const startFullInterviewRecording = async () => {
@@ -152,13 +172,12 @@ function AsynchronousInterviewInterface({ interview, onClose }) {
                 } catch (err) { console.error('Error uploading video:', err) }
               }
             }
-            if (aiAudioChunksRef.current.length > 0) {
-              try {
-                await axios.post(`${API_BASE_URL}/candidates/interviews/${interview.interview_id}/async/save-recording`, {
-                  interview_id: interview.interview_id, email: interview.email || '', user_audio: '', ai_audio_chunks: aiAudioChunksRef.current
-                })
-              } catch (err) { console.error('Error saving AI audio chunks:', err) }
-            }
+            // The server rebuilds the AI audio from the question audio it already stored
+            try {
+              await axios.post(`${API_BASE_URL}/candidates/interviews/${interview.interview_id}/async/save-recording`, {
+                interview_id: interview.interview_id, email: interview.email || '', user_audio: ''
+              })
+            } catch (err) { console.error('Error saving interview recording:', err) }
           } catch (err) { console.error('Error processing recording:', err) }
           if (fullInterviewStreamRef.current) { fullInterviewStreamRef.current.getTracks().forEach(t => t.stop()); fullInterviewStreamRef.current = null }
           if (videoPreviewRef.current) videoPreviewRef.current.srcObject = null
@@ -183,14 +202,15 @@ function AsynchronousInterviewInterface({ interview, onClose }) {
         interview_id: interview.interview_id, email: interview.email || ''
       })
 
-      const { question_text, question_audio, audio_format, question_number } = response.data
+      const { question_text, question_audio, question_audio_url, audio_format, question_number } = response.data
 
-      setCurrentQuestion({ text: question_text, audio: question_audio, format: audio_format, number: question_number })
+      const question = { text: question_text, audio: question_audio, audioUrl: question_audio_url, format: audio_format, number: question_number }
+      setCurrentQuestion(question)
       setQuestionNumber(question_number)
       addMessage('interviewer', question_text)
       setIsLoading(false)
 
-      await playQuestion(question_text, question_audio, audio_format)
+      await playQuestion(question)
     } catch (err) {
       console.error('Error starting interview:', err)
       const detail = err.response?.data?.detail || ''
@@ -282,16 +302,12 @@ function AsynchronousInterviewInterface({ interview, onClose }) {
       if (playbackAudioRef.current) { playbackAudioRef.current.pause(); playbackAudioRef.current = null; setIsPlayingRecording(false) }
       if (currentAudioRef.current) { currentAudioRef.current.pause(); currentAudioRef.current = null; setIsAiSpeaking(false) }
 
-      const reader = new FileReader()
-      const audioBase64 = await new Promise((resolve, reject) => {
-        reader.onload = () => resolve(reader.result.split(',')[1])
-        reader.onerror = reject
-        reader.readAsDataURL(recordedAudio)
-      })
+      const formData = new FormData()
+      formData.append('audio', recordedAudio, 'answer.webm')
+      formData.append('email', interview.email || '')
+      formData.append('question_number', questionNumber)
 
-      const response = await axios.post(`${API_BASE_URL}/candidates/interviews/${interview.interview_id}/async/submit-answer`, {
-        interview_id: interview.interview_id, email: interview.email || '', audio: audioBase64, question_number: questionNumber
-      })
+      const response = await axios.post(`${API_BASE_URL}/candidates/interviews/${interview.interview_id}/async/submit-answer`, formData, { headers: { 'Content-Type': 'multipart/form-data' } })
 
       // Add user's transcribed answer to conversation (shown as "Your answer")
       if (response.data.user_text) {
@@ -305,9 +321,10 @@ function AsynchronousInterviewInterface({ interview, onClose }) {
         setPhase('completed')
         setCurrentQuestion(null)
       } else {
-        const { question_text, question_audio, audio_format, question_number } = response.data
+        const { question_text, question_audio, question_audio_url, audio_format, question_number } = response.data
 
-        setCurrentQuestion({ text: question_text, audio: question_audio, format: audio_format, number: question_number })
+        const question = { text: question_text, audio: question_audio, audioUrl: question_audio_url, format: audio_format, number: question_number }
+        setCurrentQuestion(question)
         setQuestionNumber(question_number)
         setRetryCount(0)
         setRecordedAudio(null)
@@ -317,7 +334,7 @@ function AsynchronousInterviewInterface({ interview, onClose }) {
         setIsPlayingRecording(false)
 
         addMessage('interviewer', question_text)
-        await playQuestion(question_text, question_audio, audio_format)
+        await playQuestion(question)
       }
     } catch (err) {
       console.error('Error submitting answer:', err)
@@ -353,7 +370,13 @@ function AsynchronousInterviewInterface({ interview, onClose }) {
   // ── Replay question ────────────────────────────────────────────
   const replayQuestion = async () => {
     if (!currentQuestion) return
-    if (currentQuestion.audio) {
+    if (currentQuestion.audioUrl) {
+      try {
+        await playAudioUrl(currentQuestion.audioUrl, currentQuestion.number, currentQuestion.format)
+      } catch (err) {
+        await speakWithBrowser(currentQuestion.text)
+      }
+    } else if (currentQuestion.audio) {
       await playAudio(currentQuestion.audio, currentQuestion.format)
     } else {
       await speakWithBrowser(currentQuestion.text)
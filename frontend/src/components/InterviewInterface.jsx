@@ -14,6 +14,15 @@ const getWebSocketURL = () => {
 const WS_URL = getWebSocketURL()
 const API_BASE_URL = '/api'
 
+// Audio arrives either as a binary WebSocket frame (ArrayBuffer) or base64 text
+const toArrayBuffer = (audio) => {
+  if (audio instanceof ArrayBuffer) return audio
+  const binary = atob(audio)
+  const bytes = new Uint8Array(binary.length)
+  for (let i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i)
+  return bytes.buffer
+}
+
 // ================================================================
 // PCM Player — streams 24kHz PCM audio from Gemini Live API
 // ================================================================
@@ -39,13 +48,10 @@ class PCMPlayer {
     }
   }
 
-  feed(pcmBase64) {
+  feed(pcm) {
     if (!this.ctx || !this.gainNode) this.init()
 
-    const binary = atob(pcmBase64)
-    const bytes = new Uint8Array(binary.length)
-    for (let i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i)
-    const int16 = new Int16Array(bytes.buffer)
+    const int16 = new Int16Array(toArrayBuffer(pcm))
     const float32 = new Float32Array(int16.length)
     for (let i = 0; i < int16.length; i++) float32[i] = int16[i] / 32768.0
 
@@ -143,6 +149,7 @@ function InterviewInterface({ interview, onClose }) {
   const [providersConfig, setProvidersConfig] = useState(null)
 
   const wsRef = useRef(null)
+  const pendingAudioMessageRef = useRef(null)  // Message whose audio follows as the next binary frame
   const audioContextRef = useRef(null)
   const analyserRef = useRef(null)
   const mediaStreamRef = useRef(null)
@@ -520,9 +527,22 @@ function InterviewInterface({ interview, onClose }) {
         ws.send(JSON.stringify(startMessage))
       }
 
+      ws.binaryType = 'arraybuffer'
       ws.onmessage = async (event) => {
+        if (event.data instanceof ArrayBuffer) {
+          // Binary frames carry audio: either the payload announced by the previous message
+          // (audio_len) or a live PCM chunk
+          const pending = pendingAudioMessageRef.current
+          pendingAudioMessageRef.current = null
+          await handleWebSocketMessage(pending ? { ...pending, audio: event.data } : { type: 'live_audio', audio: event.data })
+          return
+        }
         const data = JSON.parse(event.data)
         console.log('📥 Received message:', data.type)
+        if (data.audio_len && !data.audio) {
+          pendingAudioMessageRef.current = data
+          return
+        }
         await handleWebSocketMessage(data)
       }
 
@@ -707,6 +727,7 @@ function InterviewInterface({ interview, onClose }) {
 
       case 'assessment':
         console.log('📊 Assessment received')
+        sendAudioDoneWhenIdle()
         setAssessment(data.assessment)
         updateStatus('Interview completed - Saving recording...', 'connected')
         setIsEndingInterview(false)
@@ -807,8 +828,9 @@ function InterviewInterface({ interview, onClose }) {
         // AI called the end_interview function — interview is concluding
         console.log('🏁 AI ended the interview:', data.reason)
         updateStatus('Interview ending...', 'connecting')
-        // Wait a moment for the farewell audio to finish playing, then the backend
-        // will send the assessment message which triggers cleanup
+        // The backend waits for the farewell audio to finish playing, then
+        // sends the assessment message which triggers cleanup
+        sendAudioDoneWhenIdle()
         break
 
       case 'error':
@@ -837,7 +859,7 @@ function InterviewInterface({ interview, onClose }) {
   }
 
   // Internal function to play a single audio item
-  const playAudioInternal = async (audioBase64, format = 'mp3') => {
+  const playAudioInternal = async (audio, format = 'mp3') => {
     return new Promise((resolve) => {
       try {
         // Stop any currently playing audio first
@@ -848,12 +870,7 @@ function InterviewInterface({ interview, onClose }) {
 
         console.log('🔊 Playing audio, format:', format)
 
-        const audioData = atob(audioBase64)
-        const arrayBuffer = new ArrayBuffer(audioData.length)
-        const view = new Uint8Array(arrayBuffer)
-        for (let i = 0; i < audioData.length; i++) {
-          view[i] = audioData.charCodeAt(i)
-        }
+        const arrayBuffer = toArrayBuffer(audio)
 
         const mimeType = format === 'wav' ? 'audio/wav' : 'audio/mpeg'
         const blob = new Blob([arrayBuffer], { type: mimeType })
@@ -937,7 +954,7 @@ function InterviewInterface({ interview, onClose }) {
   }
 
   // Queue-based audio playback to prevent overlapping
-  const playAudio = async (audioBase64, format = 'mp3') => {
+  const playAudio = async (audio, format = 'mp3') => {
     // Clear the queue if we're adding new audio - we only want the latest response
     // This prevents multiple responses from stacking up
     if (audioQueueRef.current.length > 0) {
@@ -946,13 +963,24 @@ function InterviewInterface({ interview, onClose }) {
     }
 
     // Add to queue
-    audioQueueRef.current.push({ audio: audioBase64, format })
+    audioQueueRef.current.push({ audio, format })
     console.log(`📥 Added audio to queue (queue size: ${audioQueueRef.current.length})`)
 
     // Process queue
     await processAudioQueue()
   }
 
+  // Tell the server once the last audio has finished playing, so it can close the connection without a fixed wait
+  const sendAudioDoneWhenIdle = () => {
+    const ws = wsRef.current
+    if (!ws || ws.readyState !== WebSocket.OPEN) return
+    if (isAudioPlayingRef.current || pcmPlayerRef.current?.isPlaying()) {
+      setTimeout(sendAudioDoneWhenIdle, 200)
+      return
+    }
+    ws.send(JSON.stringify({ type: 'audio_done' }))
+  }
+
   const stopCurrentAudio = () => {
     if (currentAudioRef.current) {
       currentAudioRef.current.pause()
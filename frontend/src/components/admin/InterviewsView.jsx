@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react'
+import React, { useState, useEffect, useRef } from 'react'
 import { HiArrowPath, HiEye, HiXMark, HiChatBubbleLeftRight, HiDocumentText, HiUser, HiCpuChip, HiSpeakerWave, HiArchiveBox, HiArchiveBoxXMark, HiSparkles, HiTrash } from 'react-icons/hi2'
 import { useAuth } from '../../contexts/AuthContext'
 import './InterviewsView.css'
@@ -19,6 +19,9 @@ function InterviewsView({ viewMode = 'card' }) {
   const [selectedInterview, setSelectedInterview] = useState(null)
   const [activeTab, setActiveTab] = useState('assessment')
   const [recordingAudioUrl, setRecordingAudioUrl] = useState(null)
+  const [segmentAudioUrls, setSegmentAudioUrls] = useState({}) // {audio_key: blobUrl}, loaded when played
+  const segmentAudioUrlsRef = useRef({})
+  const openInterviewIdRef = useRef(null)
   const [loadingRecording, setLoadingRecording] = useState(false)
 
   // Helper function to calculate date ranges for quick filters
@@ -139,10 +142,30 @@ function InterviewsView({ viewMode = 'card' }) {
     }
   }
 
+  const releaseSegmentAudio = () => {
+    Object.values(segmentAudioUrlsRef.current).forEach(url => URL.revokeObjectURL(url))
+    segmentAudioUrlsRef.current = {}
+    setSegmentAudioUrls({})
+  }
+
+  const closeDetails = () => {
+    openInterviewIdRef.current = null
+    releaseSegmentAudio()
+    setSelectedInterview(null)
+  }
+
+  // Revoke any segment audio still held when the view unmounts
+  useEffect(() => releaseSegmentAudio, [])
+
   const handleViewDetails = async (interviewId) => {
     try {
-      const response = await authApi.get(`/admin/interviews/${interviewId}`)
-      setSelectedInterview(response.data)
+      const [response, segmentsResponse] = await Promise.all([
+        authApi.get(`/admin/interviews/${interviewId}`),
+        authApi.get(`/admin/interviews/${interviewId}/segments`)
+      ])
+      releaseSegmentAudio()
+      openInterviewIdRef.current = interviewId
+      setSelectedInterview({ ...response.data, audio_segments: segmentsResponse.data })
       setActiveTab('assessment') // Reset to assessment tab when opening new interview
       setRecordingAudioUrl(null) // Reset recording URL
     } catch (error) {
@@ -151,6 +174,28 @@ function InterviewsView({ viewMode = 'card' }) {
     }
   }
 
+  // Segment audio lives in storage - fetched (authenticated) only when its segment is played
+  const loadSegmentAudio = async (audioKey) => {
+    const interviewId = selectedInterview?.interview_id
+    if (!interviewId || segmentAudioUrlsRef.current[audioKey]) return
+    try {
+      const response = await authApi.get(
+        `/admin/interviews/${interviewId}/turn-audio/${audioKey}`,
+        { responseType: 'blob' }
+      )
+      const url = URL.createObjectURL(response.data)
+      if (openInterviewIdRef.current !== interviewId) {
+        // The modal was closed (or switched) while loading
+        URL.revokeObjectURL(url)
+        return
+      }
+      segmentAudioUrlsRef.current = { ...segmentAudioUrlsRef.current, [audioKey]: url }
+      setSegmentAudioUrls(segmentAudioUrlsRef.current)
+    } catch (error) {
+      console.error('Error loading segment audio:', error)
+    }
+  }
+
   const loadRecording = async () => {
     if (!selectedInterview) return
 
@@ -230,6 +275,7 @@ function InterviewsView({ viewMode = 'card' }) {
 
   const parseConversationHistory = (conversationJson) => {
     if (!conversationJson) return []
+    if (Array.isArray(conversationJson)) return conversationJson
     try {
       const parsed = JSON.parse(conversationJson)
       return Array.isArray(parsed) ? parsed : []
@@ -638,11 +684,11 @@ function InterviewsView({ viewMode = 'card' }) {
       </div>
 
       {selectedInterview && (
-        <div className="modal-overlay" onClick={() => setSelectedInterview(null)}>
+        <div className="modal-overlay" onClick={closeDetails}>
           <div className="modal-content large" onClick={(e) => e.stopPropagation()}>
             <div className="modal-header">
               <h2>Interview Results</h2>
-              <button className="close-btn" onClick={() => setSelectedInterview(null)}>
+              <button className="close-btn" onClick={closeDetails}>
                 <HiXMark />
               </button>
             </div>
@@ -799,20 +845,10 @@ function InterviewsView({ viewMode = 'card' }) {
                         <h3 style={{ marginBottom: '1rem' }}>Interview Audio Messages</h3>
                         {selectedInterview.audio_segments.map((segment, index) => {
                           const isQuestion = segment.type === 'question'
-                          const audioUrl = segment.audioUrl || (() => {
-                            try {
-                              const audioData = atob(segment.audio)
-                              const audioBytes = new Uint8Array(audioData.length)
-                              for (let i = 0; i < audioData.length; i++) {
-                                audioBytes[i] = audioData.charCodeAt(i)
-                              }
-                              const blob = new Blob([audioBytes], { type: `audio/${segment.format || 'mp3'}` })
-                              return URL.createObjectURL(blob)
-                            } catch (e) {
-                              console.error('Error creating audio URL:', e)
-                              return null
-                            }
-                          })()
+                          // Stored segments load on play; legacy inline base64 plays from a data URL
+                          const audioUrl = segment.audio_key
+                            ? segmentAudioUrls[segment.audio_key]
+                            : segment.audio ? `data:audio/${segment.format || 'mp3'};base64,${segment.audio}` : null
 
                           return (
                             <div
@@ -849,9 +885,10 @@ function InterviewsView({ viewMode = 'card' }) {
                                     {segment.text}
                                   </div>
                                 )}
-                                {audioUrl && (
+                                {audioUrl ? (
                                   <audio
                                     controls
+                                    autoPlay={!!segment.audio_key}
                                     src={audioUrl}
                                     style={{
                                       width: '100%',
@@ -862,6 +899,24 @@ function InterviewsView({ viewMode = 'card' }) {
                                   >
                                     Your browser does not support the audio element.
                                   </audio>
+                                ) : segment.audio_key && (
+                                  <button
+                                    type="button"
+                                    onClick={() => loadSegmentAudio(segment.audio_key)}
+                                    style={{
+                                      display: 'inline-flex',
+                                      alignItems: 'center',
+                                      gap: '0.35rem',
+                                      marginTop: '0.5rem',
+                                      padding: '0.25rem 0.75rem',
+                                      borderRadius: '12px',
+                                      border: 'none',
+                                      cursor: 'pointer',
+                                      fontSize: '0.85em'
+                                    }}
+                                  >
+                                    <HiSpeakerWave /> Play
+                                  </button>
                                 )}
                                 {segment.timestamp && (
                                   <div style={{
@@ -893,7 +948,7 @@ function InterviewsView({ viewMode = 'card' }) {
             </div>
 
             <div className="modal-actions">
-              <button className="btn-close" onClick={() => setSelectedInterview(null)}>Close</button>
+              <button className="btn-close" onClick={closeDetails}>Close</button>
             </div>
           </div>
         </div>
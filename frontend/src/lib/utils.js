@@ -54,6 +54,8 @@ export function truncate(str, length = 100) {
 
 export function parseJSON(str, fallback = null) {
   if (!str) return fallback
+  // JSON columns (e.g. conversation_history) arrive already parsed
+  if (typeof str !== 'string') return str
   try {
     const parsed = JSON.parse(str)
     return parsed